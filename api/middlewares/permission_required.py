@@ -11,10 +11,9 @@ from .base_validator import ValidationError
 
 # Utilities
 from ..utilities.constants import PERMISSION_TYPES
-from ..utilities.helpers.permissions import check_user_permissions
+from ..utilities.helpers.identity import get_current_identity, get_identity
 # Messages
 from ..utilities.messages.error_messages import authorization_errors
-from ..utilities.helpers.check_user_role import is_super_user
 
 
 class Resources:
@@ -54,11 +53,10 @@ def permission_required(resource_name):
     def decorator(func):
         @wraps(func)
         def decorated_function(*args, **kwargs):
-            token_id = request.decoded_token.get('UserInfo').get('id')
+            identity = get_identity()
             action = PERMISSION_TYPES.get(request.method)
-            has_permission = check_user_permissions(token_id, resource_name,
-                                                    action)
-            if is_super_user(token_id) or has_permission:
+            if identity.is_super_user or identity.has_permission(
+                    resource_name, action):
                 return func(*args, **kwargs)
             raise ValidationError({
                 'message':
@@ -82,15 +80,9 @@ def is_center_centric(func):
     @wraps(func)
     def decorated_function(*args):
         if hasattr(args[0], 'center_id'):
-            from api.models import User
-            if request and request.decoded_token:
-                token_id = request.decoded_token['UserInfo']['id']
-                if is_super_user(token_id):
-                    return args[1]  # returns query object
-                user = User.get_or_404(token_id)
-                center_id = user.center_id
-                return func(*args, center_id)
-            return args[1]
-        return args[1]
+            identity = get_current_identity()
+            if identity and not identity.is_super_user:
+                return func(*args, identity.center_id)
+        return args[1]  # returns query object
 
     return decorated_function
@@ -1,8 +1,13 @@
 """Module for token validation"""
 
 # Standard library
-from functools import wraps
+import copy
+import time
+from collections import OrderedDict
+from functools import wraps, lru_cache
 from base64 import b64decode
+from hashlib import sha256
+from threading import Lock
 
 # Third party
 from flask import request
@@ -11,7 +16,8 @@ from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import serialization
 
 # Utilities
-from api.utilities.constants import CHARSET
+from api.utilities.constants import (TOKEN_AUDIENCE, TOKEN_ISSUER,
+                                     VERIFIED_TOKEN_CACHE_SIZE)
 from api.utilities.messages.error_messages import jwt_errors
 
 # app config
@@ -41,6 +47,125 @@ def get_token(http_request=request):
     return token
 
 
+@lru_cache(maxsize=None)
+def get_public_key(flask_env, public_key_64):
+    """Parses the JWT public key once and reuses it on every request
+
+    Args:
+        flask_env (str): The environment the app runs in
+        public_key_64 (str): The configured public key
+
+    Returns:
+        RSAPublicKey: The public key used to verify tokens
+    """
+    decode_public_key_64 = lambda key_64: serialization.load_pem_public_key(
+        b64decode(key_64), backend=default_backend())
+    decode_public_key_64_test = lambda key_64: serialization.load_pem_public_key(
+        key_64.encode(), backend=default_backend())
+    public_key_mapper = {
+        'testing': decode_public_key_64_test,
+        'production': decode_public_key_64
+    }
+    return public_key_mapper.get(flask_env,
+                                 decode_public_key_64)(public_key_64)
+
+
+class VerifiedTokenCache(object):
+    """A bounded LRU of verified tokens and their claims.
+
+    Tokens are keyed by their hash and only tokens with an `exp` claim are
+    kept, so a cached token is never trusted past its expiry.
+    """
+
+    def __init__(self, max_size=VERIFIED_TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        self.tokens = OrderedDict()
+        self.lock = Lock()
+
+    @staticmethod
+    def hash_token(token):
+        """Hashes the token so raw tokens are not held in memory"""
+        return sha256(token.encode()).hexdigest()
+
+    def get(self, token):
+        """Gets the claims of a token verified earlier
+
+        Args:
+            token (str): The token string
+
+        Returns:
+            dict: A copy of the claims or None if the token is not cached
+                or has expired
+        """
+        key = self.hash_token(token)
+        with self.lock:
+            claims = self.tokens.get(key)
+            if claims is None:
+                return None
+            if claims['exp'] <= time.time():
+                del self.tokens[key]
+                return None
+            self.tokens.move_to_end(key)
+        return copy.deepcopy(claims)
+
+    def set(self, token, claims):
+        """Caches the claims of a verified token
+
+        Args:
+            token (str): The token string
+            claims (dict): The verified claims of the token
+        """
+        if not isinstance(claims.get('exp'), (int, float)):
+            return
+        key = self.hash_token(token)
+        with self.lock:
+            self.tokens[key] = copy.deepcopy(claims)
+            self.tokens.move_to_end(key)
+            while len(self.tokens) > self.max_size:
+                self.tokens.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached tokens"""
+        with self.lock:
+            self.tokens.clear()
+
+
+verified_tokens = VerifiedTokenCache()
+
+
+def decode_token(token):
+    """Verifies the token signature and returns its claims
+
+    The token is decoded once. Tokens carrying an audience are then checked
+    against the Andela audience and issuer.
+
+    Args:
+        token (string): Token string
+
+    Returns:
+        dict: The claims of the token
+    """
+    decoded_token = jwt.decode(
+        token,
+        get_public_key(AppConfig.FLASK_ENV, AppConfig.JWT_PUBLIC_KEY),
+        algorithms=['RS256'],
+        options={
+            'verify_signature': True,
+            'verify_exp': True,
+            'verify_aud': False
+        })
+
+    if 'aud' in decoded_token:
+        audience = decoded_token['aud']
+        audience = [audience] if isinstance(audience, str) else audience
+        if TOKEN_AUDIENCE not in audience:
+            raise jwt.InvalidAudienceError('Invalid audience')
+        if decoded_token.get('iss') != TOKEN_ISSUER:
+            raise jwt.InvalidIssuerError('Invalid issuer')
+
+    return decoded_token
+
+
 def token_required(func):
     """Authentication decorator. Validates token from the client
 
@@ -59,38 +184,11 @@ def token_required(func):
         from .base_validator import ValidationError
 
         token = get_token()
+        decoded_token = verified_tokens.get(token)
         try:
-            flask_env = AppConfig.FLASK_ENV
-            public_key_64 = AppConfig.JWT_PUBLIC_KEY
-            decode_public_key_64 = lambda key_64: b64decode(key_64).decode(CHARSET)
-            decode_public_key_64_test = lambda key_64: serialization.load_pem_public_key(
-                key_64.encode(), backend=default_backend())
-            public_key_mapper = {
-                'testing': decode_public_key_64_test,
-                'production': decode_public_key_64
-            }
-            public_key = public_key_mapper.get(
-                flask_env, decode_public_key_64)(public_key_64)
-
-            decoded_token = jwt.decode(
-                token,
-                public_key,
-                algorithms=['RS256'],
-                options={
-                    'verify_signature': True,
-                    'verify_exp': True
-                })
-        except jwt.exceptions.InvalidAudienceError:
-            decoded_token = jwt.decode(
-                token,
-                public_key,
-                algorithms=['RS256'],
-                audience='andela.com',
-                issuer="accounts.andela.com",
-                options={
-                    'verify_signature': True,
-                    'verify_exp': True
-                })
+            if decoded_token is None:
+                decoded_token = decode_token(token)
+                verified_tokens.set(token, decoded_token)
         except (
                 ValueError,
                 TypeError,
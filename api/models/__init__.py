@@ -27,15 +27,33 @@ from .asset_supporting_document import AssetSupportingDocument
 from .asset_note import AssetNote
 from .asset_insurance import AssetInsurance
 from .asset_warranty import AssetWarranty
+from .asset_category_stats import AssetCategoryStats, AssetCategoryLastStock
 
 # Model helpers
 from .attribute import Attribute
 from .push_id import PushID
 
+# Helpers
+from api.utilities.helpers.identity import clear_identity
+from api.utilities.helpers.permissions import (flag_permission_change,
+                                               receive_after_commit)
+from api.utilities.helpers.asset_category_stats import (
+    receive_asset_insert, receive_asset_update, receive_asset_delete,
+    receive_stock_count_change)
+from api.utilities.helpers.space_hierarchy import (receive_space_insert,
+                                                   receive_space_update)
+
+# Database
+from .database import db
+
 # Services
 import api.services.email_notification
 import api.services.request
 import api.services.schedule_notification
+import api.services.schedule
+import api.services.asset_category_stats
+import api.services.hot_desk_snapshot
+import api.services.export
 
 
 def fancy_id_generator(mapper, connection, target):
@@ -55,3 +73,28 @@ tables = [
 
 for table in tables:
     event.listen(table, 'before_insert', fancy_id_generator)
+
+# drop the memoized identity of the current request when the user, role or
+# permissions it was built from change
+for model in [User, Role, ResourceAccessLevel, Permission]:
+    for identifier in ['after_insert', 'after_update', 'after_delete']:
+        event.listen(model, identifier, clear_identity)
+
+# rebuild the cached permission matrix when roles or permissions change
+for model in [Role, Resource, ResourceAccessLevel, Permission]:
+    for identifier in ['after_insert', 'after_update', 'after_delete']:
+        event.listen(model, identifier, flag_permission_change)
+
+event.listen(db.session, 'after_commit', receive_after_commit)
+
+# keep the maintained asset category stats in step with assets and stock counts
+event.listen(Asset, 'after_insert', receive_asset_insert)
+event.listen(Asset, 'after_update', receive_asset_update)
+event.listen(Asset, 'after_delete', receive_asset_delete)
+for identifier in ['after_insert', 'after_update', 'after_delete']:
+    event.listen(StockCount, identifier, receive_stock_count_change)
+
+# keep the materialized paths of the spaces in step with their parents. The
+# insert listener runs after the id of the space is generated
+event.listen(Space, 'before_insert', receive_space_insert)
+event.listen(Space, 'before_update', receive_space_update)
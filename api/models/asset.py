@@ -13,7 +13,7 @@ from ..utilities.enums import AssigneeType
 # Third party libraries
 from sqlalchemy.dialects.postgresql import JSON
 from sqlalchemy.event import listens_for
-from sqlalchemy.orm import validates
+from sqlalchemy.orm import validates, joinedload
 from sqlalchemy_utils.types import TSVectorType
 
 # Database
@@ -45,6 +45,11 @@ class Asset(AuditableBaseModel):
     Model for assets
     """
 
+    __table_args__ = (db.Index('ix_asset_tag_trgm',
+                               'tag',
+                               postgresql_using='gin',
+                               postgresql_ops={'tag': 'gin_trgm_ops'}), )
+
     query_class = CustomBaseQuery
     policies = {'patch': 'owner', 'delete': 'owner'}
 
@@ -58,7 +63,7 @@ class Asset(AuditableBaseModel):
         nullable=False,
         server_default='space',
         name='assignee_type')
-    assignee_id = db.Column(db.String(60))
+    assignee_id = db.Column(db.String(60), index=True)
     assigned_by = db.Column(db.String(60), nullable=True)
     date_assigned = db.Column(db.DateTime, nullable=True)
     status = db.Column(db.String(60), nullable=False, server_default='ok')
@@ -78,12 +83,68 @@ class Asset(AuditableBaseModel):
             assignee (obj): The asset's assignee. Can be either a user or a
             space
         """
+        prefetched = getattr(self, '_prefetched_assignee', None)
+        if prefetched and prefetched[0] == self.assignee_id:
+            return prefetched[1]
+
         from . import User, Space
         assignee_mapper = {'user': User, 'space': Space, 'store': Space}
         assignee = assignee_mapper[self.assignee_type.value].get(
             self.assignee_id)
         return assignee
 
+    @classmethod
+    def load_assignees(cls, assets):
+        """Fetches the assignees of many assets at once
+
+        The user and space assignees are each fetched with one query and
+        attached to the assets so `Asset.assignee` does not query per asset.
+
+        Args:
+            assets (list): The Asset objects
+
+        Returns:
+            list: The assets with their assignees loaded
+        """
+        from . import User, Space
+
+        assignee_ids = {'user': set(), 'space': set()}
+        for asset in assets:
+            assignee_ids[cls.get_assignee_kind(asset)].add(asset.assignee_id)
+
+        assignees = {}
+        if assignee_ids['user']:
+            users = User.query.filter(
+                User.token_id.in_(assignee_ids['user'])).all()
+            assignees.update({('user', user.token_id): user
+                              for user in users})
+        if assignee_ids['space']:
+            spaces = Space.query_().options(joinedload(
+                Space.space_type)).filter(Space.id.in_(
+                    assignee_ids['space'])).all()
+            assignees.update({('space', space.id): space
+                              for space in spaces})
+
+        for asset in assets:
+            asset._prefetched_assignee = (asset.assignee_id, assignees.get(
+                (cls.get_assignee_kind(asset), asset.assignee_id)))
+
+        return assets
+
+    @staticmethod
+    def get_assignee_kind(asset):
+        """Gets the model an asset's assignee is stored in
+
+        Args:
+            asset (Asset): The Asset object
+
+        Returns:
+            str: 'user' for user assignees, 'space' for spaces and stores
+        """
+        assignee_type = getattr(asset.assignee_type, 'value',
+                                asset.assignee_type)
+        return 'user' if assignee_type == 'user' else 'space'
+
     def __repr__(self):
         return '<Asset {}>'.format(self.tag)
 
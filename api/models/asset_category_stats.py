@@ -0,0 +1,50 @@
+"""Module for the maintained asset category stats models"""
+
+# Database
+from .database import db
+
+
+class AssetCategoryStats(db.Model):
+    """
+    Count of the assets of an asset category by center, status and
+    assignee type.
+
+    Rows are updated from asset events and read by the asset category stats
+    queries instead of aggregating the asset table on every request. Assets
+    without a center are counted under an empty center id.
+    """
+
+    __tablename__ = 'asset_category_stats'
+
+    asset_category_id = db.Column(
+        db.String,
+        db.ForeignKey('asset_categories.id', ondelete='CASCADE'),
+        primary_key=True)
+    center_id = db.Column(db.String, primary_key=True, default='')
+    status = db.Column(db.String(60), primary_key=True)
+    assignee_type = db.Column(db.String(60), primary_key=True)
+    assets_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+class AssetCategoryLastStock(db.Model):
+    """
+    Stock counts taken on the latest stock count date of an asset category.
+
+    Rows are rebuilt from stock count events and read by the asset category
+    stats queries.
+    """
+
+    __tablename__ = 'asset_category_last_stock'
+
+    stock_count_id = db.Column(
+        db.String(36),
+        db.ForeignKey('stock_counts.id', ondelete='CASCADE'),
+        primary_key=True)
+    asset_category_id = db.Column(
+        db.String,
+        db.ForeignKey('asset_categories.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True)
+    center_id = db.Column(db.String, nullable=False)
+    last_stock_count = db.Column(db.Integer, nullable=False)
+    stock_date = db.Column(db.DateTime, nullable=False)
@@ -1,10 +1,14 @@
 """Module for Base Model"""
+from sqlalchemy import DDL, event
 from sqlalchemy_searchable import make_searchable
 
 from ..model_operations import ModelOperations
 from ..database import db
 
 make_searchable(db.metadata, options={'regconfig': 'pg_catalog.english'})
+# the typeahead suggestions use the trigram functions and operators
+event.listen(db.metadata, 'before_create',
+             DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
 
 
 class BaseModel(db.Model, ModelOperations):
@@ -9,6 +9,7 @@ from .database import db
 
 from api.utilities.dynamic_filter import DynamicFilter
 from api.utilities.sql_constants import EXISTS
+from api.utilities.prepared_statements import execute_query
 
 # Messages
 from api.utilities.messages.error_messages import serialization_errors, database_errors
@@ -245,13 +246,9 @@ class ModelOperations(object):
             (func) -- Returns function with sort by and order by
                       example:  "model.id.desc()"
         """
-        # QueryParser imported here to avoid import loop
-        from api.utilities.query_parser import QueryParser
         from sqlalchemy.types import String
 
-        sort_column = QueryParser.to_snake_case(args.get("sort", "created_at"))
-        sort_by = QueryParser.validate_column_exists(cls, sort_column)
-        order_by = validate_order_by_args(args.get("order", "desc").lower())
+        sort_by, order_by = cls.get_sort_column(args)
         sorting_mapper = {"asc": sort_by.asc, "desc": sort_by.desc}
 
         # This will allow sorting of JSON column as String.
@@ -260,6 +257,27 @@ class ModelOperations(object):
 
         return sorting_mapper[order_by]()
 
+    @classmethod
+    def get_sort_column(cls, args={}):
+        """
+        Gets the validated sort column and sort order of a model.
+
+        Arguments:
+            args (dict): dictionary with sort query parameters
+
+        Returns:
+            (tuple) -- Returns the model column and order ('asc' or 'desc')
+                      example:  (model.created_at, 'desc')
+        """
+        # QueryParser imported here to avoid import loop
+        from api.utilities.query_parser import QueryParser
+
+        sort_column = QueryParser.to_snake_case(args.get("sort", "created_at"))
+        sort_by = QueryParser.validate_column_exists(cls, sort_column)
+        order_by = validate_order_by_args(args.get("order", "desc").lower())
+
+        return sort_by, order_by
+
     @classmethod
     def exists(cls, value, column='id'):
         """Verifies whether the specified id exists in the database
@@ -279,9 +297,8 @@ class ModelOperations(object):
         Returns:
             bool: True if the value exists, False otherwise
         """
-        query = EXISTS.format(
-            table=cls.__table__.name, column=column, value=value)
-        result = db.engine.execute(query).scalar()
+        query = EXISTS.format(table=cls.__table__.name, column=column)
+        result = execute_query(query, value=value).scalar()
         if result:
             return True
         return False
@@ -1,7 +1,5 @@
 """Module that holds request model class."""
 
-from sqlalchemy import text
-
 # Third Party Library
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy import Sequence
@@ -46,6 +44,10 @@ class Request(AuditableBaseModel):
 
     __tablename__ = 'requests'
 
+    # supports closing the completed requests whose closure time has expired
+    __table_args__ = (db.Index('ix_requests_status_completed_at', 'status',
+                               'completed_at'), )
+
     query_class = CustomBaseQuery
 
     serial_number = db.Column(db.Integer, Sequence('requests_id_seq'))
@@ -273,18 +275,33 @@ def request_summary(*where_clause):
             totalInProgressRequest and totalOverdueRequests
     """
 
-    extract_where = " "
+    from ..middlewares.base_validator import ValidationError
+    from ..utilities.messages.error_messages import filter_errors
+    from ..utilities.prepared_statements import execute_query
+    from ..utilities.sql_dynamic_filter import SQLDynamicFilter
+
+    extract_where, params = '', {}
     try:
         key, ops, values = where_clause
     except ValueError:
         extract_where = extract_where
     else:
-        extract_where = f"""where lower({key})  {ops}  '%{values}%'"""
+        # the column is formatted into the query, so it must be a column
+        # of requests. The value is bound.
+        if key not in Request.__table__.columns:
+            raise ValidationError(
+                dict(message=filter_errors['INVALID_COLUMN'].format(key)))
+        condition = SQLDynamicFilter(Request).sql_filter_mapper(
+            f'lower(CAST({key} AS text))', ops, values, params)
+        if not condition:
+            raise ValidationError(
+                dict(message=filter_errors['INVALID_OPERATOR']))
+        extract_where = f'WHERE {condition}'
 
     request_summary_sql_query = sql_queries['get_summary_request'].format(
-        extract_where)
+        filter=extract_where)
 
-    result = db.engine.execute(text(request_summary_sql_query)).first()
+    result = execute_query(request_summary_sql_query, **params).first()
 
     (total_requests, total_open_requests, total_in_progress_requests,
      total_completed_requests, total_closed_requests,
@@ -21,6 +21,8 @@ class Schedule(AuditableBaseModel):
     """Model for schedule."""
 
     __tablename__ = 'schedules'
+    __table_args__ = (db.Index('ix_schedules_work_order_id_due_date',
+                               'work_order_id', 'due_date'), )
 
     query_class = CustomBaseQuery
 
@@ -1,5 +1,8 @@
 """Module for space model"""
 
+# Third party
+from sqlalchemy import func
+
 from .base.auditable_model import AuditableBaseModel
 
 # Base query class
@@ -9,6 +12,11 @@ from .base.base_query import CustomBaseQuery
 from .base.base_policy import BasePolicy
 from .database import db
 
+# Utilities
+from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
+from ..utilities.helpers.space_hierarchy import path_ids, subtree_pattern
+
 
 class SpacePolicy(BasePolicy):
     pass
@@ -22,6 +30,15 @@ class Space(AuditableBaseModel):
 
     __tablename__ = 'spaces'
 
+    # supports the prefix searches of the paths of a subtree
+    __table_args__ = (db.Index('ix_spaces_path',
+                               'path',
+                               postgresql_ops={'path': 'text_pattern_ops'}),
+                      db.Index('ix_spaces_name_trgm',
+                               'name',
+                               postgresql_using='gin',
+                               postgresql_ops={'name': 'gin_trgm_ops'}))
+
     query_class = CustomBaseQuery
 
     name = db.Column(db.String(60), nullable=False)
@@ -35,9 +52,13 @@ class Space(AuditableBaseModel):
     center_id = db.Column(
         db.String(60), db.ForeignKey('centers.id'), nullable=False)
 
+    # the ids of the ancestors and of the space e.g `/building/floor/`,
+    # maintained by the space hierarchy listeners
+    path = db.Column(db.Text, nullable=True)
+
     spaceType = db.relationship('SpaceType', lazy='joined')
 
-    children = db.relationship('Space', lazy='joined')
+    children = db.relationship('Space', lazy='select')
 
     children_reference = db.relationship('Space', lazy='dynamic')
 
@@ -47,6 +68,65 @@ class Space(AuditableBaseModel):
 
         return self.children_reference.count()
 
+    @classmethod
+    def children_counts(cls, space_ids):
+        """Counts the direct children of many spaces in one query
+
+        Args:
+            space_ids (list): the ids of the spaces
+
+        Returns:
+            dict: the count of children keyed by the id of the space. Spaces
+                without children are left out
+        """
+        if not space_ids:
+            return {}
+        counts = db.session.query(cls.parent_id, func.count(
+            cls.id)).filter(cls.parent_id.in_(space_ids)).group_by(
+                cls.parent_id)
+        return dict(counts)
+
+    def descendants(self):
+        """Gets the spaces under this space at any depth
+
+        Returns:
+            (Query): the descendants ordered from the top of the subtree down
+        """
+        return Space.query_().filter(
+            Space.path.like(subtree_pattern(self.path)),
+            Space.id != self.id).order_by(None).order_by(Space.path)
+
+    def ancestors(self):
+        """Gets the spaces this space is under
+
+        Returns:
+            (list): the ancestors from the root down
+        """
+        ancestor_ids = path_ids(self.path)[:-1]
+        if not ancestor_ids:
+            return []
+        ancestors = Space.query_().filter(Space.id.in_(ancestor_ids))
+        return sorted(ancestors, key=lambda space: len(space.path))
+
+    def subtree_assets_count(self):
+        """Counts the assets assigned in the subtree of each child of this
+        space in one query
+
+        Returns:
+            (tuple): the count of assets of the whole subtree, of the space
+                itself and of the subtree of each child keyed by its id
+        """
+        # the id of a child is the segment after the ids of this space in the
+        # paths of its subtree
+        level = len(path_ids(self.path)) + 2
+        rows = execute_query(
+            sql_queries['subtree_assets_count'],
+            level=level,
+            pattern=subtree_pattern(self.path))
+        children = {row.id: row.assets_count for row in rows}
+        own = children.pop('', 0)
+        return own + sum(children.values()), own, children
+
     @SpacePolicy.delete_update_action()
     def update_(self, *args, **kwargs):
         return super(Space, self).update_(*args, **kwargs)
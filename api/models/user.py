@@ -41,6 +41,14 @@ class User(AuditableBaseModel):
     policies = {'patch': None, 'delete': 'owner'}
 
     __tablename__ = 'users'
+    __table_args__ = (db.Index('ix_users_name_trgm',
+                               'name',
+                               postgresql_using='gin',
+                               postgresql_ops={'name': 'gin_trgm_ops'}),
+                      db.Index('ix_users_email_trgm',
+                               'email',
+                               postgresql_using='gin',
+                               postgresql_ops={'email': 'gin_trgm_ops'}))
 
     query_class = CustomBaseQuery
 
@@ -1,6 +1,6 @@
 """ Module for asset model schema. """
 # Third-party libraries
-from marshmallow import fields, post_load, pre_load
+from marshmallow import fields, post_load, pre_load, pre_dump
 from itertools import groupby
 from datetime import datetime as dt
 
@@ -70,6 +70,23 @@ class AssetSchemaOperationsHelper:
         obj['date_assigned'] = dt.now()
         return assignee_type
 
+    @staticmethod
+    def prefetch_assignees(data, many):
+        """Loads the assignees of the assets being dumped in batches
+
+            Args:
+                data (Asset|list): The Asset object or objects
+                many (bool): Whether data is a collection
+
+            Returns:
+                Asset|list: The assets with their assignees loaded
+        """
+        assets = list(data) if many else [data]
+        # assets that failed validation are dumped from their raw data
+        Asset.load_assignees(
+            [asset for asset in assets if isinstance(asset, Asset)])
+        return assets if many else data
+
 
 class AssetSchema(AuditableBaseSchema):
     """Asset model schema"""
@@ -111,6 +128,18 @@ class AssetSchema(AuditableBaseSchema):
 
     assignee = fields.Method("get_assignee", dump_only=True)
 
+    @pre_dump(pass_many=True)
+    def load_assignees(self, data, many):
+        """Loads the assignees of all the assets before they are dumped
+
+        Args:
+            data (Asset|list): The Asset object or objects
+            many (bool): Whether data is a collection
+        """
+        if not {'assignee', 'assignee_type_dump'} & set(self.fields):
+            return data
+        return AssetSchemaOperationsHelper.prefetch_assignees(data, many)
+
     def parse_date_assigned(self, obj):
         return obj.date_assigned.date().strftime('%Y-%m-%d') if (
             obj.date_assigned) else ''
@@ -124,10 +153,7 @@ class AssetSchema(AuditableBaseSchema):
         Returns:
             str: The Assignee type
         """
-        assignee_mapper = AssetSchemaOperationsHelper.assignee_mapper
-
-        assignee = assignee_mapper[obj.assignee_type.value].get(
-            obj.assignee_id)
+        assignee = obj.assignee
         assignee_type = obj.assignee_type.value
         if AssetSchemaOperationsHelper.is_a_store(assignee, assignee_type):
             assignee_type = AssigneeType.space.value
@@ -252,6 +278,16 @@ class AssetInflowAnalyticsSchema(AuditableBaseSchema):
                   'date_assigned', 'assignee')
         ordered = True
 
+    @pre_dump(pass_many=True)
+    def load_assignees(self, data, many):
+        """Loads the assignees of all the assets before they are dumped
+
+        Args:
+            data (Asset|list): The Asset object or objects
+            many (bool): Whether data is a collection
+        """
+        return AssetSchemaOperationsHelper.prefetch_assignees(data, many)
+
 
 class AssetInflowOutflowSchema(AssetSchema):
     """Asset Inflow and Outflow schema."""
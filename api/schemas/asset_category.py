@@ -2,10 +2,8 @@
 
 # Third Party
 from marshmallow import fields, post_load, validates_schema, post_dump
-from sqlalchemy import text
 from flask import request
 # Models
-from api.models.database import db
 from api.models import AssetCategory, Asset, User, Attribute
 # Schemas
 from .attribute import AttributeSchema
@@ -19,6 +17,7 @@ from ..utilities.validators.duplicate_validator import validate_duplicate
 from ..utilities.validators.image_validator import validate_image
 from ..utilities.error import raise_error
 from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
 from ..utilities.helpers.check_user_role import is_super_user
 from ..utilities.constants import EXCLUDED_FIELDS
 
@@ -177,9 +176,9 @@ class AssetSubCategorySchema(EagerLoadAssetCategoryAttributesSchema):
             (list): the subcategories of an asset category
         """
 
-        subcategory_sql_query = sql_queries[
-            'get_asset_category_subcategories'].format(obj.id)
-        subcategories = db.engine.execute(text(subcategory_sql_query))
+        subcategories = execute_query(
+            sql_queries['get_asset_category_subcategories'],
+            category_id=obj.id)
         sub_category_list = []
 
         for subcategory in subcategories:
@@ -4,6 +4,7 @@ from sqlalchemy.engine.result import RowProxy
 from itertools import _grouper
 
 from ..middlewares.base_validator import ValidationError
+from ..utilities.helpers.instrumentation import timed_serialization
 
 
 class BaseSchema(Schema):
@@ -56,8 +57,9 @@ class BaseSchema(Schema):
             obj = _obj
 
         BaseSchema.filter_object(obj, include)
-        return super(BaseSchema, self).dump(
-            obj, many=many, update_fields=update_fields, **kwargs)
+        with timed_serialization():
+            return super(BaseSchema, self).dump(
+                obj, many=many, update_fields=update_fields, **kwargs)
 
     @staticmethod
     def filter_object(obj, include):
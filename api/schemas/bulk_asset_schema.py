@@ -1,17 +1,60 @@
-from marshmallow import post_load, fields
+from marshmallow import post_load, fields, validates
 
 from api.models import User
 from api.schemas.asset import AssetSchema
+from api.utilities.helpers.schemas import common_args
+from api.utilities.validators.allocation_validators import validate_assignee_id
+from api.utilities.validators.resource_exists_validator import resource_exists
+from api.utilities.validators.string_length_validators import \
+    string_length_validator
 
 
 class BulkAssetSchema(AssetSchema):
     """Schema for posting assets
     Params:
-       AssetSchema(Class):Base class for assets """
+       AssetSchema(Class):Base class for assets
+
+    The centers and assignees of the assets are looked up for the whole batch
+    by the BulkAssetLookup in the `lookup` context of the schema when it is
+    set, instead of once per asset."""
     asset_category_id = fields.String(
         dump_only=True,
         dump_to="assetCategoryId")
 
+    center_id = fields.String(
+        load_from="centerId",
+        dump_to="centerId",
+        validate=string_length_validator(60))
+
+    assignee_id = fields.String(
+        load_only=True,
+        load_from="assigneeId",
+        **common_args())
+
+    @validates('center_id')
+    def validate_center_exists(self, center_id):
+        """Validates that the center of the asset exists
+            params:
+                center_id(str): The center id
+        """
+        lookup = self.context.get('lookup')
+        if lookup:
+            lookup.validate_center_id(center_id)
+        else:
+            resource_exists(center_id)
+
+    @validates('assignee_id')
+    def validate_assignee_exists(self, assignee_id):
+        """Validates that the assignee of the asset exists
+            params:
+                assignee_id(str): The user token id or space id
+        """
+        lookup = self.context.get('lookup')
+        if lookup:
+            lookup.validate_assignee_id(assignee_id)
+        else:
+            validate_assignee_id(assignee_id)
+
     @post_load
     def set_center_not_provided(self, data):
         """Check if data has center else set user center
@@ -19,7 +62,24 @@ class BulkAssetSchema(AssetSchema):
                 data(dict) Valid data
         """
         if not data.get("center_id"):
-            from flask import request
-            user = User.get(request.decoded_token['UserInfo']['id'])
+            lookup = self.context.get('lookup')
+            if lookup:
+                user = lookup.requester
+            else:
+                from flask import request
+                user = User.get(request.decoded_token['UserInfo']['id'])
             if user and user.center_id:
                 data['center_id'] = user.center_id
+
+    @post_load
+    def validate_space_assignee_in_center_provided(self, data):
+        """Validates that the space is in the asset's center
+        Also validates that the assignee id and type match
+        Args:
+            data (dict): The request data
+        """
+        lookup = self.context.get('lookup')
+        if lookup:
+            lookup.validate_assignee(data)
+        else:
+            super().validate_space_assignee_in_center_provided(data)
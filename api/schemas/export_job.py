@@ -0,0 +1,35 @@
+"""Module for the export job schema"""
+
+# Third party
+from marshmallow import fields, post_load
+
+# Schemas
+from .base_schemas import BaseSchema
+
+# Helpers
+from ..utilities.helpers.schemas import common_args
+
+# Validators
+from ..utilities.validators.export_job_validators import (
+    validate_export_type, validate_export_file_format)
+
+
+class ExportJobSchema(BaseSchema):
+    """Export job request schema"""
+
+    export_type = fields.String(
+        **common_args(validate=validate_export_type), load_from='exportType')
+    file_format = fields.String(
+        missing='csv',
+        validate=validate_export_file_format,
+        load_from='fileFormat')
+    query = fields.Dict(missing=dict)
+
+    @post_load
+    def stringify_query(self, data):
+        """Converts the query values to strings like url query parameters"""
+        data['query'] = {
+            key: str(value)
+            for key, value in data['query'].items()
+        }
+        return data
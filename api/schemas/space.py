@@ -48,7 +48,25 @@ class SpaceSchema(AuditableBaseSchema):
         dump_to="spaceType",
         only=['id', 'type', 'color'])
 
-    children_count = fields.Integer(dump_only=True, dump_to='childrenCount')
+    children_count = fields.Method(
+        'get_children_count', dump_to='childrenCount')
+
+    def get_children_count(self, obj):
+        """Gets the count of the direct children of a space
+
+        The counts of a list of spaces are batched into the context under
+        `children_counts`, otherwise the children of the space are counted.
+
+        Args:
+            obj (Space): an instance of the Space model
+
+        Returns:
+            (int): the count of the children of the space
+        """
+        children_counts = self.context.get('children_counts')
+        if children_counts is None:
+            return obj.children_count
+        return children_counts.get(obj.id, 0)
 
     @pre_load
     def strip_and_capitalize_name(self, data):
@@ -3,6 +3,7 @@
 from marshmallow import fields, post_load
 
 # Models
+from api.models.space import Space
 from api.models.space_type import SpaceType
 
 # Schemas
@@ -50,7 +51,13 @@ class SpaceTypeSchema(AuditableBaseSchema):
         if center_id:
             spaces = spaces.filter_by(center_id=center_id)
 
-        return SpaceSchema(many=True, only=only).dump(spaces).data
+        spaces = spaces.all()
+        context = {
+            'children_counts':
+            Space.children_counts([space.id for space in spaces])
+        }
+        return SpaceSchema(many=True, only=only,
+                           context=context).dump(spaces).data
 
     @staticmethod
     def organize_output(data):
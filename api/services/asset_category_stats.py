@@ -0,0 +1,22 @@
+"""Module for asset category stats services"""
+
+# Database
+from api.models.database import db
+
+# Helpers
+from api.utilities.helpers.asset_category_stats import \
+    rebuild_asset_category_stats as rebuild_stats
+
+# Services
+from . import celery_scheduler
+
+
+@celery_scheduler.task(name='rebuild_asset_category_stats')
+def rebuild_asset_category_stats():
+    """Rebuilds the maintained asset category stats from the asset and stock
+    count tables, to fix any drift from bulk writes that skip the ORM events
+        Returns:
+            None
+    """
+    rebuild_stats(db.session)
+    db.session.commit()
@@ -1,8 +1,5 @@
 """Module for sending email notifications"""
 
-# Standard Library
-from sqlalchemy import text
-
 # Models
 from api.models import Role
 
@@ -11,11 +8,11 @@ from config import AppConfig
 
 # Utilities
 from api.tasks.notifications import SendEmail
-from ..utilities.helpers.get_mailing_params import get_mailing_params
+from ..utilities.helpers.get_mailing_params import get_batch_mailing_params
 from ..utilities.emails.email_templates import email_templates
 from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
 from ..utilities.enums import AssetStatus
-from api.models.database import db
 
 # This import is commented out because the stock level notification mail
 # feature has currently been disabled as a request by the Operations Associate team
@@ -23,14 +20,15 @@ from api.models.database import db
 # from . import celery_scheduler
 
 
-def asset_counter(query):
+def asset_counter(query, **params):
     """Function to query all available assets
 
     Args:
         query (str): An SQL string statement to query the database
+        params (dict): The values of the bind parameters of the query
     """
 
-    return list(db.engine.execute(text(query)))
+    return list(execute_query(query, **params))
 
 
 # this decorator is commented out because the stock level notification mail
@@ -46,11 +44,14 @@ def low_asset_count_notifier():
 
     users = role.users.all() if role else []
 
-    query = sql_queries['check_asset_category_levels'].format(
-        AssetStatus.OK_IN_STORE.value, AssetStatus.AVAILABLE.value,
-        AssetStatus.INVENTORY.value)
+    query = sql_queries['check_asset_category_levels']
 
-    asset_count = asset_counter(query)
+    asset_count = asset_counter(
+        query,
+        statuses=[
+            AssetStatus.OK_IN_STORE.value, AssetStatus.AVAILABLE.value,
+            AssetStatus.INVENTORY.value
+        ])
 
     notified = False
 
@@ -73,23 +74,24 @@ def notify_users(*args):
             count (int): An integer representing asset count
             low_in_stock (int): An integer representing the Asset_category low in stock threshold value
             data (dict): A transactional email template
+
+    Returns:
+        dict: the count of emails sent and the emails that failed
     """
     users, asset_category_name, count, low_in_stock, data = args
     data['domain'] = AppConfig.DOMAIN
+    data["asset_category_name"] = asset_category_name
+    data["asset_count"] = count
 
-    for user in users:
-        data["user_first_name"] = user.name
-        data["asset_category_name"] = asset_category_name
-        data["asset_count"] = count
-
-        if count <= low_in_stock:
-            data["asset_status"] = "low in stock"
-        else:
-            data["asset_status"] = "running low"
-
-        title = f"{data['asset_category_name']} is {data['asset_status']}"
-        params = get_mailing_params('low_in_stock', title, data)
+    if count <= low_in_stock:
+        data["asset_status"] = "low in stock"
+    else:
+        data["asset_status"] = "running low"
 
-        params = dict(recipient=user.email, **params)
+    title = f"{data['asset_category_name']} is {data['asset_status']}"
+    mails = get_batch_mailing_params('low_in_stock', [
+        (user.email, title, dict(data, user_first_name=user.name))
+        for user in users
+    ])
 
-        SendEmail.send_mail_with_template(**params)
+    return SendEmail.send_batch_with_template(mails)
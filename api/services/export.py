@@ -0,0 +1,16 @@
+"""Module for export services"""
+
+# Helpers
+from api.utilities.helpers.artifact_store import artifact_store
+
+# Services
+from . import celery_scheduler
+
+
+@celery_scheduler.task(name='purge_expired_exports')
+def purge_expired_exports():
+    """Removes the files of the export jobs that have expired
+        Returns:
+            int: the number of removed files
+    """
+    return artifact_store.purge_expired()
@@ -0,0 +1,18 @@
+"""Module for hot desk snapshot services"""
+
+# Services
+from . import celery_scheduler
+
+
+@celery_scheduler.task(name='refresh_hot_desk_snapshot')
+def refresh_hot_desk_snapshot():
+    """Refreshes the snapshot of the hot desks the slack bot reads, so the
+    bot does not read the sheet while answering
+        Returns:
+            None
+    """
+    # the bot imports the app, which imports the models
+    from bot.utilities.hot_desk_snapshot import \
+        refresh_hot_desk_snapshot as refresh_snapshot
+
+    refresh_snapshot()
@@ -0,0 +1,17 @@
+"""Module for schedule related services"""
+
+# Utilities
+from api.utilities.validators.schedule_creator import extend_schedules
+
+# Services
+from . import celery_scheduler
+
+
+@celery_scheduler.task(name='extend_work_order_schedules')
+def extend_work_order_schedules():
+    """Creates the schedules of the work orders that fall in the rolling
+    horizon since the last run
+        Returns:
+            (int): the count of schedules created
+    """
+    return extend_schedules()
@@ -1,12 +1,10 @@
 """Module for sending email notifications on schedule due_date and resetting hot desk spreadsheet everyday"""
 
 # Third Party
-from sqlalchemy import text
 from datetime import datetime, timedelta
 
 # Models
 from api.models import HotDeskRequest
-from api.models.database import db
 
 # App config
 from config import AppConfig
@@ -14,15 +12,17 @@ from config import AppConfig
 # Utilities
 from ..tasks.notifications import SendEmail
 from ..utilities.sql_queries import sql_queries
-from ..utilities.helpers.get_mailing_params import get_mailing_params
+from ..utilities.prepared_statements import execute_query
+from ..utilities.helpers.get_mailing_params import get_batch_mailing_params
 from ..utilities.helpers.calendar import get_start_or_end_of_day
 
 # Bot utilities
 from bot.utilities.bugsnag import post_bugsnag_exception
+from bot.utilities.constants import SHEET_HOT_DESK
 
 # GoogleSheetHelper
 from bot.utilities.google_sheets.google_sheets_helper import GoogleSheetHelper
-from bot.utilities.helpers.spreadsheet_helper import update_
+from bot.utilities.helpers.spreadsheet_helper import SheetSync
 
 # celery scheduler
 from . import celery_scheduler
@@ -30,32 +30,39 @@ from . import celery_scheduler
 
 @celery_scheduler.task(name='schedule_due_date_notifier')
 def schedule_due_date_notifier():
-    """Function to notify assignee of a due schedule."""
+    """Function to notify assignee of a due schedule.
 
-    query = sql_queries['get_due_schedules']
+    The emails are sent in one batch, which reports the emails that could
+    not be sent at once.
+    """
 
-    schedules = db.engine.execute(text(query)).fetchall()
+    query = sql_queries['get_due_schedules']
 
-    # To help in testing purposes
-    notified = False
+    schedules = execute_query(query).fetchall()
 
-    for name, email, task_names in schedules:
-        data = {
+    mails = get_batch_mailing_params('schedule_due_template', [
+        (email, name, {
             'username': name,
             'tasks': task_names,
             'domain': AppConfig.DOMAIN
-        }
-        schedule_params = get_mailing_params('schedule_due_template', name,
-                                             data)
-        schedule_params = dict(recipient=email, **schedule_params)
-        SendEmail.send_mail_with_template(**schedule_params)
-        notified = True
-    return notified
+        }) for name, email, task_names in schedules
+    ])
+    result = SendEmail.send_batch_with_template(mails)
+    if result['failures']:
+        post_bugsnag_exception(
+            Exception(result['failures']),
+            f'Could not send {len(result["failures"])} due schedule emails')
+
+    # To help in testing purposes
+    return bool(mails)
 
 
 @celery_scheduler.task(name='reset_hot_desk_spreadsheet')
 def reset_hot_desk_spreadsheet():
     """Function to  to reset the hotdesks spreadsheet
+
+    The seats of the approved requests of yesterday are reset in one
+    batched update of the sheet
     Return:
         None
     """
@@ -63,17 +70,24 @@ def reset_hot_desk_spreadsheet():
     start_date = get_start_or_end_of_day(yesterday, end=False)
     end_date = get_start_or_end_of_day(yesterday, end=True)
 
-    approved_requests_yesterday = HotDeskRequest.query.filter\
-        (HotDeskRequest.status == 'approved',
-         HotDeskRequest.created_at.between(start_date, end_date)).all()
+    approved_requests_yesterday = HotDeskRequest.query.with_entities(
+        HotDeskRequest.hot_desk_ref_no).filter(
+            HotDeskRequest.status == 'approved',
+            HotDeskRequest.created_at.between(start_date, end_date)).all()
 
     sheet_data, sheet = GoogleSheetHelper().open_sheet()
-    if sheet:
-        bay_column = sheet.col_values(2)[1:]
+    if not sheet:
+        return
 
+    sheet_sync = SheetSync(sheet_data, sheet)
     for request in approved_requests_yesterday:
         try:
-            update_(sheet_data, sheet, bay_column, request.hot_desk_ref_no, 'Hot Desk')
+            sheet_sync.stage(request.hot_desk_ref_no, SHEET_HOT_DESK)
         except Exception as error:
             post_bugsnag_exception(
                 error, f'Could not reset Hot desk with ref no - {request.hot_desk_ref_no}')
+
+    try:
+        sheet_sync.apply()
+    except Exception as error:
+        post_bugsnag_exception(error, 'Could not reset the hot desks')
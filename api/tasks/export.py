@@ -0,0 +1,126 @@
+"""Module for running export jobs"""
+# Standard library
+import os
+from datetime import date, datetime
+from io import BytesIO
+
+# Celery
+from main import celery_app
+
+# Database
+from api.models.database import db
+
+# Utilities
+from api.utilities.enums import ExportJobStatusEnum
+from api.utilities.constants import EXPORT_ATTACHMENT_MAX_SIZE
+from api.utilities.helpers.artifact_store import artifact_store
+from api.utilities.helpers.export_jobs import (
+    build_export, get_export_job, update_export_job)
+from api.utilities.helpers.identity import set_identity
+
+# app config
+from config import AppConfig
+
+
+class ExportJobs:
+    """Runs export jobs and notifies their creators"""
+
+    @staticmethod
+    @celery_app.task(name='run_export_job')
+    def run_export_job(job_id, decoded_token):
+        """Writes the file of an export job and mails it to its creator
+
+        Args:
+            job_id (str): the id of the export job
+            decoded_token (dict): the decoded token of the job creator
+        """
+        from manage import app  # imported here to avoid import loop
+
+        with app.app_context():
+            job = ExportJobs.run(job_id, decoded_token)
+            if job:
+                ExportJobs.notify(job)
+
+    @staticmethod
+    def run(job_id, decoded_token):
+        """Writes the file of an export job
+
+        Args:
+            job_id (str): the id of the export job
+            decoded_token (dict): the decoded token of the job creator
+
+        Returns:
+            dict: the finished export job or None if it has expired
+        """
+        job = get_export_job(job_id)
+        if not job:
+            return None
+
+        update_export_job(job_id, status=ExportJobStatusEnum.running.value)
+        export_type, query = job['exportType'], job['query']
+
+        try:
+            set_identity(decoded_token['UserInfo']['id'])
+            export = build_export(export_type, query)
+            file_name = export.pop('file_name', None) or \
+                f'{export_type} export - {date.today()}'
+            artifact_store.write(
+                job_id,
+                job['fileFormat'],
+                on_chunk=lambda count: update_export_job(
+                    job_id, progress=count),
+                **export)
+        except Exception as error:  # pylint: disable=W0703
+            db.session.rollback()
+            message = error.to_dict()['message'] if hasattr(
+                error, 'to_dict') else str(error)
+            return update_export_job(
+                job_id,
+                status=ExportJobStatusEnum.failed.value,
+                error=message,
+                completedAt=datetime.utcnow().isoformat())
+
+        return update_export_job(
+            job_id,
+            status=ExportJobStatusEnum.completed.value,
+            fileName=file_name,
+            completedAt=datetime.utcnow().isoformat())
+
+    @staticmethod
+    def notify(job):
+        """Mails the file of a finished export job to its creator
+
+        Files larger than EXPORT_ATTACHMENT_MAX_SIZE are linked instead of
+        attached.
+
+        Args:
+            job (dict): the finished export job
+        """
+        from api.tasks.email_sender import Email
+
+        if not job.get('email'):
+            return
+
+        title = f"Activo {job['exportType']} export"
+        if job['status'] == ExportJobStatusEnum.failed.value:
+            body = f"Your {job['exportType']} export failed: {job['error']}"
+            Email.send_mail(title, [job['email']], body)
+            return
+
+        path = artifact_store.get(job['id'], job['fileFormat'])
+        download_url = \
+            f"{AppConfig.API_BASE_URL_V1}/export-jobs/{job['id']}/download"
+        body = f"Your {job['exportType']} export is ready. It can be " \
+            f"downloaded from {download_url}"
+
+        if not path or os.path.getsize(path) > EXPORT_ATTACHMENT_MAX_SIZE:
+            Email.send_mail(title, [job['email']], body)
+            return
+
+        with open(path, 'rb') as export_file:
+            attachment = {
+                'file': BytesIO(export_file.read()),
+                'name': os.path.basename(path).replace(
+                    job['id'], job['fileName'])
+            }
+        Email.send_mail(title, [job['email']], body, attachment)
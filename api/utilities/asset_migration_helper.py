@@ -6,12 +6,8 @@ celery task to avoid import error
 from datetime import date, datetime
 
 # Third-party libraries
-from sqlalchemy import text
 from humps.camel import case
 
-# Database instance
-from ..models.database import db
-
 # Models
 from api.models import User, Space, Asset
 
@@ -23,7 +19,8 @@ from ..utilities.messages.error_messages import MIGRATION_ERRORS, serialization_
 from manage import app
 
 # Utilities
-from ..utilities.sql_queries import sql_queries
+from ..utilities.helpers.asset_ingestion import ingest_assets
+from ..utilities.helpers.existing_values import get_existing_values
 
 from api.utilities.enums import AssetStatus
 from .constants import ASK_FEJI
@@ -123,11 +120,11 @@ def create_or_skip_assets(*args):
     with app.app_context():
         model, key, table_name, data = args
         # existing records to skip
-        existing = db.engine.execute(
-            text(sql_queries['get_column'].format(key, table_name)))
-        existing = {item[0] for item in existing}
+        existing = get_existing_values(
+            getattr(model, key), [item[key] for item in data])
 
         failed_data, success_data = [], [] # stores failed and success data respectively
+        new_records = []
         statuses = AssetStatus.get_all()
 
         # validates status
@@ -144,8 +141,25 @@ def create_or_skip_assets(*args):
             else:
                 existing.add(item.get(key))
                 success_data.append(process_success_item(item))
-                db.session.add(model(**item))
-        db.session.commit()
+                new_records.append(item)
+
+        _, skipped = ingest_assets(new_records)
+        if skipped:
+            # records whose assignee was removed or whose key was taken
+            # after they were validated
+            skipped = {
+                record[key]: ', '.join(
+                    message for messages in errors.values()
+                    for message in messages)
+                for record, errors in skipped
+            }
+            title_key = key.title()
+            for item in success_data[:]:
+                if item[title_key] in skipped:
+                    success_data.remove(item)
+                    failed_data.append({
+                        **item, 'Reasons for failure': skipped[item[title_key]]
+                    })
         return failed_data, success_data
 
 
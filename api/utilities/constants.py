@@ -26,6 +26,14 @@ ASK_FEJI = 'Assignee not found. Ask Feji'
 
 FULL_ACCESS = 'Full Access'
 
+TOKEN_AUDIENCE = 'andela.com'
+TOKEN_ISSUER = 'accounts.andela.com'
+# number of verified tokens whose claims are kept in memory
+VERIFIED_TOKEN_CACHE_SIZE = 1024
+
+PERMISSION_MATRIX_CACHE_KEY = 'permission_matrix'
+PERMISSION_MATRIX_VERSION_CACHE_KEY = 'permission_matrix_version'
+
 ASSET_REPORT_QUERIES = [
     'assetflow', 'assetinflow', 'assetoutflow', 'stocklevel', 'incidencereport'
 ]
@@ -37,6 +45,50 @@ STATS = 'stats'
 
 DATE_COLUMNS = ['created_at', 'updated_at', 'deleted_at', 'warranty']
 
+CURSOR_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+TOTAL_COUNT_STRATEGIES = ('exact', 'estimated', 'cached')
+# seconds a cached total count is reused for
+TOTAL_COUNT_CACHE_TIMEOUT = 60
+# planner estimates below this are replaced by an exact count
+ESTIMATED_COUNT_THRESHOLD = 1000
+# parsed url queries and compiled filter plans kept in each process
+FILTER_PLAN_CACHE_SIZE = 512
+# values each filter plan remembers it has validated
+FILTER_PLAN_VALUES_CACHE_SIZE = 64
+# raw sql queries whose positional statements are cached in each process
+PREPARED_QUERIES_CACHE_SIZE = 512
+# prepared statements kept on each database connection, the least recently
+# used one is deallocated beyond it
+PREPARED_STATEMENTS_PER_CONNECTION = 128
+# upper bounds in seconds of the buckets of the request latency histogram
+REQUEST_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5,
+                           5, 10)
+# request header asking for the metrics of the request in its response
+METRICS_DEBUG_HEADER = 'X-Debug-Metrics'
+
+# typeahead suggestions returned by default and at most
+SUGGESTIONS_LIMIT = 10
+SUGGESTIONS_MAX_LIMIT = 50
+# suggestions for the most recent prefixes kept in each process, and the
+# seconds they are reused for
+SUGGESTIONS_CACHE_SIZE = 1024
+SUGGESTIONS_CACHE_TIMEOUT = 30
+
+# records read from the database per chunk of a streamed csv export
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_FILE_FORMATS = ['csv', 'xlsx']
+# seconds export jobs and their files are kept for
+EXPORT_JOB_EXPIRY = 60 * 60 * 24
+# bytes above which a finished export is linked instead of attached to the mail
+EXPORT_ATTACHMENT_MAX_SIZE = 10 * 1024 * 1024
+
+# connections a batch of emails is sent over at the same time
+EMAIL_BATCH_CONCURRENCY = 4
+
+# weeks ahead of today the schedules of the work orders are created for
+SCHEDULES_HORIZON_WEEKS = 8
+
 QUERY_COLUMNS = {
     'start': {
         'column': 'created_at',
@@ -7,8 +7,10 @@ from .filter_functions import (like, is_equal, less_than, not_equal,
                                greater_than, less_or_equal, greater_or_equal)
 from api.middlewares.base_validator import ValidationError
 from api.utilities.messages.error_messages import filter_errors
-from api.utilities.constants import DATE_COLUMNS
+from api.utilities.constants import (DATE_COLUMNS, FILTER_PLAN_CACHE_SIZE,
+                                     FILTER_PLAN_VALUES_CACHE_SIZE)
 from api.utilities.error import raise_error_helper
+from api.utilities.helpers.lru_cache import LRUCache
 from api.utilities.validators.date_validator import date_validator
 
 
@@ -106,6 +108,10 @@ class DynamicFilter:
             other comparators are eq(equal to),ne(not equal to),lt(less than),
             le(less than or equal to) gt(greater than),
             ge(greater than or equal to)
+
+        The filters are applied with the `FilterPlan` of their keys and
+        operators, which is compiled on the first query with that shape.
+
         Args:
             args (list): filter_condition
 
@@ -120,59 +126,28 @@ class DynamicFilter:
         if include_deleted and include_deleted == 'deleted':
             result = self.query.include_deleted()
 
-        for raw in raw_filters:
-
-            key_in_snake_case, op, value, key = self.strip_query(raw)
+        filters = [self.split_query(raw) for raw in raw_filters]
+        plan = FilterPlan.get(self.model,
+                              tuple((key, op) for key, op, _ in filters))
 
-            column = getattr(self.model, key_in_snake_case, None)
-            json_field = getattr(self.model, 'custom_attributes', None)
+        return plan.apply(result, tuple(value for _, _, value in filters))
 
-            # getting the method to operator function
-            db_filter = self.mapper.get(op)
-            result = self.filter_column_attributes(
-                column, json_field, db_filter, key_in_snake_case, value,
-                result, key)
-
-        return result
-
-    def filter_column_attributes(self, *args):
-        """Filters the database records
-
-        Operations:
-            1. filters with key-value is column and not json field
-            2. filters with custom attributes method is json_field
-            3. filters with datetime fields
-            4. raises an error is column or json_field is None
-
-        It uses a function to filter the database column by the column key and value
+    def split_query(self, raw):
+        """Splits a query condition into its key, operator and value
 
         Args:
-            *args (ImmutableDict):
-                column(obj): SQL alchemly object attribute
-                json_field(obj): SQL alchemly object attribute
-                db_filter(function): Filtering function
-                key(str): column name to be filtered
-                value(str): value to filter by
-                result(obj): SQL Alchemly query
+            raw (str): the condition to be split
+
         Returns:
-            result(obj): SQL Alchemly query
+            tuple: the key, the lowercase operator and the value
         """
-        column, json_field, db_filter, key_in_snake_case, value, result, key = args
+        try:
+            key, op, value, = raw.split(',', 3)
+        except ValueError:
+            raise_error_helper(True, filter_errors, 'INVALID_FILTER_FORMAT',
+                               raw)
 
-        if not column and not json_field:
-            raise ValidationError(
-                dict(message=filter_errors['INVALID_COLUMN'].format(
-                    key_in_snake_case)))
-        elif not column and json_field:
-            result = result.filter(
-                db_filter(
-                    self.model.custom_attributes[key].astext.cast(Unicode),
-                    value))
-        elif str(column.type) == 'DATETIME':
-            result = result.filter(db_filter(func.date(column), value))
-        else:
-            result = result.filter(db_filter(column, value))
-        return result
+        return key, op.lower().strip(), value.strip()
 
     def strip_query(self, raw):
         """Parse query conditions.
@@ -188,17 +163,139 @@ class DynamicFilter:
         Returns:
             (str): the sql filter conditions
         """
-        try:
-            key, op, value, = raw.split(',', 3)
-        except ValueError:
-            raise_error_helper(True, filter_errors, 'INVALID_FILTER_FORMAT',
-                               raw)
+        key, op, value = self.split_query(raw)
 
         from .query_parser import QueryParser
         key_in_snake_case = QueryParser.to_snake_case(key.strip())
-        op = op.lower().strip()
-        value = value.strip()
 
         self.validate_query(key_in_snake_case, value, op)
 
         return key_in_snake_case, op, value, key
+
+
+class FilterPlan:
+    """
+    The filters of a model compiled for one shape of `where` filters
+
+    The shape of the filters is the key and operator of each filter. The
+    columns and filter functions of a shape are looked up and validated once,
+    when the plan is compiled, so applying the plan to the values of a query
+    only validates the values and builds the clauses. The values are bound as
+    parameters of the clauses. Values the plan has already validated are not
+    validated again.
+    """
+
+    plans = LRUCache(FILTER_PLAN_CACHE_SIZE)
+
+    def __init__(self, model, shape):
+        """
+        Compiles the filters of a shape
+
+        Args:
+            model (BaseModel): the model being filtered
+            shape (tuple): the key and operator of each filter
+        """
+        self.model = model
+        self.shape = shape
+        self.steps = [self.compile_step(key, op) for key, op in shape]
+        self.validated_values = LRUCache(FILTER_PLAN_VALUES_CACHE_SIZE)
+
+    @classmethod
+    def get(cls, model, shape):
+        """
+        Gets the plan of a shape of filters, compiling it if it is not cached
+
+        Args:
+            model (BaseModel): the model being filtered
+            shape (tuple): the key and operator of each filter
+
+        Returns:
+            FilterPlan: the compiled plan
+        """
+        plan = cls.plans.get((model, shape))
+        if plan is None:
+            plan = cls(model, shape)
+            cls.plans.set((model, shape), plan)
+        return plan
+
+    def compile_step(self, key, op):
+        """
+        Resolves the expression, filter function and value validator of a
+        filter
+
+        Args:
+            key (str): the key of the filter, a column or custom attribute
+            op (str): the operator of the filter e.g like
+
+        Raises:
+            ValidationError: if the operator or the column is not valid
+
+        Returns:
+            tuple: the filtered expression, the filter function and the
+                validator of the values or None
+        """
+        from .query_parser import QueryParser
+        key_in_snake_case = QueryParser.to_snake_case(key.strip())
+
+        raise_error_helper(op not in DynamicFilter.mapper, filter_errors,
+                           'INVALID_OPERATOR')
+
+        column = getattr(self.model, key_in_snake_case, None)
+        json_field = getattr(self.model, 'custom_attributes', None)
+        if not column and not json_field:
+            raise ValidationError(
+                dict(message=filter_errors['INVALID_COLUMN'].format(
+                    key_in_snake_case)))
+        elif not column and json_field:
+            expression = self.model.custom_attributes[key].astext.cast(
+                Unicode)
+        elif str(column.type) == 'DATETIME':
+            expression = func.date(column)
+        else:
+            expression = column
+
+        validator = None
+        if key_in_snake_case == 'deleted':
+            validator = self.validate_deleted
+        elif key_in_snake_case in DATE_COLUMNS:
+            validator = date_validator
+
+        return expression, DynamicFilter.mapper[op], validator
+
+    @staticmethod
+    def validate_deleted(value):
+        """
+        Validates the value of a `deleted` filter
+
+        Args:
+            value (str): the value of the filter
+
+        Raises:
+            ValidationError: if the value is not a boolean
+        """
+        raise_error_helper(value not in ('true', 'false'), filter_errors,
+                           'INVALID_DELETE_ATTRIBUTE')
+
+    def apply(self, query, values):
+        """
+        Filters a query with the values of the filters
+
+        Args:
+            query (BaseQuery): the query to filter
+            values (tuple): the value of each filter of the shape
+
+        Raises:
+            ValidationError: if a value is not valid
+
+        Returns:
+            BaseQuery: the filtered query
+        """
+        if self.validated_values.get(values) is None:
+            for (_, _, validator), value in zip(self.steps, values):
+                if validator:
+                    validator(value)
+            self.validated_values.set(values, True)
+
+        for (expression, db_filter, _), value in zip(self.steps, values):
+            query = query.filter(db_filter(expression, value))
+        return query
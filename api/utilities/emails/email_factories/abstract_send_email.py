@@ -1,5 +1,12 @@
 # Standard
 import abc
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party libraries
+from flask import current_app, has_app_context
+
+# Utilities
+from api.utilities.constants import EMAIL_BATCH_CONCURRENCY
 
 
 class AbstractSendEmail(metaclass=abc.ABCMeta):
@@ -24,3 +31,78 @@ class AbstractSendEmail(metaclass=abc.ABCMeta):
             trials (int): The maximum number the  email submit resent in case a GatewayTimeoutError is raised.
         """
         pass
+
+    @classmethod
+    def send_batch_with_template(cls,
+                                 mails,
+                                 concurrency=EMAIL_BATCH_CONCURRENCY):
+        """Class Method for sending many template emails
+
+        The mails are split between at most `concurrency` workers, which
+        each send their share over one connection. A mail that fails does not
+        stop the others from being sent.
+
+        Args:
+            mails (list): the keyword arguments of `send_mail_with_template`
+                of each mail.
+            concurrency (int): the maximum count of connections used at once.
+
+        Returns:
+            dict: the count of mails sent and the recipients and errors of the
+                mails that failed.
+        """
+        chunks = [
+            chunk for chunk in (mails[index::concurrency]
+                                for index in range(concurrency)) if chunk
+        ]
+        app = current_app._get_current_object() if has_app_context() \
+            else None
+
+        def send_chunk(chunk):
+            if app is None:
+                return cls.send_chunk(chunk)
+            with app.app_context():
+                return cls.send_chunk(chunk)
+
+        failures = []
+        if chunks:
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                for chunk_failures in executor.map(send_chunk, chunks):
+                    failures.extend(chunk_failures)
+
+        return {'sent': len(mails) - len(failures), 'failures': failures}
+
+    @classmethod
+    def send_chunk(cls, mails):
+        """Class Method for sending template emails one after the other
+
+        Override in the subclass to share a connection between the mails.
+
+        Args:
+            mails (list): the keyword arguments of `send_mail_with_template`
+                of each mail.
+
+        Returns:
+            list: the recipients and errors of the mails that failed.
+        """
+        failures = []
+        for mail in mails:
+            try:
+                if cls.send_mail_with_template(**mail) is False:
+                    failures.append(get_failure(mail, 'not sent'))
+            except Exception as error:
+                failures.append(get_failure(mail, error))
+        return failures
+
+
+def get_failure(mail, error):
+    """Function for describing a mail that could not be sent
+
+    Args:
+        mail (dict): the keyword arguments of the mail.
+        error (Exception|str): the reason the mail was not sent.
+
+    Returns:
+        dict: the recipient and the error of the mail.
+    """
+    return {'recipient': mail.get('recipient'), 'error': str(error)}
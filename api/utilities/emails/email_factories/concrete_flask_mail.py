@@ -5,7 +5,8 @@ from flask import current_app
 from flask_mail import Message, Mail
 
 # Utilities
-from api.utilities.emails.email_factories.abstract_send_email import AbstractSendEmail
+from api.utilities.emails.email_factories.abstract_send_email import (
+    AbstractSendEmail, get_failure)
 
 class ConcreteFlaskMail(AbstractSendEmail):
     """Concrete class for sending emails using Flask_Mail"""
@@ -22,37 +23,83 @@ class ConcreteFlaskMail(AbstractSendEmail):
         """
         return cls.send({
             'subject': mail_subject,
-            'recipient': recipient,
+            'recipients': [recipient],
             'body': mail_body
         })
 
     @classmethod
-    def send_mail_with_html_template(cls, recipient, mail_subject, mail_html_body):
+    def send_mail_with_html_template(cls,
+                                     recipient,
+                                     mail_subject,
+                                     mail_html_body,
+                                     connection=None):
         """Method for sending email using with an html using Flask_Mail API
 
         Args:
             recipient (str): the recipient address
             mail_subject (str): the email subject.
             mail_html_body (str): the string representing the html that is to be passed to the body of the email.
+            connection (Connection): an open SMTP connection to send over.
 
         """
 
         message = {
             'subject': mail_subject,
-            'recipient': recipient,
+            'recipients': [recipient],
             'html': mail_html_body
         }
 
-        return cls.send(message)
+        return cls.send(message, connection)
 
     @classmethod
-    def send(cls, mail):
+    def send_mail_with_template(cls, *args, **kwargs):
+        """Method for sending email using with an html using Flask_Mail API
+
+        The template is rendered by the caller, so this sends the rendered
+        html like `send_mail_with_html_template`.
+        """
+        return cls.send_mail_with_html_template(*args, **kwargs)
+
+    @classmethod
+    def send(cls, mail, connection=None):
         """Method that handles sending mail using FlaskMail API
 
         Args:
             mail (instance): an instance of flask_mail's Message class.
+            connection (Connection): an open SMTP connection to send over.
+                A connection is opened for the mail when not given.
         """
+        if connection is not None:
+            return connection.send(Message(**mail))
+
         with current_app.app_context():
             flask_mail = Mail(current_app)
 
         return flask_mail.send(Message(**mail))
+
+    @classmethod
+    def send_chunk(cls, mails):
+        """Method that sends template emails over one SMTP connection
+
+        Args:
+            mails (list): the keyword arguments of `send_mail_with_template`
+                of each mail.
+
+        Returns:
+            list: the recipients and errors of the mails that failed.
+        """
+        failures = []
+        sent = 0
+        try:
+            with Mail(current_app).connect() as connection:
+                for mail in mails:
+                    try:
+                        cls.send_mail_with_template(
+                            connection=connection, **mail)
+                    except Exception as error:
+                        failures.append(get_failure(mail, error))
+                    sent += 1
+        except Exception as error:
+            # the connection could not be opened or was dropped
+            failures.extend(get_failure(mail, error) for mail in mails[sent:])
+        return failures
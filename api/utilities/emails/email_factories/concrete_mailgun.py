@@ -1,7 +1,7 @@
 import requests
 
 from api.utilities.emails.email_factories.abstract_send_email import (
-    AbstractSendEmail)
+    AbstractSendEmail, get_failure)
 
 # app config
 from config import AppConfig
@@ -40,7 +40,8 @@ class ConcreteMailgunEmail(AbstractSendEmail):
                                 recipient,
                                 mail_subject,
                                 mail_html_body,
-                                attachments=None):
+                                attachments=None,
+                                session=None):
         """Class method for sending template emails using Mailgun API
 
        Args:
@@ -48,6 +49,7 @@ class ConcreteMailgunEmail(AbstractSendEmail):
            mail_subject (str): the email subject.
            mail_html_body(str): the email html body.
            attachments(tuple): list of attachments
+           session(Session): an open requests session to send over
 
        Returns:
            dict: returns a dictionary id and message on success.
@@ -61,20 +63,22 @@ class ConcreteMailgunEmail(AbstractSendEmail):
             'html': mail_html_body,
         }
 
-        return cls.send(mail, attachments)
+        return cls.send(mail, attachments, session)
 
     @classmethod
-    def send(cls, mail, attachments=None):
+    def send(cls, mail, attachments=None, session=None):
         """Class Method that handles sending mail using Mailgun API
 
         Args:
             mail(dict): a dictionary containing sender,recipient and mail body.
             attachments(tuple) a list of attachments
+            session(Session): an open requests session to send over. A new
+                connection is made for the mail when not given.
         Returns:
             dict: returns a dictionary id and message on success.
             Bool: returns a boolean False on failure.
         """
-        response = requests.post(
+        response = (session or requests).post(
             cls.REQUEST_URL,
             files=attachments,
             auth=('api', cls.MAILGUN_API_KEY),
@@ -82,3 +86,24 @@ class ConcreteMailgunEmail(AbstractSendEmail):
         if response.status_code == 200:
             return response.json()
         return False
+
+    @classmethod
+    def send_chunk(cls, mails):
+        """Class Method that sends template emails over one HTTP session
+
+        Args:
+            mails(list): the keyword arguments of `send_mail_with_template`
+                of each mail.
+        Returns:
+            list: the recipients and errors of the mails that failed.
+        """
+        failures = []
+        with requests.Session() as session:
+            for mail in mails:
+                try:
+                    if cls.send_mail_with_template(
+                            session=session, **mail) is False:
+                        failures.append(get_failure(mail, 'not sent'))
+                except Exception as error:
+                    failures.append(get_failure(mail, error))
+        return failures
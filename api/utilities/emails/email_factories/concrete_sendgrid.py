@@ -11,7 +11,8 @@ import sendgrid
 from sendgrid.helpers.mail import Email, Content, Mail, Personalization
 
 # Utilities
-from api.utilities.emails.email_factories.abstract_send_email import AbstractSendEmail
+from api.utilities.emails.email_factories.abstract_send_email import (
+    AbstractSendEmail, get_failure)
 
 # App AppConfig
 from config import AppConfig
@@ -22,6 +23,7 @@ class ConcreteSendGridEmail(AbstractSendEmail):
     SENDGRID_CLIENT = sendgrid.SendGridAPIClient(AppConfig.SENDGRID_API_KEY)
     DEFAULT_SENDER = Email(AppConfig.ACTIVO_MAIL_USERNAME)
     MAX_RESEND_TRIALS = 20
+    MAX_PERSONALIZATIONS = 1000
 
     @classmethod
     def send_mail_without_template(cls, recipient, mail_subject, mail_body):
@@ -68,6 +70,51 @@ class ConcreteSendGridEmail(AbstractSendEmail):
 
         return cls.send(mail)
 
+    @classmethod
+    def send_chunk(cls, mails):
+        """Class method for sending template emails in as few requests as
+        possible
+
+        The mails of the same template are sent in one request with a
+        personalization for each recipient. SendGrid rejects the whole
+        request when one personalization is invalid, so the mails of a
+        rejected request are then sent one by one.
+
+       Args:
+           mails (list): the keyword arguments of `send_mail_with_template`
+                of each mail.
+
+       Returns:
+           list: the recipients and errors of the mails that failed.
+       """
+        templates = {}
+        for mail in mails:
+            templates.setdefault(mail['template_id'], []).append(mail)
+
+        failures = []
+        for template_id, template_mails in templates.items():
+            for start in range(0, len(template_mails),
+                               cls.MAX_PERSONALIZATIONS):
+                batch = template_mails[start:start + cls.MAX_PERSONALIZATIONS]
+                mail = Mail()
+                mail.from_email = cls.DEFAULT_SENDER
+                mail.template_id = template_id
+                for template_mail in batch:
+                    p = Personalization()
+                    p.add_to(Email(template_mail['recipient']))
+                    p.dynamic_template_data = template_mail['template_data']
+                    mail.add_personalization(p)
+
+                try:
+                    cls.post(mail)
+                except BadRequestsError:
+                    failures.extend(super().send_chunk(batch))
+                except Exception as error:
+                    failures.extend(
+                        get_failure(template_mail, error)
+                        for template_mail in batch)
+        return failures
+
     @classmethod
     def send(cls, mail, trials=6):
         """Class Method that handles sending mail using SendGrid API
@@ -81,17 +128,31 @@ class ConcreteSendGridEmail(AbstractSendEmail):
             Bool: returns a boolean False on failure.
 
         """
-        response = False
         try:
-            response = cls.SENDGRID_CLIENT.client.mail.send.post(
-                request_body=mail.get())
-
+            return cls.post(mail, trials)
         except (BadRequestsError, UnauthorizedError, UnsupportedMediaTypeError,
-                ForbiddenError, PayloadTooLargeError, InternalServerError):
-            pass
+                ForbiddenError, PayloadTooLargeError, InternalServerError,
+                GatewayTimeoutError):
+            return False
+
+    @classmethod
+    def post(cls, mail, trials=6):
+        """Class Method that posts a mail to the SendGrid API
+
+        Args:
+            mail (instance): an instance of SendGrid's Mail class.
+            trials (int): The maximum number OF time the email submit resent incase a GatewayTimeoutError is raised.
+
+        Returns:
+            dict: returns a dictionary containing status, headers and body.
+
+        Raises:
+            HTTPError: the error of the API once the trials are exhausted.
+        """
+        try:
+            return cls.SENDGRID_CLIENT.client.mail.send.post(
+                request_body=mail.get())
         except GatewayTimeoutError:
             if not (0 <= trials <= cls.MAX_RESEND_TRIALS):
-                return False
-            return cls.send(mail=mail, trials=trials - 1)
-
-        return response
+                raise
+            return cls.post(mail=mail, trials=trials - 1)
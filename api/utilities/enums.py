@@ -258,3 +258,11 @@ class AssetSupportingDocumentTypeEnum(Enum):
     """ Asset Supporting document type enum """
     purchase_receipts = 'purchase receipts'
     repair_receipts = 'repair receipts'
+
+
+class ExportJobStatusEnum(Enum):
+    """ Export job status enum """
+    pending = 'pending'
+    running = 'running'
+    completed = 'completed'
+    failed = 'failed'
@@ -1,5 +1,4 @@
-from flask import request
-from api.models import User
+from api.utilities.helpers.identity import get_identity
 
 
 def add_center_to_query(query, model='assets'):
@@ -7,19 +6,20 @@ def add_center_to_query(query, model='assets'):
     Args:
         query (str): SQL query string
     Returns:
-        (str): SQL query with center_id if user is not a super_user
+        (tuple): SQL query with a `:center_id` bind parameter if user is not
+            a super_user and the value of the parameter
     """
-    user = User.get(request.decoded_token['UserInfo']['id'])
-    if not user.role.super_user:
+    user = get_identity()
+    if not user.is_super_user:
         if model == 'assets':
             query = query.replace('AND asset.center_id IS NOT NULL',
-                                  "AND asset.center_id ='{}'".format(user.center_id))
-            
+                                  'AND asset.center_id = :center_id')
+
             query = query.replace('AND stock_counts.center_id IS NOT NULL',
-                                  "AND stock_counts.center_id ='{}'".format(user.center_id))
+                                  'AND stock_counts.center_id = :center_id')
 
         if model == 'requests':
             query = query.replace('r.center_id IS NOT NULL',
-                                  "r.center_id ='{}'".format(user.center_id))
-        return query
-    return query
+                                  'r.center_id = :center_id')
+        return query, {'center_id': user.center_id}
+    return query, {}
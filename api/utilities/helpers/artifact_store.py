@@ -0,0 +1,209 @@
+"""Module for the files of export jobs"""
+
+# Standard library
+import gzip
+import os
+import time
+
+# Third party
+import xlsxwriter
+
+# Constants
+from ..constants import EXPORT_JOB_EXPIRY
+
+# Utilities
+from .csv_export import check_headers, csv_rows
+
+# app config
+from config import AppConfig
+
+
+class ArtifactStore:
+    """Local store for the files written by export jobs
+
+    csv exports are gzip compressed and xlsx exports are written in constant
+    memory mode, so only one chunk of records is held in memory while a file
+    is written. Files older than `expiry` seconds are considered gone.
+
+    attributes:
+        root (str): the directory the files are written to
+        expiry (int): seconds a file is kept for
+    """
+
+    extensions = {'csv': 'csv.gz', 'xlsx': 'xlsx'}
+
+    def __init__(self, root=None, expiry=EXPORT_JOB_EXPIRY):
+        self.root = root or AppConfig.EXPORT_ARTIFACT_DIR
+        self.expiry = expiry
+
+    def get_path(self, job_id, file_format):
+        """Gets the path of the file of an export job
+
+        Args:
+            job_id (str): the id of the export job
+            file_format (str): csv or xlsx
+
+        Returns:
+            str: the path of the file
+        """
+        return os.path.join(self.root,
+                            f'{job_id}.{self.extensions[file_format]}')
+
+    def write(self, job_id, file_format, chunks, headers, on_chunk=None):
+        """Writes the chunks of records of an export job to a file
+
+        The file is written under a temporary name and renamed when complete
+        so a partially written export is never served.
+
+        Args:
+            job_id (str): the id of the export job
+            file_format (str): csv or xlsx
+            chunks (iterable): lists of records (dict) to write
+            headers (list): the columns of the export
+            on_chunk (function): called with the count of records written
+                after each chunk
+
+        Returns:
+            str: the path of the file
+        """
+        os.makedirs(self.root, exist_ok=True)
+        path = self.get_path(job_id, file_format)
+        partial_path = f'{path}.part'
+
+        chunks = self.count_records(chunks, on_chunk)
+        if file_format == 'xlsx':
+            self.write_xlsx(partial_path, chunks, headers)
+        else:
+            self.write_csv(partial_path, chunks, headers)
+
+        os.replace(partial_path, path)
+        return path
+
+    @staticmethod
+    def count_records(chunks, on_chunk):
+        """Reports the count of records written after each chunk
+
+        Args:
+            chunks (iterable): lists of records (dict)
+            on_chunk (function): called with the count of records written
+
+        Yields:
+            list: a chunk of records
+        """
+        count = 0
+        for chunk in chunks:
+            yield chunk
+            count += len(chunk)
+            if on_chunk:
+                on_chunk(count)
+
+    @staticmethod
+    def write_csv(path, chunks, headers):
+        """Writes chunks of records to a gzip compressed csv file
+
+        Args:
+            path (str): the path of the file
+            chunks (iterable): lists of records (dict) to write
+            headers (list): the csv columns
+
+        Raises:
+            ValueError: if the first record has a key missing from the headers
+        """
+        chunks = check_headers(chunks, headers)
+        with gzip.open(path, 'wt', encoding='utf-8', newline='') as csv_file:
+            for text in csv_rows(chunks, headers):
+                csv_file.write(text)
+
+    @staticmethod
+    def write_xlsx(path, chunks, headers):
+        """Writes chunks of records to a xlsx file
+
+        Args:
+            path (str): the path of the file
+            chunks (iterable): lists of records (dict) to write
+            headers (list): the sheet columns
+
+        Raises:
+            ValueError: if a record has a key missing from the headers
+        """
+        workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, headers)
+        columns = set(headers)
+        row = 1
+
+        for chunk in chunks:
+            for record in chunk:
+                extra_keys = record.keys() - columns
+                if extra_keys:
+                    raise ValueError('record contains fields not in headers: '
+                                     f'{sorted(extra_keys)}')
+                worksheet.write_row(row, 0, [
+                    ArtifactStore.cell_value(record.get(header))
+                    for header in headers
+                ])
+                row += 1
+
+        workbook.close()
+
+    @staticmethod
+    def cell_value(value):
+        """Converts a record value to a value xlsxwriter can write
+
+        Args:
+            value: the value of a record
+
+        Returns:
+            str|int|float|bool: the value of the cell
+        """
+        if value is None:
+            return ''
+        if isinstance(value, (str, int, float)):
+            return value
+        return str(value)
+
+    def get(self, job_id, file_format):
+        """Gets the path of the file of an export job if it has not expired
+
+        Args:
+            job_id (str): the id of the export job
+            file_format (str): csv or xlsx
+
+        Returns:
+            str: the path of the file or None
+        """
+        path = self.get_path(job_id, file_format)
+        if os.path.isfile(path) and not self.is_expired(path):
+            return path
+        return None
+
+    def is_expired(self, path):
+        """Checks if a file is older than the expiry of the store
+
+        Args:
+            path (str): the path of the file
+
+        Returns:
+            bool: True if the file has expired otherwise False
+        """
+        return time.time() - os.path.getmtime(path) > self.expiry
+
+    def purge_expired(self):
+        """Deletes the expired files of the store
+
+        Returns:
+            int: the count of files deleted
+        """
+        if not os.path.isdir(self.root):
+            return 0
+
+        purged = 0
+        for file_name in os.listdir(self.root):
+            path = os.path.join(self.root, file_name)
+            if os.path.isfile(path) and self.is_expired(path):
+                os.remove(path)
+                purged += 1
+        return purged
+
+
+artifact_store = ArtifactStore()
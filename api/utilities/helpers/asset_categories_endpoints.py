@@ -3,20 +3,16 @@ Asset categories endpoints helpers
 """
 
 # Third Party Library
-from sqlalchemy import text
 from sqlalchemy.orm import column_property
 from flask import request
 from werkzeug.datastructures import ImmutableMultiDict
 
-# Database
-from api.models.database import db
-
 # Model
 from api.models import AssetCategory
 
 # Utilities
 from ..sql_queries import sql_queries
-from ..sql_constants import start, end
+from ..prepared_statements import execute_query
 from ..paginator import (generate_metadata, pagination_helper)
 from api.utilities.helpers.resource_manipulation import get_all_resources
 from ...schemas.asset_category import (
@@ -82,9 +78,10 @@ def sideload_with_attributes_and_stats():
 def get_single_asset_category_stats(id):
 
     # get sql query text
-    sql = add_center_to_query(sql_queries['single_category_stats'])
+    sql, center_params = add_center_to_query(
+        sql_queries['single_category_stats'])
 
-    record = db.engine.execute(text(sql), cat_id=id).fetchone()
+    record = execute_query(sql, cat_id=id, **center_params).fetchone()
 
     # serialize records with schema
     data = AssetCategoryStatsSchema().dump(record).data
@@ -124,31 +121,31 @@ def process_query(sql, model, schema, **kwargs):
     request_args_copy = request.args
     if kwargs.get('skip_filter', False):
         request.args = ImmutableMultiDict([])
-    filter = SQLDynamicFilter(model) \
+    filter, filter_params = SQLDynamicFilter(model) \
         .sql_query_filter(request.args)
     # get query parameters
     sort, order = get_sort_args()
 
-    # get sql query text
-    sql = add_center_to_query(sql)
-    sql = text(
-        sql.format(
-            filter=filter,
-            sort=sort,
-            order=order,
-            startDate=kwargs.get('startDate', start),
-            endDate=kwargs.get('endDate', end)))
-
-    sql_count = text(sql_queries['asset_categories_count'])
+    # get sql query text, only the identifiers of the sort are formatted in
+    sql, center_params = add_center_to_query(sql)
+    sql = sql.format(filter=filter, sort=sort, order=order)
 
     # get full count of asset categories
-    full_count = db.engine.execute(sql_count).fetchone().count
+    full_count = execute_query(
+        sql_queries['asset_categories_count']).fetchone().count
 
     # get pagination meta data
     request.args = request_args_copy
     limit, offset, pagination_meta = generate_metadata(full_count)
-    params = {'limit': limit, 'offset': offset}
-    records = db.engine.execute(sql, **params).fetchall()
+    params = {
+        'limit': limit,
+        'offset': offset,
+        'start_date': kwargs.get('startDate'),
+        'end_date': kwargs.get('endDate'),
+        **filter_params,
+        **center_params
+    }
+    records = execute_query(sql, **params).fetchall()
     data = schema(many=True).dump(records).data
 
     return data, pagination_meta
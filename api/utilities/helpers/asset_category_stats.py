@@ -0,0 +1,154 @@
+"""
+Module for maintaining the asset category stats tables
+"""
+# Third party
+from sqlalchemy import text
+from sqlalchemy.orm import attributes
+
+# Utilities
+from ..sql_queries import sql_queries
+from ..sql_constants import STATS_CATEGORY_FILTER
+
+# the asset columns the stats of an asset are counted under
+STATS_KEY_COLUMNS = [
+    'asset_category_id', 'center_id', 'status', 'assignee_type', 'deleted'
+]
+
+# the server defaults of the columns, which are not loaded after an insert
+STATS_KEY_DEFAULTS = {'status': 'ok', 'assignee_type': 'space', 'deleted': False}
+
+
+def get_stats_key(target, previous=False, inserted=False):
+    """Gets the stats row an asset is counted under
+
+    Args:
+        target (Asset): the asset
+        previous (bool): whether to get the row of the values the asset had
+            before the current flush
+        inserted (bool): whether the asset has just been inserted
+
+    Returns:
+        dict: the columns of the stats row or None if the asset is deleted
+    """
+    values = {}
+    for column in STATS_KEY_COLUMNS:
+        history = attributes.get_history(target, column)
+        if previous and history.deleted:
+            values[column] = history.deleted[0]
+        elif inserted:
+            value = target.__dict__.get(column)
+            values[column] = STATS_KEY_DEFAULTS.get(column) \
+                if value is None else value
+        else:
+            values[column] = getattr(target, column)
+
+    if values.pop('deleted'):
+        return None
+
+    assignee_type = values['assignee_type']
+    values['assignee_type'] = getattr(assignee_type, 'name', assignee_type)
+    values['center_id'] = values['center_id'] or ''
+    return values
+
+
+def increment_stats(connection, stats_key, delta):
+    """Adds a delta to the count of assets of a stats row
+
+    Args:
+        connection (Connection): the connection of the flush
+        stats_key (dict): the columns of the stats row
+        delta (int): the count of assets to add
+    """
+    if stats_key:
+        connection.execute(
+            text(sql_queries['increment_asset_category_stats']),
+            delta=delta,
+            **stats_key)
+
+
+def receive_asset_insert(mapper, connection, target):
+    """Counts an inserted asset in the stats"""
+    increment_stats(connection, get_stats_key(target, inserted=True), 1)
+
+
+def receive_asset_update(mapper, connection, target):
+    """Moves an updated asset to the stats row of its new values"""
+    previous_key = get_stats_key(target, previous=True)
+    current_key = get_stats_key(target)
+    if previous_key != current_key:
+        increment_stats(connection, previous_key, -1)
+        increment_stats(connection, current_key, 1)
+
+
+def receive_asset_delete(mapper, connection, target):
+    """Removes a deleted asset from the stats"""
+    increment_stats(connection, get_stats_key(target, previous=True), -1)
+
+
+def receive_stock_count_change(mapper, connection, target):
+    """Rebuilds the last stock count of the asset category of a stock count"""
+    category_ids = {target.asset_category_id}
+    previous_category_ids = attributes.get_history(target,
+                                                   'asset_category_id').deleted
+    category_ids.update(previous_category_ids or [])
+    rebuild_last_stock(connection, list(category_ids))
+
+
+def rebuild_asset_stats(connection, category_ids=None):
+    """Recounts the assets of asset categories from the asset table
+
+    Args:
+        connection (Connection|Session): the connection to execute with
+        category_ids (list): the asset categories to recount. All the asset
+            categories are recounted when not given
+    """
+    rebuild_stats_table(connection, 'asset_category_stats', 'asset',
+                        category_ids)
+
+
+def rebuild_last_stock(connection, category_ids=None):
+    """Rebuilds the last stock counts of asset categories
+
+    Args:
+        connection (Connection|Session): the connection to execute with
+        category_ids (list): the asset categories to rebuild. All the asset
+            categories are rebuilt when not given
+    """
+    rebuild_stats_table(connection, 'asset_category_last_stock',
+                        'stock_counts', category_ids)
+
+
+def rebuild_stats_table(connection, table, source_table, category_ids=None):
+    """Deletes and recomputes the rows of a stats table
+
+    Args:
+        connection (Connection|Session): the connection to execute with
+        table (str): the stats table
+        source_table (str): the table the stats are computed from
+        category_ids (list): the asset categories to rebuild
+    """
+    params = {}
+    table_filter = source_filter = ''
+    if category_ids is not None:
+        params['category_ids'] = category_ids
+        table_filter = STATS_CATEGORY_FILTER.format(table=table)
+        source_filter = STATS_CATEGORY_FILTER.format(table=source_table)
+
+    connection.execute(
+        text(sql_queries[f'clear_{table}'].format(filter=table_filter)),
+        **params)
+    connection.execute(
+        text(sql_queries[f'rebuild_{table}'].format(filter=source_filter)),
+        **params)
+
+
+def rebuild_asset_category_stats(connection, category_ids=None):
+    """Rebuilds all the maintained stats of asset categories
+
+    Args:
+        connection (Connection|Session): the connection to execute with
+        category_ids (list): the asset categories to rebuild. All the asset
+            categories are rebuilt when not given
+    """
+    rebuild_asset_stats(connection, category_ids)
+    rebuild_last_stock(connection, category_ids)
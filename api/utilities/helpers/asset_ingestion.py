@@ -0,0 +1,178 @@
+"""Module for inserting validated assets in bulk with set based SQL"""
+
+# Standard library
+import json
+from datetime import datetime
+from io import StringIO
+
+# Third party
+from sqlalchemy import text
+
+# Database
+from api.models.database import db
+
+# Utilities
+from ..enums import AssetStatus
+from ..sql_queries import sql_queries
+from ..constants import PERMISSION_TYPES
+from ..history.activity_tracker import ActivityTracker
+from .asset_category_stats import rebuild_asset_stats
+
+# Messages
+from ..messages.error_messages import serialization_errors
+from ..messages.success_messages import HISTORY_MESSAGES
+
+# the asset columns copied into the staging table and inserted from it
+INGESTION_COLUMNS = ('id', 'tag', 'asset_category_id', 'center_id',
+                     'assignee_id', 'assignee_type', 'status',
+                     'custom_attributes', 'assigned_by', 'date_assigned',
+                     'created_by', 'created_at', 'deleted')
+
+
+def to_staging_row(asset, ordinal):
+    """Converts an asset into the csv line copied into the staging table
+
+    Every value is quoted since an unquoted empty value is copied as NULL,
+    so only the missing values are NULLs and empty strings stay empty like
+    when the ORM inserts them.
+
+    Args:
+        asset (dict): the columns of the asset
+        ordinal (int): the position of the asset in the upload
+
+    Returns:
+        str: the csv line of the ingestion columns and the ordinal
+    """
+    row = []
+    for column in INGESTION_COLUMNS:
+        value = asset.get(column)
+        if column == 'custom_attributes' and value is not None:
+            value = json.dumps(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        row.append('' if value is None else
+                   '"{}"'.format(str(value).replace('"', '""')))
+    row.append(str(ordinal))
+    return ','.join(row) + '\n'
+
+
+def prepare_assets(assets, assigned_by=None):
+    """Fills the columns the ORM would set when inserting the assets
+
+    Args:
+        assets (list): dicts of the validated columns of the assets
+        assigned_by (str): the name of the user assigning the assets
+
+    Returns:
+        list: the assets with their ids and defaults set
+    """
+    # imported here to avoid looping imports
+    from api.models import PushID
+
+    push_id = PushID()
+    created_at = datetime.utcnow()
+    prepared = []
+    for asset in assets:
+        asset = {
+            column: value
+            for column, value in asset.items() if column in INGESTION_COLUMNS
+        }
+        asset.update({
+            'id': push_id.next_id(),
+            'status': (asset.get('status') or AssetStatus.OK.value).lower(),
+            'assigned_by': assigned_by or asset.get('assigned_by'),
+            'created_at': created_at,
+            'deleted': False
+        })
+        prepared.append(asset)
+    return prepared
+
+
+def copy_to_staging(connection, assets):
+    """Copies the assets into a staging table dropped on commit
+
+    Args:
+        connection (Connection): the connection of the current transaction
+        assets (list): the prepared assets
+    """
+    connection.execute(text(sql_queries['create_asset_staging']))
+
+    buffer = StringIO()
+    buffer.writelines(
+        to_staging_row(asset, ordinal)
+        for ordinal, asset in enumerate(assets))
+    buffer.seek(0)
+
+    cursor = connection.connection.cursor()
+    cursor.copy_expert(
+        sql_queries['copy_asset_staging'].format(
+            columns=', '.join(INGESTION_COLUMNS + ('ordinal', ))), buffer)
+
+
+def ingest_assets(assets, actor_id=None, assigned_by=None):
+    """Inserts validated assets in one statement
+
+    The assets are copied into a staging table where store assignees are
+    resolved and assets whose assignee does not exist are removed, then the
+    rest are inserted in one statement skipping tags that already exist.
+    Of the assets sharing a tag in the upload, the first one is inserted.
+    The history of the assets and the asset category stats are written in
+    bulk since the per row ORM events do not fire.
+
+    Args:
+        assets (list): dicts of the validated columns of the assets
+        actor_id (str): the token id of the user adding the assets. No
+            history is recorded when not given
+        assigned_by (str): the name of the user assigning the assets
+
+    Returns:
+        tuple: the ids of the inserted assets in the order they were given
+            and the skipped assets with their errors
+    """
+    assets = prepare_assets(assets, assigned_by)
+    if not assets:
+        return [], []
+
+    connection = db.session.connection()
+    copy_to_staging(connection, assets)
+    connection.execute(text(sql_queries['resolve_staged_store_assignees']))
+    missing_assignees = {
+        row.id
+        for row in connection.execute(
+            text(sql_queries['delete_staged_missing_assignees']))
+    }
+    inserted = {
+        row.id
+        for row in connection.execute(
+            text(sql_queries['insert_staged_assets'].format(
+                columns=', '.join(INGESTION_COLUMNS))))
+    }
+
+    inserted_ids, skipped = [], []
+    for asset in assets:
+        if asset['id'] in inserted:
+            inserted_ids.append(asset['id'])
+        elif asset['id'] in missing_assignees:
+            skipped.append((asset, {
+                'assigneeId': [serialization_errors['assignee_not_found']]
+            }))
+        else:
+            skipped.append((asset, {
+                'tag': [serialization_errors['exists'].format('Tag')]
+            }))
+
+    if actor_id:
+        ActivityTracker.insert_histories([{
+            'resource_id': asset_id,
+            'resource_type': 'Asset',
+            'actor_id': actor_id,
+            'action': PERMISSION_TYPES['POST'],
+            'activity': HISTORY_MESSAGES['added_resource']
+        } for asset_id in inserted_ids], db.session)
+
+    if inserted_ids:
+        category_ids = {asset['asset_category_id'] for asset in assets}
+        rebuild_asset_stats(db.session, list(category_ids))
+
+    db.session.commit()
+    return inserted_ids, skipped
@@ -1,12 +1,178 @@
 """Module for validating multiple asset"""
 
-import sqlalchemy as sa
+from datetime import datetime
 
-from api.models import Asset, AssetCategory, Space
-from api.models.database import db
+from flask import request
+from marshmallow import ValidationError
+from sqlalchemy import func
+from sqlalchemy.orm import joinedload
+
+from api.models import Asset, AssetCategory, Center, Space, User
+from api.utilities.enums import AssigneeType
+from api.utilities.error import raise_error
+from api.utilities.helpers.existing_values import get_existing_values
+from api.utilities.messages.error_messages import serialization_errors
 from api.utilities.messages.error_messages import serialization_error
 from api.utilities.messages.error_messages.serialization_error import error_dict as serial_dict
 from api.utilities.validators.bulk_asset_custom_validator import ValidateAssetsCustomField
+from api.utilities.validators.validate_id import is_valid_id
+
+
+class BulkAssetLookup:
+    """Resolves the spaces, assignees and centers referenced by a batch of
+    assets with one query per set, so validating the assets does not query
+    the database for each asset"""
+
+    def __init__(self, raw_assets):
+        """Resolves the space names the assets are assigned to
+        Args:
+            raw_assets(list): the assets to be posted
+        """
+        self.assets = [
+            asset for asset in raw_assets or [] if isinstance(asset, dict)
+        ]
+        self.spaces_by_name = self.get_spaces_by_name({
+            asset.get('assignee').lower()
+            for asset in self.assets
+            if str(asset.get('assigneeType', '')).lower() == 'space'
+            and isinstance(asset.get('assignee'), str)
+        })
+        self.users, self.spaces = {}, {}
+        self.existing_spaces, self.existing_centers = set(), set()
+        self._requester = None
+
+    @staticmethod
+    def get_spaces_by_name(names):
+        """Gets the spaces with the given names ignoring case
+        Args:
+            names(set): lowercase space names
+        Returns:
+            dict: the first space with each name keyed by the lowercase name,
+                None for the names no space has
+        """
+        spaces = dict.fromkeys(names)
+        if names:
+            for space in Space.query_().filter(
+                    func.lower(Space.name).in_(names)):
+                spaces[space.name.lower()] = spaces.get(
+                    space.name.lower()) or space
+        return spaces
+
+    def get_space_by_name(self, name):
+        """Gets a space by its name ignoring case
+        Args:
+            name(str): the name of the space
+        Returns:
+            Space: the space or None if there is no space with the name
+        """
+        if not isinstance(name, str):
+            return None
+        if name.lower() not in self.spaces_by_name:
+            self.spaces_by_name.update(self.get_spaces_by_name({name.lower()}))
+        return self.spaces_by_name.get(name.lower())
+
+    def load(self):
+        """Resolves the assignees and centers of the assets once the space
+        names have been converted to assignee ids"""
+        assignee_ids = {
+            asset.get('assigneeId')
+            for asset in self.assets if isinstance(asset.get('assigneeId'), str)
+        }
+        center_ids = {
+            asset.get('centerId')
+            for asset in self.assets if isinstance(asset.get('centerId'), str)
+        }
+        if assignee_ids:
+            self.users = {
+                user.token_id: user
+                for user in User.query.filter(User.token_id.in_(assignee_ids))
+            }
+            self.spaces = {
+                space.id: space
+                for space in Space.query_().options(
+                    joinedload(Space.space_type)).filter(
+                        Space.id.in_(assignee_ids))
+            }
+            self.existing_spaces = get_existing_values(
+                Space.id, assignee_ids, Space.query)
+        self.existing_centers = get_existing_values(Center.id, center_ids,
+                                                    Center.query)
+
+    @property
+    def requester(self):
+        """The user posting the assets"""
+        if self._requester is None:
+            self._requester = User.get(
+                request.decoded_token['UserInfo']['id'])
+        return self._requester
+
+    def validate_center_id(self, center_id):
+        """Validates that the center of an asset exists
+        Args:
+            center_id(str): the center id
+        Raises:
+            ValidationError: if the id is invalid or the center does not exist
+        """
+        if not is_valid_id(center_id):
+            raise_error('invalid_id_field')
+        if center_id not in self.existing_centers:
+            raise_error('not_found', 'Center')
+
+    def validate_assignee_id(self, assignee_id):
+        """Validates that the assignee of an asset exists
+        Args:
+            assignee_id(str): the user token id or space id
+        Raises:
+            ValidationError: if the id is invalid or the assignee does not
+                exist
+        """
+        if not is_valid_id(assignee_id):
+            raise_error('invalid_assignee_id')
+        if assignee_id not in self.existing_spaces \
+                and assignee_id not in self.users:
+            raise_error('assignee_not_found')
+
+    def get_assignee(self, assignee_type, assignee_id):
+        """Gets the assignee of an asset
+        Args:
+            assignee_type(str): user, space or store
+            assignee_id(str): the user token id or space id
+        Returns:
+            User|Space: the assignee or None if it was not found
+        """
+        if assignee_type == AssigneeType.user.value:
+            return self.users.get(assignee_id)
+        return self.spaces.get(assignee_id)
+
+    def validate_assignee(self, data):
+        """Validates the assignee of an asset and sets its assignee type
+        Args:
+            data(dict): the deserialized asset
+        Raises:
+            ValidationError: if the assignee does not match the assignee type
+                or the space is not in the center of the asset
+        """
+        assignee_id = data.get('assignee_id')
+        assignee_type = data.get('assignee_type', '').lower()
+        if not assignee_id or not assignee_type:
+            return
+
+        assignee = self.get_assignee(assignee_type, assignee_id)
+        if not assignee:
+            raise_error('non_matching_assignee_type', fields=['assigneeType'])
+
+        if isinstance(assignee, Space):
+            center_id = data.get('center_id')
+            if center_id and center_id != assignee.center_id:
+                raise ValidationError(serialization_errors['not_in_center'],
+                                      ['assigneeId'])
+            if assignee_type == AssigneeType.space.value \
+                    and assignee.space_type.type.lower() == \
+                    AssigneeType.store.value:
+                assignee_type = AssigneeType.store.value
+
+        data['assignee_type'] = assignee_type
+        data['date_assigned'] = datetime.now()
 
 
 class BulkAssetValidator:
@@ -58,26 +224,13 @@ class BulkAssetValidator:
             assets_sets.add(asset.get("tag"))
 
     def get_all_duplicate_assets(self):
-        """pass in a list containing a list of tuple with return the queries
+        """Gets the tags of the assets that are already in the database
         Returns:
             db_repeated_tags(set) Set of tags that has been matched with what
              is in the database
         """
-        stmts = [
-            # @NOTE: optimization to reduce the size of the statement:
-            # make type cast only for first row, for other rows DB engine will infer
-            sa.select([
-                sa.cast(sa.literal(tag), sa.String).label("tag"),
-            ]) if idx == 0 else sa.select([sa.literal(tag)])  # no type cast
-            for idx, (tag) in enumerate(self.get_raw_tags())
-        ]
-        subquery = sa.union_all(*stmts)
-        subquery = subquery.cte(name="temp_table")  # option B
-        query = (db.session.query(Asset.tag).join(subquery,
-                                                  subquery.c.tag == Asset.tag))
-        # format the list of tuples(with tags) to a set of tags assets
-        db_repeated_tags = {tag[0] for tag in query.all()}
-        return db_repeated_tags
+        tags = [tag for (tag, ) in self.get_raw_tags()]
+        return get_existing_values(Asset.tag, tags)
 
 
 class BulkAssetHelper(BulkAssetValidator):
@@ -90,6 +243,7 @@ class BulkAssetHelper(BulkAssetValidator):
         self.asset_schema = asset_schema
         self.assets_with_errors = []
         self.error_free_assets = []
+        self.lookup = BulkAssetLookup(raw_assets.get("assets"))
         super().__init__()
 
     def get_raw_tags(self):
@@ -117,8 +271,7 @@ class BulkAssetHelper(BulkAssetValidator):
             None
         """
         if asset.get('assigneeType', '').lower() == 'space':
-            space_row = Space.query_().filter(
-                Space.name.ilike(asset.get('assignee'))).first()
+            space_row = self.lookup.get_space_by_name(asset.get('assignee'))
             if not space_row:
                 space_row = default_space
             asset['assigneeId'] = space_row.id
@@ -139,9 +292,12 @@ class BulkAssetHelper(BulkAssetValidator):
         assets_sets = set()
         default_space = Space.query_().filter(
             Space.name.ilike('facilities Store')).first()
+        for asset in self.lookup.assets:
+            self.handle_assignee_type_when_is_space(asset, default_space)
+        self.lookup.load()
+        self.asset_schema.context['lookup'] = self.lookup
         for asset in self.raw_assets.get("assets"):
             if isinstance(asset, dict):
-                self.handle_assignee_type_when_is_space(asset, default_space)
                 schema_validated_assets = self.validate_asset(
                     asset, asset_category, assets_sets, custom_valid_obj)
             else:
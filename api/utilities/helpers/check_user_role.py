@@ -1,5 +1,9 @@
 def is_super_user(token_id):
     from api.models import User, Role
+    from .identity import current_identity
     """Checks if the current user is super_super """
+    identity = current_identity(token_id)
+    if identity:
+        return identity.is_super_user
     user = User.get_or_404(token_id).role_id
     return Role.get(user).super_user
@@ -0,0 +1,165 @@
+"""Module for streaming csv exports"""
+
+# Standard library
+import csv
+from io import StringIO
+from itertools import chain
+
+# Third party
+from flask import Response, stream_with_context
+
+# Constants
+from ..constants import EXPORT_CHUNK_SIZE, MIMETYPE_CSV
+
+
+def stream_query(query, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yields the records of a query in chunks
+
+    The records are read through a server side cursor with `yield_per` so
+    only one chunk is held in memory at a time. Relationships eagerly loaded
+    as joined collections cannot be used with `yield_per` and must be
+    switched to lazy loading on the query.
+
+    Args:
+        query (BaseQuery): The query to read records from
+        chunk_size (int): The count of records in a chunk
+
+    Yields:
+        list: A chunk of records
+    """
+    chunk = []
+    for record in query.yield_per(chunk_size):
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def check_headers(chunks, headers):
+    """Checks that the headers hold every key of the first record
+
+    The first chunk is read before anything is written, so an export whose
+    headers do not match its records fails before its response is sent.
+
+    Args:
+        chunks (iterable): Lists of records (dict) to write
+        headers (list): The csv columns
+
+    Raises:
+        ValueError: if the first record has a key missing from the headers
+
+    Returns:
+        iterator: All the chunks, the first one included
+    """
+    chunks = iter(chunks)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        extra_keys = chunk[0].keys() - set(headers)
+        if extra_keys:
+            raise ValueError('record contains fields not in headers: '
+                             f'{sorted(extra_keys)}')
+        return chain([chunk], chunks)
+    return chunks
+
+
+def csv_rows(chunks, headers):
+    """Converts chunks of records into csv text
+
+    Args:
+        chunks (iterable): Lists of records (dict) to write, checked with
+            `check_headers` beforehand
+        headers (list): The csv columns. Keys missing from them are left out
+
+    Yields:
+        str: The csv text of the header and of each chunk. An export
+            without records is empty
+    """
+    buffer = StringIO()
+    writer = None
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if writer is None:
+            writer = get_csv_writer(buffer, headers)
+        writer.writerows(chunk)
+        yield flush_buffer(buffer)
+
+
+def get_schema_headers(schema, skip=()):
+    """Gets the columns of the records dumped by a schema
+
+    Args:
+        schema (Schema): The schema, with the `only` or `exclude` fields it
+            dumps the records with
+        skip (iterable): Fields of the schema that are not columns
+
+    Returns:
+        list: The csv columns, in the order the schema dumps them
+    """
+    return [
+        field.dump_to or name for name, field in schema.fields.items()
+        if not field.load_only and name not in skip
+    ]
+
+
+def get_csv_writer(buffer, headers):
+    """Creates a csv writer and writes the header row
+
+    Args:
+        buffer (StringIO): The buffer to write to
+        headers (list): The csv columns
+
+    Returns:
+        DictWriter: The csv writer
+    """
+    writer = csv.DictWriter(
+        buffer, fieldnames=headers, restval='', extrasaction='ignore')
+    writer.writeheader()
+    return writer
+
+
+def flush_buffer(buffer):
+    """Empties the buffer and returns its content
+
+    Args:
+        buffer (StringIO): The buffer to flush
+
+    Returns:
+        str: The content of the buffer
+    """
+    content = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return content
+
+
+def make_csv_response(chunks, headers, file_name=None):
+    """Builds a chunked text/csv response
+
+    The response body is generated while it is sent, so the export starts
+    before all the records have been read from the database. Only the first
+    chunk is read beforehand, to check the headers against its records.
+
+    Args:
+        chunks (iterable): Lists of records (dict) to export
+        headers (list): The csv columns
+        file_name (str): The name of the downloaded file
+
+    Raises:
+        ValueError: if the first record has a key missing from the headers
+
+    Returns:
+        Response: The streamed csv response
+    """
+    chunks = check_headers(chunks, headers)
+    response = Response(
+        stream_with_context(csv_rows(chunks, headers)),
+        content_type=MIMETYPE_CSV)
+    if file_name:
+        response.headers['Content-Disposition'] = \
+            f'attachment; filename={file_name}.csv'
+    return response
@@ -0,0 +1,39 @@
+"""Module for checking which of many values already exist in a column"""
+
+# Third party
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
+
+# Database
+from api.models.database import db
+
+
+def get_existing_values(column, values, query=None):
+    """Gets the values that already exist in a column with one query
+
+    The values are sent as a single array parameter and matched with
+    `column = ANY(:values)`, so the statement stays the same size however
+    many values are checked.
+
+    Args:
+        column (InstrumentedAttribute): the column to look the values up in
+            e.g. Asset.tag
+        values (iterable): the values to look up
+        query (BaseQuery): a query of the column to narrow the lookup with
+            e.g. to exclude soft deleted records. Defaults to all the rows
+
+    Returns:
+        set: the values that exist in the column
+    """
+    values = list({value for value in values if value is not None})
+    if not values:
+        return set()
+
+    query = query if query is not None else db.session.query(column)
+    values_param = bindparam(
+        'values', value=values, type_=ARRAY(column.type))
+    return {
+        row[0]
+        for row in query.with_entities(column).filter(
+            column == any_(values_param))
+    }
@@ -0,0 +1,220 @@
+"""Module for asynchronous export jobs"""
+
+# Standard library
+from datetime import datetime
+
+# Third party
+from flask import request
+
+# Constants
+from ..constants import EXPORT_JOB_EXPIRY, PERMISSION_TYPES
+from ..enums import ExportJobStatusEnum
+
+# Utilities
+from .identity import get_identity
+
+# Middlewares
+from ...middlewares.base_validator import ValidationError
+from ...middlewares.permission_required import Resources
+
+# Messages
+from ..messages.error_messages import authorization_errors, serialization_errors
+
+# Maps the export types of jobs to the resource class building the export,
+# the permission resource and the query parameters the export requires
+EXPORT_JOB_TYPES = {
+    'assets': {
+        'view': 'ExportAssets',
+        'resource': Resources.ASSETS,
+        'args': ['assetCategoryId']
+    },
+    'users': {
+        'view': 'ExportUserResource',
+        'resource': Resources.PEOPLE,
+        'args': []
+    },
+    'stock-counts': {
+        'view': 'ExportStockCountResource',
+        'resource': Resources.STOCK_COUNT,
+        'args': []
+    },
+    'asset-analytics': {
+        'view': 'ExportAssetAnalyticsReportResource',
+        'resource': Resources.ASSETS,
+        'args': []
+    },
+    'hot-desk-analytics': {
+        'view': 'ExportHotDeskAnalyticsReportResource',
+        'resource': Resources.HOT_DESKS,
+        'args': []
+    }
+}
+
+
+def export_job_key(job_id):
+    """Gets the cache key of an export job
+
+    Args:
+        job_id (str): the id of the export job
+
+    Returns:
+        str: the cache key
+    """
+    return f'export_job:{job_id}'
+
+
+def save_export_job(job):
+    """Saves an export job until it expires
+
+    Args:
+        job (dict): the export job
+    """
+    from main import cache  # imported here to avoid import loop
+
+    cache.set(export_job_key(job['id']), job, timeout=EXPORT_JOB_EXPIRY)
+
+
+def get_export_job(job_id):
+    """Gets an export job
+
+    Args:
+        job_id (str): the id of the export job
+
+    Returns:
+        dict: the export job or None if it does not exist or has expired
+    """
+    from main import cache  # imported here to avoid import loop
+
+    return cache.get(export_job_key(job_id))
+
+
+def update_export_job(job_id, **fields):
+    """Updates the fields of an export job
+
+    Args:
+        job_id (str): the id of the export job
+        fields: the fields to update
+
+    Returns:
+        dict: the updated export job
+    """
+    job = get_export_job(job_id)
+    if job:
+        job.update(fields)
+        save_export_job(job)
+    return job
+
+
+def create_export_job(job_id, export_type, file_format, query):
+    """Creates a pending export job for the user making the request
+
+    Args:
+        job_id (str): the id of the export job
+        export_type (str): one of EXPORT_JOB_TYPES
+        file_format (str): csv or xlsx
+        query (dict): the query parameters of the export
+
+    Returns:
+        dict: the export job
+    """
+    user_info = request.decoded_token['UserInfo']
+    job = {
+        'id': job_id,
+        'exportType': export_type,
+        'fileFormat': file_format,
+        'query': query,
+        'status': ExportJobStatusEnum.pending.value,
+        'progress': 0,
+        'createdBy': user_info['id'],
+        'email': user_info.get('email'),
+        'createdAt': datetime.utcnow().isoformat(),
+        'completedAt': None,
+        'error': None
+    }
+    save_export_job(job)
+    return job
+
+
+def check_export_permission(export_type):
+    """Checks that the current user can view the records of an export type
+
+    Args:
+        export_type (str): one of EXPORT_JOB_TYPES
+
+    Raises:
+        ValidationError: if the user does not have the view permission
+    """
+    resource_name = EXPORT_JOB_TYPES[export_type]['resource']
+    action = PERMISSION_TYPES['GET']
+    identity = get_identity()
+    if not (identity.is_super_user
+            or identity.has_permission(resource_name, action)):
+        raise ValidationError({
+            'message':
+            authorization_errors['permissions_error'].format(
+                action.lower(), resource_name.lower())
+        }, 403)
+
+
+def get_export_resource(export_type, query):
+    """Gets the resource class building the export of an export type
+
+    Args:
+        export_type (str): one of EXPORT_JOB_TYPES
+        query (dict): the query parameters of the export
+
+    Returns:
+        Resource: the resource building the export
+
+    Raises:
+        ValidationError: if a query parameter of the export is missing
+    """
+    from api import views  # imported here to avoid import loop
+
+    export_job_type = EXPORT_JOB_TYPES[export_type]
+    for arg in export_job_type['args']:
+        if not query.get(arg):
+            raise ValidationError({
+                'message':
+                serialization_errors['missing_export_param'].format(
+                    arg, export_type)
+            }, 400)
+
+    return getattr(views, export_job_type['view'])()
+
+
+def parse_export_args(export_type, query):
+    """Parses and validates the query parameters of an export
+
+    Only the parameters and filters are checked, so no record is read.
+
+    Args:
+        export_type (str): one of EXPORT_JOB_TYPES
+        query (dict): the query parameters of the export
+
+    Returns:
+        dict: the arguments of the export of the resource
+
+    Raises:
+        ValidationError: if a query parameter of the export is invalid
+    """
+    return get_export_resource(export_type, query).parse_export_args(query)
+
+
+def build_export(export_type, query):
+    """Builds the export of an export type
+
+    The records are scoped to the identity set for the job.
+
+    Args:
+        export_type (str): one of EXPORT_JOB_TYPES
+        query (dict): the query parameters of the export
+
+    Returns:
+        dict: the chunks of records, file name and headers of the export
+
+    Raises:
+        ValidationError: if a query parameter of the export is invalid
+    """
+    resource = get_export_resource(export_type, query)
+    return resource.export(**resource.parse_export_args(query))
@@ -1,6 +1,6 @@
 # System libraries
 
-from flask import render_template
+from flask import current_app, render_template
 from jinja2.exceptions import TemplateNotFound
 
 from ..messages.error_messages import serialization_errors
@@ -10,18 +10,15 @@ from ..emails.hot_desk_email_template import hot_desk_email_template
 from config import AppConfig
 
 
-def get_mailing_params(template_key, subject, data, template='general_template'):
-    """The function constructs and returns mailing parameters based on the email
-    service that will be used to send the email.
+def get_email_templates(template_key, template='general_template'):
+    """The function gets the email templates holding a template key
 
     Args:
         template_key (str): the dictionary key that holds the email template to be used
-        subject (str): the subject of the email
-        data (obj): the dynamic data needed to customise the email
         template(str): the template to use
-                    
+
     Returns:
-        dict: email parameters that can be passed to the email service
+        dict: the email templates
     """
 
     all_templates = {
@@ -32,6 +29,24 @@ def get_mailing_params(template_key, subject, data, template='general_template')
     if not main_email_template.get(template_key, None):
         raise KeyError(
             serialization_errors['not_found'].format('Template key'))
+    return main_email_template
+
+
+def get_mailing_params(template_key, subject, data, template='general_template'):
+    """The function constructs and returns mailing parameters based on the email
+    service that will be used to send the email.
+
+    Args:
+        template_key (str): the dictionary key that holds the email template to be used
+        subject (str): the subject of the email
+        data (obj): the dynamic data needed to customise the email
+        template(str): the template to use
+                    
+    Returns:
+        dict: email parameters that can be passed to the email service
+    """
+
+    main_email_template = get_email_templates(template_key, template)
 
     if AppConfig.MAIL_SERVICE == 'sendgrid':
         template_id = main_email_template[template_key]['sendgrid']['id']
@@ -44,3 +59,39 @@ def get_mailing_params(template_key, subject, data, template='general_template')
         raise TemplateNotFound(
             serialization_errors['not_found'].format('Email template'))
     return dict(mail_subject=subject, mail_html_body=html_template)
+
+
+def get_batch_mailing_params(template_key, mails, template='general_template'):
+    """The function constructs the mailing parameters of many emails of the
+    same template. The template is loaded and compiled once for all of them.
+
+    Args:
+        template_key (str): the dictionary key that holds the email template to be used
+        mails (list): the recipient, subject and dynamic data of each email
+        template(str): the template to use
+
+    Returns:
+        list: email parameters that can be passed to the batch sending of the
+            email service
+    """
+
+    main_email_template = get_email_templates(template_key, template)
+
+    if AppConfig.MAIL_SERVICE == 'sendgrid':
+        template_id = main_email_template[template_key]['sendgrid']['id']
+        return [
+            dict(recipient=recipient, template_id=template_id,
+                 template_data=data) for recipient, _, data in mails
+        ]
+
+    try:
+        html_template = current_app.jinja_env.get_template(
+            main_email_template[template_key]['local']['template'])
+    except Exception:
+        raise TemplateNotFound(
+            serialization_errors['not_found'].format('Email template'))
+    return [
+        dict(recipient=recipient, mail_subject=subject,
+             mail_html_body=html_template.render(data=data))
+        for recipient, subject, data in mails
+    ]
@@ -0,0 +1,147 @@
+"""
+Module for the identity of the user making the current request
+"""
+# Third party
+from flask import g, has_app_context, request, has_request_context
+
+# Constants
+from ..constants import FULL_ACCESS, NO_ACCESS
+
+# Utilities
+from .permissions import get_role_permissions
+
+
+class Identity(object):
+    """The user, role and permissions of the authenticated user.
+
+    An identity is built once per request by `get_identity` and memoized on
+    the request object, so helpers like `permission_required`,
+    `is_super_user` and `is_center_centric` do not look the user up again.
+
+    attributes:
+        token_id (str): token id of the user
+        user_id (str): id of the user
+        role_id (str): id of the role of the user
+        center_id (str): id of the center of the user
+        is_super_user (bool): whether the role of the user is a super user
+    """
+
+    def __init__(self, user):
+        self.token_id = user.token_id
+        self.user_id = user.id
+        self.center_id = user.center_id
+        self.role_id = user.role_id
+        self.is_super_user = bool(user.role and user.role.super_user)
+        self._permissions = None
+
+    @property
+    def permissions(self):
+        """The effective permissions of the role of the user
+
+        Returns:
+            dict: resource name mapped to a set of permission types
+        """
+        if self._permissions is None:
+            self._permissions = get_role_permissions(self.role_id)
+        return self._permissions
+
+    def has_permission(self, resource_name, permission_type):
+        """Checks if the user has a permission on a resource
+
+        Args:
+            resource_name (str): resource name
+            permission_type (str): permission type e.g View
+
+        Returns:
+            bool: True if the user has the permission otherwise False
+        """
+        if permission_type == NO_ACCESS:
+            return False
+        permission_types = self.permissions.get(resource_name, set())
+        return FULL_ACCESS in permission_types or \
+            permission_type in permission_types
+
+
+def get_identity():
+    """Gets the identity of the user making the current request
+
+    The identity is built on first use and reused for the rest of the
+    request. It is rebuilt if the decoded token changes.
+
+    Returns:
+        Identity: the identity of the current user
+
+    Raises:
+        ValidationError: if the user does not exist
+    """
+    from api.models import User
+
+    token_id = request.decoded_token['UserInfo']['id']
+    identity = getattr(request, 'identity', None)
+
+    if not identity or identity.token_id != token_id:
+        identity = Identity(User.get_or_404(token_id))
+        setattr(request, 'identity', identity)
+
+    return identity
+
+
+def set_identity(token_id):
+    """Sets the identity work done outside of a request runs as
+
+    Background jobs act on behalf of the user who requested them. The
+    identity is kept on the app context of the job.
+
+    Args:
+        token_id (str): token id of the user
+
+    Returns:
+        Identity: the identity of the user
+
+    Raises:
+        ValidationError: if the user does not exist
+    """
+    from api.models import User
+
+    g.identity = Identity(User.get_or_404(token_id))
+    return g.identity
+
+
+def get_current_identity():
+    """Gets the identity of the current request or background job
+
+    Returns:
+        Identity: the identity of the current user or None when no user is
+            authenticated
+    """
+    if has_request_context() and getattr(request, 'decoded_token', None):
+        return get_identity()
+    return g.get('identity') if has_app_context() else None
+
+
+def current_identity(token_id):
+    """Gets the identity of the current request if it belongs to `token_id`
+
+    Args:
+        token_id (str): token id of the user
+
+    Returns:
+        Identity: the identity of the user or None when there is no
+            authenticated request for that user
+    """
+    if not has_request_context() or \
+            not getattr(request, 'decoded_token', None):
+        return None
+    if request.decoded_token['UserInfo']['id'] != token_id:
+        return None
+    return get_identity()
+
+
+def clear_identity(*args):
+    """Drops the identity of the current request.
+
+    Called when users, roles or permissions change so the rest of the
+    request does not see stale values.
+    """
+    if has_request_context() and getattr(request, 'identity', None):
+        setattr(request, 'identity', None)
@@ -0,0 +1,285 @@
+"""
+Module for the per endpoint latency and SQL instrumentation of requests
+"""
+# Standard
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+
+# Third party
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Utilities
+from ..constants import METRICS_DEBUG_HEADER, REQUEST_LATENCY_BUCKETS
+
+
+class RequestStats(object):
+    """The latency and SQL numbers of the request being handled
+
+    attributes:
+        started (float): when the request started
+        sql_statements (int): the count of statements executed
+        sql_time (float): the seconds spent executing the statements
+        rows (int): the count of rows the statements returned or changed
+        serialization_time (float): the seconds spent dumping schemas
+    """
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.sql_statements = 0
+        self.sql_time = 0.0
+        self.rows = 0
+        self.serialization_time = 0.0
+        self.serialization_depth = 0
+
+    @property
+    def latency(self):
+        """The seconds since the request started"""
+        return perf_counter() - self.started
+
+    def to_header(self, latency):
+        """Formats the numbers for the debug header
+
+        Args:
+            latency (float): the seconds the request took
+
+        Returns:
+            str: e.g `latency=0.012; sql-statements=3; sql-time=0.004; ...`
+        """
+        return '; '.join([
+            f'latency={latency:.6f}',
+            f'sql-statements={self.sql_statements}',
+            f'sql-time={self.sql_time:.6f}',
+            f'rows={self.rows}',
+            f'serialization-time={self.serialization_time:.6f}'
+        ])
+
+
+class RouteMetrics(object):
+    """The metrics of the requests of a route and method"""
+
+    def __init__(self):
+        self.buckets = [0] * len(REQUEST_LATENCY_BUCKETS)
+        self.count = 0
+        self.latency = 0.0
+        self.sql_statements = 0
+        self.sql_time = 0.0
+        self.rows = 0
+        self.serialization_time = 0.0
+
+    def observe(self, latency, stats):
+        """Adds a request to the metrics
+
+        Args:
+            latency (float): the seconds the request took
+            stats (RequestStats): the numbers of the request
+        """
+        for index, bound in enumerate(REQUEST_LATENCY_BUCKETS):
+            if latency <= bound:
+                self.buckets[index] += 1
+        self.count += 1
+        self.latency += latency
+        self.sql_statements += stats.sql_statements
+        self.sql_time += stats.sql_time
+        self.rows += stats.rows
+        self.serialization_time += stats.serialization_time
+
+
+class MetricsRegistry(object):
+    """The metrics of every route and method handled by the process
+
+    Each process keeps its own metrics, so with several workers each of
+    them is scraped separately.
+    """
+
+    # the name, type, help and attribute of the counters of the routes
+    COUNTERS = [
+        ('activo_request_sql_statements_total', 'counter',
+         'SQL statements executed by the requests', 'sql_statements'),
+        ('activo_request_sql_seconds_total', 'counter',
+         'Seconds spent executing the SQL statements of the requests',
+         'sql_time'),
+        ('activo_request_sql_rows_total', 'counter',
+         'Rows returned or changed by the SQL statements of the requests',
+         'rows'),
+        ('activo_request_serialization_seconds_total', 'counter',
+         'Seconds spent serializing the responses of the requests',
+         'serialization_time'),
+    ]
+
+    def __init__(self):
+        self.routes = {}
+        self.lock = Lock()
+
+    def observe(self, route, method, latency, stats):
+        """Records a handled request
+
+        Args:
+            route (str): the url rule of the request e.g /api/v1/assets/<id>
+            method (str): the method of the request
+            latency (float): the seconds the request took
+            stats (RequestStats): the numbers of the request
+        """
+        with self.lock:
+            metrics = self.routes.get((route, method))
+            if metrics is None:
+                metrics = self.routes[(route, method)] = RouteMetrics()
+            metrics.observe(latency, stats)
+
+    def clear(self):
+        """Forgets the recorded requests"""
+        with self.lock:
+            self.routes.clear()
+
+    @staticmethod
+    def labels(route, method, **extra):
+        """Formats the labels of a sample
+
+        Args:
+            route (str): the url rule
+            method (str): the method
+            extra (dict): other labels e.g le
+
+        Returns:
+            str: e.g `{route="/health",method="GET"}`
+        """
+        values = [('route', route), ('method', method), *extra.items()]
+        return '{%s}' % ','.join(
+            '{}="{}"'.format(
+                name,
+                str(value).replace('\\', '\\\\').replace('"', '\\"').replace(
+                    '\n', '\\n')) for name, value in values)
+
+    def render(self):
+        """Renders the metrics in the Prometheus text exposition format
+
+        Returns:
+            str: the metrics
+        """
+        with self.lock:
+            routes = sorted(self.routes.items())
+
+        name = 'activo_request_latency_seconds'
+        lines = [
+            f'# HELP {name} Seconds taken to handle the requests',
+            f'# TYPE {name} histogram'
+        ]
+        for (route, method), metrics in routes:
+            for bound, count in zip(REQUEST_LATENCY_BUCKETS,
+                                    metrics.buckets):
+                labels = self.labels(route, method, le=float(bound))
+                lines.append(f'{name}_bucket{labels} {count}')
+            labels = self.labels(route, method, le='+Inf')
+            lines.append(f'{name}_bucket{labels} {metrics.count}')
+            labels = self.labels(route, method)
+            lines.append(f'{name}_sum{labels} {metrics.latency}')
+            lines.append(f'{name}_count{labels} {metrics.count}')
+
+        for name, kind, description, attribute in self.COUNTERS:
+            lines.extend(
+                [f'# HELP {name} {description}', f'# TYPE {name} {kind}'])
+            lines.extend(
+                f'{name}{self.labels(route, method)} '
+                f'{getattr(metrics, attribute)}'
+                for (route, method), metrics in routes)
+        return '\n'.join(lines) + '\n'
+
+
+metrics_registry = MetricsRegistry()
+
+
+def get_request_stats():
+    """Gets the numbers of the request being handled
+
+    Returns:
+        RequestStats: the numbers or None outside of an instrumented request
+    """
+    if has_request_context():
+        return g.get('request_stats')
+    return None
+
+
+@contextmanager
+def timed_serialization():
+    """Adds the time spent in the block to the serialization time of the
+    request. Nested schemas are only timed once, with their parent."""
+    stats = get_request_stats()
+    if stats is None:
+        yield
+        return
+
+    started = perf_counter()
+    stats.serialization_depth += 1
+    try:
+        yield
+    finally:
+        stats.serialization_depth -= 1
+        if not stats.serialization_depth:
+            stats.serialization_time += perf_counter() - started
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    """Notes when a statement of a request starts"""
+    if get_request_stats() is not None:
+        conn.info.setdefault('statements_started', []).append(perf_counter())
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context,
+                         executemany):
+    """Adds an executed statement to the numbers of its request"""
+    stats = get_request_stats()
+    started = conn.info.get('statements_started')
+    if stats is None or not started:
+        return
+
+    stats.sql_time += perf_counter() - started.pop()
+    stats.sql_statements += 1
+    stats.rows += max(cursor.rowcount, 0)
+
+
+def start_request_stats():
+    """Starts the numbers of a request"""
+    g.request_stats = RequestStats()
+
+
+def record_request_stats(response):
+    """Records the numbers of a request and returns them in the debug header
+    when the request asks for them
+
+    Args:
+        response (Response): the response of the request
+
+    Returns:
+        Response: the response
+    """
+    stats = g.pop('request_stats', None)
+    if stats is None:
+        return response
+
+    latency = stats.latency
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics_registry.observe(route, request.method, latency, stats)
+
+    if request.headers.get(METRICS_DEBUG_HEADER) and \
+            current_app.config.get('METRICS_DEBUG_HEADER_ENABLED'):
+        response.headers[METRICS_DEBUG_HEADER] = stats.to_header(latency)
+    return response
+
+
+def init_instrumentation(app):
+    """Instruments the requests of an application and the statements they
+    execute
+
+    Args:
+        app (Flask): the application
+    """
+    for name, listener in (('before_cursor_execute', before_cursor_execute),
+                           ('after_cursor_execute', after_cursor_execute)):
+        if not event.contains(Engine, name, listener):
+            event.listen(Engine, name, listener)
+
+    app.before_request(start_request_stats)
+    app.after_request(record_request_stats)
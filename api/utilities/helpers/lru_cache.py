@@ -0,0 +1,64 @@
+"""
+Module for a small in-process least recently used cache
+"""
+# Standard
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+
+
+class LRUCache(object):
+    """A small in-process least recently used cache whose entries expire
+
+    attributes:
+        max_size (int): the count of entries kept, the least recently used
+            entry is evicted once it is exceeded
+        timeout (int): the seconds an entry is reused for, entries do not
+            expire when it is None
+    """
+
+    def __init__(self, max_size, timeout=None):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.entries = OrderedDict()
+        self.lock = Lock()
+
+    def get(self, key):
+        """Gets the value cached for a key
+
+        Args:
+            key (hashable): the key of the value
+
+        Returns:
+            any: the value or None if it is not cached or has expired
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Caches the value of a key
+
+        Args:
+            key (hashable): the key of the value
+            value (any): the value to cache
+        """
+        with self.lock:
+            expires_at = None if self.timeout is None else \
+                monotonic() + self.timeout
+            self.entries[key] = (expires_at, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        """Removes every cached value"""
+        with self.lock:
+            self.entries.clear()
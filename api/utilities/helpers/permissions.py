@@ -1,16 +1,19 @@
 """
 Permissions helper function modules
 """
-from sqlalchemy import text
+# Standard library
+from uuid import uuid4
 
-# database
-from api.models.database import db
+# Third party
+from sqlalchemy.orm import object_session
 
 # Constants
-from ..constants import FULL_ACCESS, NO_ACCESS
+from ..constants import (FULL_ACCESS, NO_ACCESS, PERMISSION_MATRIX_CACHE_KEY,
+                         PERMISSION_MATRIX_VERSION_CACHE_KEY)
 
 # Utilities
 from ..sql_queries import sql_queries
+from ..prepared_statements import execute_query
 
 
 def check_user_permissions(token_id, resource_name, permission_type):
@@ -26,13 +29,103 @@ def check_user_permissions(token_id, resource_name, permission_type):
         bool: True for success or False for failure
     """
 
-    sql_query = sql_queries['check_user_permissions'].format(
-        token_id, resource_name, NO_ACCESS, FULL_ACCESS, permission_type)
-
     # execute the query and get back sqlalchemy result proxy object
-    result_proxy = db.engine.execute(text(sql_query))
+    result_proxy = execute_query(
+        sql_queries['check_user_permissions'],
+        token_id=token_id,
+        resource_name=resource_name,
+        no_access=NO_ACCESS,
+        full_access=FULL_ACCESS,
+        permission_type=permission_type)
 
     # cast result proxy to a list of records
     records = list(result_proxy)
     # True if records is not empty otherwise False and user has no permission
     return True if records else False
+
+
+# the permission matrix held by this process and the version it was built at
+local_permission_matrix = {'version': None, 'matrix': None}
+
+
+def build_permission_matrix():
+    """Builds the permissions of every role from the database
+
+    Returns:
+        dict: role id mapped to a dict of resource name to a set of
+            permission types e.g {'-LG__7v6': {'Assets': {'View', 'Edit'}}}
+    """
+    matrix = {}
+    for record in execute_query(sql_queries['permission_matrix']):
+        matrix.setdefault(record.role_id, {}).setdefault(
+            record.resource_name, set()).add(record.permission_type)
+    return matrix
+
+
+def get_permission_matrix():
+    """Gets the permission matrix of all roles
+
+    The matrix is kept in this process and in the cache. A version stamp in
+    the cache tells the process when its copy is stale so changes made by
+    other workers are picked up.
+
+    Returns:
+        dict: role id mapped to a dict of resource name to permission types
+    """
+    # cache imported here to avoid import loop
+    from main import cache
+
+    version = cache.get(PERMISSION_MATRIX_VERSION_CACHE_KEY)
+    if version is None:
+        version = uuid4().hex
+        cache.set(PERMISSION_MATRIX_VERSION_CACHE_KEY, version, timeout=0)
+
+    if local_permission_matrix['version'] == version:
+        return local_permission_matrix['matrix']
+
+    matrix_key = f'{PERMISSION_MATRIX_CACHE_KEY}:{version}'
+    matrix = cache.get(matrix_key)
+    if matrix is None:
+        matrix = build_permission_matrix()
+        cache.set(matrix_key, matrix, timeout=0)
+
+    local_permission_matrix.update(version=version, matrix=matrix)
+    return matrix
+
+
+def get_role_permissions(role_id):
+    """Gets the permissions of a role
+
+    Args:
+        role_id (str): id of the role
+
+    Returns:
+        dict: resource name mapped to a set of permission types
+    """
+    return get_permission_matrix().get(role_id, {})
+
+
+def invalidate_permission_matrix():
+    """Makes every process rebuild the permission matrix on next use"""
+    # cache imported here to avoid import loop
+    from main import cache
+
+    local_permission_matrix.update(version=None, matrix=None)
+    cache.set(PERMISSION_MATRIX_VERSION_CACHE_KEY, uuid4().hex, timeout=0)
+
+
+def flag_permission_change(mapper, connection, target):
+    """Flags the session of a changed role or permission.
+
+    The matrix is invalidated after the session commits so other requests do
+    not cache the permissions before the change is visible to them.
+    """
+    session = object_session(target)
+    if session:
+        session.info['permission_matrix_changed'] = True
+
+
+def receive_after_commit(session):
+    """Invalidates the permission matrix if the session changed it"""
+    if session.info.pop('permission_matrix_changed', False):
+        invalidate_permission_matrix()
@@ -0,0 +1,99 @@
+"""
+Module for maintaining the materialized paths of the spaces
+
+The path of a space lists the ids of its ancestors and its own id from the
+root down e.g `/building/floor/wing/`, so the subtree of a space is every
+space whose path starts with its path.
+"""
+# Third party
+from sqlalchemy import text
+from sqlalchemy.orm import attributes
+
+# Utilities
+from ..sql_queries import sql_queries
+
+# separates the ids of the spaces in a path
+PATH_SEPARATOR = '/'
+
+
+def build_path(parent_path, space_id):
+    """Builds the path of a space
+
+    Args:
+        parent_path (str): the path of the parent or None for a root space
+        space_id (str): the id of the space
+
+    Returns:
+        str: the path of the space
+    """
+    return f'{parent_path or PATH_SEPARATOR}{space_id}{PATH_SEPARATOR}'
+
+
+def path_ids(path):
+    """Gets the ids in a path from the root down
+
+    Args:
+        path (str): the path of a space
+
+    Returns:
+        list: the ids of the ancestors followed by the id of the space
+    """
+    return [space_id for space_id in (path or '').split(PATH_SEPARATOR)
+            if space_id]
+
+
+def subtree_pattern(path):
+    """Builds the LIKE pattern of the paths of a subtree
+
+    The ids may contain `_`, which is a LIKE wildcard, so the pattern
+    characters of the path are escaped.
+
+    Args:
+        path (str): the path of the root of the subtree
+
+    Returns:
+        str: the pattern matching the path and the paths of the descendants
+    """
+    for character in ('\\', '%', '_'):
+        path = path.replace(character, f'\\{character}')
+    return f'{path}%'
+
+
+def get_parent_path(connection, parent_id):
+    """Gets the path of the parent of a space
+
+    Args:
+        connection (Connection): the connection of the flush
+        parent_id (str): the id of the parent or None
+
+    Returns:
+        str: the path of the parent or None
+    """
+    if not parent_id:
+        return None
+    return connection.execute(
+        text(sql_queries['get_space_path']), id=parent_id).scalar()
+
+
+def receive_space_insert(mapper, connection, target):
+    """Sets the path of an inserted space"""
+    target.path = build_path(
+        get_parent_path(connection, target.parent_id), target.id)
+
+
+def receive_space_update(mapper, connection, target):
+    """Moves the path of a space and its descendants under its new parent"""
+    if not attributes.get_history(target, 'parent_id').has_changes():
+        return
+
+    previous_path = target.path
+    target.path = build_path(
+        get_parent_path(connection, target.parent_id), target.id)
+
+    if previous_path and previous_path != target.path:
+        connection.execute(
+            text(sql_queries['move_space_descendants']),
+            path=target.path,
+            previous_path=previous_path,
+            pattern=subtree_pattern(previous_path),
+            id=target.id)
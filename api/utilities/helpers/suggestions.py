@@ -0,0 +1,103 @@
+"""
+Module for typeahead suggestions of asset tags, user names and space names
+"""
+# Standard
+from collections import OrderedDict
+
+# Third party
+from sqlalchemy import case, func, or_
+
+# Models
+from api.models import Asset, Space, User
+
+# Constants
+from ..constants import SUGGESTIONS_CACHE_SIZE, SUGGESTIONS_CACHE_TIMEOUT
+
+# Utilities
+from .identity import get_identity
+from .lru_cache import LRUCache
+
+
+suggestions_cache = LRUCache(SUGGESTIONS_CACHE_SIZE, SUGGESTIONS_CACHE_TIMEOUT)
+
+
+# The suggested types with the columns of the id and label of a suggestion
+# and the columns matched with the typed text. The matched columns have
+# trigram GIN indexes.
+SUGGEST_TYPES = OrderedDict([
+    ('assets', (Asset, Asset.id, Asset.tag, [Asset.tag])),
+    ('users', (User, User.token_id, User.name, [User.name, User.email])),
+    ('spaces', (Space, Space.id, Space.name, [Space.name])),
+])
+
+
+def escape_like(text):
+    """Escapes the wildcards of a like pattern
+
+    Args:
+        text (str): the text to match literally
+
+    Returns:
+        str: the escaped text
+    """
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def query_suggestions(suggest_type, text, limit):
+    """Queries the records whose columns start with or closely resemble a text
+
+    Prefix matches come first, then the rest by their trigram similarity.
+    Both `ILIKE 'text%'` and the `%` similarity operator are served by the
+    trigram indexes of the columns.
+
+    Args:
+        suggest_type (str): the type of the records e.g assets
+        text (str): the typed text
+        limit (int): the count of suggestions
+
+    Returns:
+        list: the id and label of the suggestions
+    """
+    model, id_column, label, columns = SUGGEST_TYPES[suggest_type]
+    pattern = f'{escape_like(text)}%'
+    is_prefix = or_(
+        *[column.ilike(pattern, escape='\\') for column in columns])
+    similarity = func.greatest(
+        *[func.similarity(column, text) for column in columns])
+
+    # the operator is doubled as psycopg2 formats the % of the statement
+    query = model.query_().order_by(None).filter(
+        or_(is_prefix, *[column.op('%%')(text) for column in columns]))
+    return [{
+        'id': record_id,
+        'label': record_label
+    } for record_id, record_label in query.with_entities(
+        id_column, label).order_by(
+            case([(is_prefix, 0)], else_=1), similarity.desc(),
+            label).limit(limit)]
+
+
+def get_suggestions(suggest_type, text, limit):
+    """Gets the suggestions for a typed text
+
+    The suggestions of the most recently typed texts are cached in the
+    process for a few seconds. They are cached per center, as the records
+    are scoped to the center of the user.
+
+    Args:
+        suggest_type (str): the type of the records e.g assets
+        text (str): the typed text
+        limit (int): the count of suggestions
+
+    Returns:
+        list: the id and label of the suggestions
+    """
+    identity = get_identity()
+    center_id = None if identity.is_super_user else identity.center_id
+    key = (suggest_type, center_id, text.lower(), limit)
+
+    suggestions = suggestions_cache.get(key)
+    if suggestions is None:
+        suggestions = query_suggestions(suggest_type, text, limit)
+        suggestions_cache.set(key, suggestions)
+    return suggestions
@@ -1,10 +1,9 @@
 """ helper functions for trend allocations"""
 import calendar
 from flask import request
-from sqlalchemy import text
 
-from api.models.database import db
 from api.utilities.sql_queries import sql_queries
+from api.utilities.prepared_statements import execute_query
 from .calendar import get_start_of_week, get_end_of_week, get_start_of_month, \
     get_end_of_month, get_start_of_year, get_end_of_year, get_start_of_quarter, get_end_of_quarter
 from ...utilities.validators.hot_desk_report_query_validator \
@@ -62,15 +61,15 @@ def get_trends_query(*args, **kwargs):
         'quarter': 'quarterly',
         'day': 'daily',
     }
-    if query_key == 'trends_allocation':
-        trends_allocation = sql_queries[query_key].format(
-            frequency, frequency_mapper.get(frequency), floor, start_date,
-            end_date)
-    else:
-        trends_allocation = sql_queries[query_key].format(
-            frequency, frequency_mapper.get(frequency), user_id, floor,
-            start_date, end_date)
-    query = db.engine.execute(text(trends_allocation)).fetchall()
+    trends_allocation = sql_queries[query_key].format(
+        period=frequency_mapper.get(frequency))
+    query = execute_query(
+        trends_allocation,
+        frequency=frequency,
+        floor=floor,
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date).fetchall()
     periods, values = [], []
     for period in query:
         periods.append(get_descriptor(frequency, period[0]))
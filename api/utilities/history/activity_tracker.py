@@ -1,6 +1,9 @@
 """Module to track activity of a resource"""
 # system
 import re
+from collections import defaultdict
+from contextlib import contextmanager
+from threading import local
 
 # library
 from sqlalchemy.orm.attributes import get_history
@@ -12,6 +15,9 @@ from api.utilities.constants import PERMISSION_TYPES
 # messages
 from api.utilities.messages.success_messages import HISTORY_MESSAGES
 
+# records looked up for the histories of the flush being recorded
+prefetched = local()
+
 
 class ActivityTracker():
     """Track Activity of a given resource
@@ -31,29 +37,159 @@ class ActivityTracker():
         Returns:
             save to history model and log the activity
         """
-        # imported here to avoid looping imports
-        from api.models import History, User
+        cls.record_histories([(target, cls,
+                               request.decoded_token['UserInfo']['id'],
+                               request.method)], session)
+
+    @classmethod
+    def record_histories(cls, activities, session):
+        """Records the activities of a flush to the History model
 
-        user_id = request.decoded_token['UserInfo']['id']
-        action_verb = request.method
+        The records referenced by the updated id columns are looked up in one
+        query per model and the histories are written with a single insert.
+
+        Args:
+            activities (list): tuples of the instance of model
+                created/updated/deleted, its activity tracker, the id of the
+                actor and the request method
+            session (db): database session
+        """
+        # imported here to avoid looping imports
+        from api.utilities.helpers.identity import get_identity
 
         # actor id should exist in the db
         # this check ensures actor is in the db
-        User.get_or_404(user_id)
+        get_identity()
+
+        histories = []
+        with cls.prefetch_records(activities):
+            for target, tracker, actor_id, action_verb in activities:
+                msg = tracker.generate_activity_message(target, action_verb)
+                if msg:
+                    histories.append({
+                        "resource_id": target.id,
+                        "resource_type": target.__class__.__name__,
+                        "actor_id": actor_id,
+                        "action": PERMISSION_TYPES[action_verb],
+                        "activity": msg
+                    })
+
+        cls.insert_histories(histories, session)
 
-        msg = cls.generate_activity_message(target, action_verb)
+    @classmethod
+    def insert_histories(cls, histories, session):
+        """Writes histories to the History model with a single insert
 
-        data = {
-            "resource_id": target.id,
-            "resource_type": target.__class__.__name__,
-            "actor_id": user_id,
-            "action": PERMISSION_TYPES[action_verb],
-            "activity": msg
-        }
+        Args:
+            histories (list): dicts of the columns of the histories
+            session (db): database session
+        """
+        # imported here to avoid looping imports
+        from api.models import History, PushID
 
-        if msg:
-            history = History(**data)
-            session.add(history)
+        if histories:
+            push_id = PushID()
+            for history in histories:
+                history['id'] = push_id.next_id()
+            session.execute(History.__table__.insert(), histories)
+
+    @classmethod
+    @contextmanager
+    def prefetch_records(cls, activities):
+        """Looks up the records referenced by the updated id columns of the
+        activities in one query per model
+
+        Args:
+            activities (list): tuples of the instance of model updated, its
+                activity tracker, the id of the actor and the request method
+        """
+        record_ids = defaultdict(set)
+        for target, tracker, _, action_verb in activities:
+            if action_verb != 'PATCH':
+                continue
+            for column, values in tracker.updated_id_columns(target):
+                for model in tracker.get_id_models(column):
+                    record_ids[model].update(values)
+
+        prefetched.records = {}
+        for model, ids in record_ids.items():
+            ids.discard(None)
+            records = cls.query_records(model, ids) if ids else {}
+            for record_id in ids:
+                prefetched.records[model, record_id] = records.get(record_id)
+        try:
+            yield
+        finally:
+            prefetched.records = None
+
+    @classmethod
+    def updated_id_columns(cls, target):
+        """Gets the updated id columns of a model instance
+
+        Args:
+            target (Object): The current model instance
+
+        Returns:
+            generator: tuples of the column and its new and old ids
+        """
+        for column in target.__table__.columns:
+            column = column.key
+            new_value, _, old_value = get_history(target, column)
+
+            if new_value and column not in cls.excluded \
+                    and column.endswith('_id'):
+                yield column, new_value[:1] + old_value[:1]
+
+    @classmethod
+    def get_id_models(cls, column):
+        """Gets the models an id column can reference
+
+        Args:
+            column (String): table column
+
+        Returns:
+            list
+        """
+        _, model = cls.get_column_model(column)
+        return [model] if model else []
+
+    @classmethod
+    def query_records(cls, model, record_ids):
+        """Query the records of a model with the given ids
+
+        Args:
+            model (Model): class model of resource to query
+            record_ids (set): resource ids
+
+        Returns:
+            dict: records keyed by their id
+        """
+        # imported here to avoid looping imports
+        from api.models import User
+
+        # users are referenced by their token id
+        if model is User:
+            users = User.query.filter(User.token_id.in_(record_ids))
+            return {user.token_id: user for user in users}
+
+        records = model.query_().filter(model.id.in_(record_ids))
+        return {record.id: record for record in records}
+
+    @classmethod
+    def get_record(cls, model, record_id):
+        """Gets a record looked up for the current flush or queries it
+
+        Args:
+            model (Model): class model of resource to query
+            record_id (String): resource id
+
+        Returns:
+            object: the record or None if it does not exist
+        """
+        records = getattr(prefetched, 'records', None)
+        if records and (model, record_id) in records:
+            return records[model, record_id]
+        return model.get(record_id)
 
     @classmethod
     def generate_activity_message(cls, target, action):
@@ -263,7 +399,7 @@ class ActivityTracker():
             [<Center Lagos>, <Center Nairobi>]
         """
 
-        new_value = model.get(new_value_id)
-        old_value = model.get(old_value_id)
+        new_value = cls.get_record(model, new_value_id)
+        old_value = cls.get_record(model, old_value_id)
 
         return new_value, old_value
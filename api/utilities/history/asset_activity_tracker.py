@@ -38,6 +38,25 @@ class AssetActivityTracker(ActivityTracker):
 
         return column, old_value, new_value
 
+    @classmethod
+    def get_id_models(cls, column):
+        """Gets the models an id column can reference
+
+        Args:
+            column (String): table column
+
+        Returns:
+            list
+        """
+        # imported here to avoid looping imports
+        from api.models import User, Space
+
+        # assignee can be User or Space
+        if column == 'assignee_id':
+            return [User, Space]
+
+        return super().get_id_models(column)
+
     @classmethod
     def get_assignee(cls, column, new_value_id, old_value_id):
         """Get matching model from column
@@ -83,14 +102,14 @@ class AssetActivityTracker(ActivityTracker):
         # imported here to avoid looping imports
         from api.models import User, Space
 
-        record = User.get(new_value_id)
+        record = cls.get_record(User, new_value_id)
 
         if record:
             new_name = record
-            old_name = Space.get(old_value_id)
+            old_name = cls.get_record(Space, old_value_id)
         else:
-            new_name = Space.get(new_value_id)
-            old_name = User.get(old_value_id)
+            new_name = cls.get_record(Space, new_value_id)
+            old_name = cls.get_record(User, old_value_id)
 
         new_name, old_name = cls.humanize_model_name((new_name, old_name))
 
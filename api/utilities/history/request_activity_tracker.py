@@ -26,3 +26,21 @@ class RequestTracker(ActivityTracker):
                                               old_value_id, User)
 
         return super().convert_id_to_name(column, new_value_id, old_value_id)
+
+    @classmethod
+    def get_id_models(cls, column):
+        """Gets the models an id column can reference
+
+        Args:
+            column (String): table column
+
+        Returns:
+            list
+        """
+        if column in ['assignee_id', "requester_id", "responder_id"]:
+            # imported here to avoid cyclic dependancy
+            from api.models import User
+
+            return [User]
+
+        return super().get_id_models(column)
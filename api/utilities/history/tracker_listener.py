@@ -1,7 +1,11 @@
 """Module to add event listens for the model"""
+# system
+from collections import OrderedDict
+
 # third party
 from flask import request
 from sqlalchemy.event import listens_for
+from sqlalchemy.orm import object_session
 
 # db
 from api.models.database import db
@@ -9,6 +13,9 @@ from api.models.database import db
 # Activity Tracker Module
 from .activity_tracker import ActivityTracker
 
+# key of the activities of the current flush in the session info
+PENDING_ACTIVITIES = 'pending_activities'
+
 
 def activity_tracker_listener(model, activity_tracker=ActivityTracker):
     """Create event listeners for a model.
@@ -23,7 +30,24 @@ def activity_tracker_listener(model, activity_tracker=ActivityTracker):
     @listens_for(model, 'after_insert')
     @listens_for(model, 'after_update')
     def after_insert_update(mapper, connection, target):
-        @listens_for(db.session, "after_flush", once=True)
-        def receive_after_flush(session, context):
-            if request and request.method and request.method != 'GET':
-                activity_tracker.record_history(target, request, session)
+        if request and request.method and request.method != 'GET':
+            activities = object_session(target).info.setdefault(
+                PENDING_ACTIVITIES, OrderedDict())
+            # an instance is only recorded once per flush
+            activities[target.__class__.__name__, target.id] = (
+                target, activity_tracker,
+                request.decoded_token['UserInfo']['id'], request.method)
+
+
+@listens_for(db.session, 'after_flush')
+def receive_after_flush(session, context):
+    """Records the activities of the flush in one batch"""
+    activities = session.info.pop(PENDING_ACTIVITIES, None)
+    if activities:
+        ActivityTracker.record_histories(list(activities.values()), session)
+
+
+@listens_for(db.session, 'after_soft_rollback')
+def receive_after_soft_rollback(session, previous_transaction):
+    """Drops the activities of a flush that was rolled back"""
+    session.info.pop(PENDING_ACTIVITIES, None)
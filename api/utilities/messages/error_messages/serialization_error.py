@@ -52,6 +52,10 @@ error_dict = {  # pylint: disable=C0103
     'exists': '{} already exists',
     'last_page_returned':
     'The requested page exceeds the total pages count, however the last page was returned',
+    'cursor_unsupported_sort':
+    'Cursor pagination is not supported when sorting by {}',
+    'search_cursor_without_type':
+    'A search cursor can only be used when searching a single type',
     'not_found': '{} not found',
     'invalid_choice':
     'The value of attribute {} must be one of these options: {}',
@@ -175,5 +179,8 @@ error_dict = {  # pylint: disable=C0103
     'form_data_type_required': 'Content-Type should be multipart/form-data',
     'invalid_search_param': 'Invalid search param key',
     'empty_query_param_value': 'Query parameter value cannot be empty',
-    'image_url_and_public_id_missing': 'You must provide an image url and a public_id'
+    'image_url_and_public_id_missing': 'You must provide an image url and a public_id',
+    'missing_export_param': '{0} is required for {1} exports',
+    'export_job_not_found': 'Export job not found',
+    'export_job_not_ready': 'Export job is {0}, its file is not available'
 }
@@ -42,6 +42,8 @@ SUCCESS_MESSAGES = {
     'Hey {}, your hot desk with reference number {}, has been successfully cancelled',
     'cancelled_hot_desk_reason':
     'Hot desks with the cancellation reason of {}, fetched succesfully',
+    'export_job_created':
+    'Export job created, you would receive an email when completed',
 }
 
 HISTORY_MESSAGES = {
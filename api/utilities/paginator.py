@@ -2,13 +2,23 @@
 
 # Standard
 import re
+import json
+from hashlib import sha1
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
+from datetime import datetime
 from math import ceil
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 # Third Party Libraries
+from sqlalchemy import and_, or_, tuple_
+
 from flask import request
 
 # Utilities
 from api.utilities.query_parser import QueryParser
+from .prepared_statements import execute_query
+from .sql_queries import sql_queries
 
 # Messages
 from .messages.error_messages import serialization_errors
@@ -16,8 +26,13 @@ from .messages.error_messages import serialization_errors
 # Middlewares
 from ..middlewares.base_validator import ValidationError
 
+# Database
+from api.models.database import db
+
 # Constants
-from .constants import EXCLUDED_FIELDS
+from .constants import (EXCLUDED_FIELDS, CURSOR_DATE_FORMAT,
+                        TOTAL_COUNT_STRATEGIES, TOTAL_COUNT_CACHE_TIMEOUT,
+                        ESTIMATED_COUNT_THRESHOLD)
 
 
 def validate_pagination_args(arg_value, arg_name):
@@ -170,12 +185,19 @@ def pagination_helper(*args, **kwargs):
             raise ValidationError(
                 {'message': serialization_errors['invalid_field']})
 
-    records_count = records_query.count()
-    limit, offset, pagination_object = generate_metadata(records_count)
-    records = records_query.offset(offset).limit(limit)
+    if is_cursor_pagination():
+        records, pagination_object = cursor_pagination_helper(
+            model, records_query)
+        # The total count is skipped unless a strategy is requested
+        if 'totalCount' in request.args:
+            pagination_object['totalCount'] = count_records(
+                model, records_query)
+    else:
+        records_count = count_records(model, records_query)
+        limit, offset, pagination_object = generate_metadata(records_count)
+        records = records_query.offset(offset).limit(limit).all()
 
-    data = schema(
-        many=True, exclude=exclude, only=only).dump(records.all()).data
+    data = schema(many=True, exclude=exclude, only=only).dump(records).data
 
     if include_deleted:
         data = handle_delete_condition(exclude, schema, only, records)
@@ -183,6 +205,132 @@ def pagination_helper(*args, **kwargs):
     return data, pagination_object
 
 
+def get_total_count_strategy():
+    """Gets the total count strategy supplied in the `totalCount` query param
+
+    Raises:
+        ValidationError: if the strategy is not supported
+
+    Returns:
+        str: One of 'exact', 'estimated' or 'cached'. Defaults to 'exact'
+    """
+    strategy = request.args.get('totalCount', 'exact').lower().strip() \
+        or 'exact'
+    if strategy not in TOTAL_COUNT_STRATEGIES:
+        raise ValidationError({
+            'message':
+            serialization_errors['invalid_request_param'].format(
+                'totalCount', ', '.join(TOTAL_COUNT_STRATEGIES))
+        })
+    return strategy
+
+
+def count_records(model, records_query):
+    """Counts the records of a query using the requested strategy
+
+    Strategies:
+        exact: runs `SELECT count(*)` over the query
+        estimated: uses the row estimate Postgres keeps for the table of an
+            unfiltered query, falling back to an exact count for small
+            tables. Filtered queries fall back to a cached count, as their
+            estimates can be off by orders of magnitude
+        cached: caches the exact count of the query for a short while
+
+    Args:
+        model (class): Model being paginated
+        records_query (BaseQuery): The filtered query of the model
+
+    Returns:
+        int: The total count of the records
+    """
+    strategy = get_total_count_strategy()
+
+    if strategy == 'estimated':
+        if not is_unfiltered(model, records_query):
+            return cached_query_count(model, records_query)
+        estimate = estimate_table_count(model)
+        if estimate >= ESTIMATED_COUNT_THRESHOLD:
+            return estimate
+    elif strategy == 'cached':
+        return cached_query_count(model, records_query)
+
+    return records_query.count()
+
+
+def compile_query(records_query):
+    """Compiles the query into its sql statement without the ordering
+
+    Args:
+        records_query (BaseQuery): The query to compile
+
+    Returns:
+        Compiled: the compiled statement with its params
+    """
+    return records_query.order_by(None).statement.compile(
+        dialect=db.engine.dialect)
+
+
+def is_unfiltered(model, records_query):
+    """Checks if a query reads all the records of its model
+
+    Any filter, including the center of the user, adds to the statement of
+    the plain query of the model.
+
+    Args:
+        model (class): Model being paginated
+        records_query (BaseQuery): The filtered query of the model
+
+    Returns:
+        bool: True if the query has no filters
+    """
+    return str(compile_query(records_query)) == str(
+        compile_query(model.query))
+
+
+def estimate_table_count(model):
+    """Gets the row estimate Postgres keeps for the table of a model
+
+    Args:
+        model (class): Model being paginated
+
+    Returns:
+        int: The estimated count of the records
+    """
+    return int(
+        execute_query(
+            sql_queries['estimate_table_count'],
+            bind=db.session.connection(),
+            table_name=model.__table__.name).scalar() or 0)
+
+
+def cached_query_count(model, records_query):
+    """Gets the exact count of a query from the cache
+
+    The cache key is built from the compiled statement and its params so
+    that every filter, including the center of the user, gets its own entry.
+
+    Args:
+        model (class): Model being paginated
+        records_query (BaseQuery): The query to count
+
+    Returns:
+        int: The total count of the records
+    """
+    # cache imported here to avoid import loop
+    from main import cache
+
+    statement = compile_query(records_query)
+    digest = sha1(
+        f'{statement}{sorted(statement.params.items())}'.encode()).hexdigest()
+    key = f'total_count:{model.__table__.name}:{digest}'
+
+    records_count = cache.get(key)
+    if records_count is None:
+        records_count = records_query.count()
+        cache.set(key, records_count, timeout=TOTAL_COUNT_CACHE_TIMEOUT)
+    return records_count
+
+
 def handle_delete_condition(exclude, schema, only, records):
     """returns resource data including deleted resources in case a
     resources is requested with include=deleted params
@@ -196,10 +344,227 @@ def handle_delete_condition(exclude, schema, only, records):
         exclude_.remove('deleted')
     data = schema(
         many=True, exclude=exclude_, only=only).dump(
-            records.all(), request_args=args).data
+            records, request_args=args).data
     return data
 
 
+def is_cursor_pagination():
+    """Checks if keyset (cursor) pagination was requested
+
+    Cursor pagination is used when the `cursor` query param is supplied. An
+    empty cursor (`?cursor=`) returns the first page.
+
+    Returns:
+        bool: True if the `cursor` query param is present
+    """
+    return 'cursor' in request.args
+
+
+def encode_cursor(sort_value, record_id, direction):
+    """Encodes the position of a record into an opaque cursor
+
+    Args:
+        sort_value (any): Value of the sort column on the record
+        record_id (str): Id of the record
+        direction (str): Either 'next' or 'previous'
+
+    Returns:
+        str: url safe cursor string
+    """
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.strftime(CURSOR_DATE_FORMAT)
+    payload = json.dumps({'value': sort_value, 'id': record_id,
+                          'direction': direction}, default=str)
+    return urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor, sort_column):
+    """Decodes a cursor generated by `encode_cursor`
+
+    Args:
+        cursor (str): The cursor supplied in the query params
+        sort_column (Column): The column the records are sorted by
+
+    Raises:
+        ValidationError: if the cursor cannot be decoded
+
+    Returns:
+        tuple: the sort value, record id and direction of the cursor
+    """
+    try:
+        payload = json.loads(urlsafe_b64decode(cursor.encode()).decode())
+        sort_value, record_id, direction = (payload['value'], payload['id'],
+                                            payload['direction'])
+        if str(sort_column.type) == 'DATETIME' and sort_value is not None:
+            sort_value = datetime.strptime(sort_value, CURSOR_DATE_FORMAT)
+    except (DecodeError, ValueError, KeyError, TypeError):
+        raise ValidationError({
+            'message':
+            serialization_errors['invalid_query_strings'].format(
+                'cursor', cursor)
+        })
+
+    if direction not in ('next', 'previous'):
+        raise ValidationError({
+            'message':
+            serialization_errors['invalid_query_strings'].format(
+                'cursor', cursor)
+        })
+
+    return sort_value, record_id, direction
+
+
+def cursor_pagination_helper(model, records_query):
+    """Paginates a query by seeking on the sort column and id
+
+    Unlike offset pagination, the earlier pages are never scanned and the
+    total count is not computed, so every page costs the same.
+
+    Args:
+        model (class): Model being paginated
+        records_query (BaseQuery): The filtered query of the model
+
+    Raises:
+        ValidationError: if the sort column does not support cursors
+
+    Returns:
+        tuple: A tuple with the page records and the pagination meta dict
+    """
+    limit = validate_pagination_args(
+        request.args.get('limit', 'None'), 'limit')
+    sort_column, order = model.get_sort_column(request.args)
+
+    if str(sort_column.type) == 'JSON':
+        raise ValidationError({
+            'message':
+            serialization_errors['cursor_unsupported_sort'].format(
+                sort_column.key)
+        })
+
+    cursor = request.args.get('cursor')
+    direction = 'next'
+    if cursor:
+        sort_value, record_id, direction = decode_cursor(cursor, sort_column)
+        # Paging backwards walks the rows in the opposite order
+        seek_descending = (order == 'desc') == (direction == 'next')
+        records_query = records_query.filter(
+            seek_condition(sort_column, model.id, sort_value, record_id,
+                           greater=not seek_descending))
+
+    order = order if direction == 'next' else \
+        {'asc': 'desc', 'desc': 'asc'}[order]
+    # NULLs sort as the greatest values, as in the indexes of the columns
+    sort_order = getattr(sort_column, order)()
+    ordering = [
+        sort_order.nullslast() if order == 'asc' else sort_order.nullsfirst(),
+        getattr(model.id, order)()
+    ]
+
+    # An extra record is fetched to know if there is a page after this one
+    records = records_query.order_by(None).order_by(*ordering).limit(
+        limit + 1).all()
+    has_more = len(records) > limit
+    records = records[:limit]
+
+    if direction == 'previous':
+        records.reverse()
+
+    has_next = has_more if direction == 'next' else bool(cursor)
+    has_previous = has_more if direction == 'previous' else bool(cursor)
+
+    pagination_object = generate_cursor_metadata(
+        records, sort_column.key, limit, has_next, has_previous)
+
+    return records, pagination_object
+
+
+def seek_condition(sort_column, id_column, sort_value, record_id, greater):
+    """Builds the condition of the rows past the position of a cursor
+
+    The rows are ordered by the sort column then the id. NULL sort values
+    are greater than all the others and the rows having them are ordered by
+    the id alone, since a row comparison with a NULL never holds.
+
+    Args:
+        sort_column (Column): The column the records are sorted by
+        id_column (Column): The id column of the model
+        sort_value (any): Value of the sort column at the cursor
+        record_id (str): Id of the record at the cursor
+        greater (bool): Whether the rows after or before the cursor are kept
+
+    Returns:
+        BinaryExpression: the condition of the rows past the cursor
+    """
+    if sort_value is None:
+        null_rows = and_(
+            sort_column.is_(None),
+            id_column > record_id if greater else id_column < record_id)
+        return null_rows if greater else or_(sort_column.isnot(None),
+                                             null_rows)
+
+    position = tuple_(sort_column, id_column)
+    if greater:
+        return or_(position > tuple_(sort_value, record_id),
+                   sort_column.is_(None))
+    return position < tuple_(sort_value, record_id)
+
+
+def generate_cursor_metadata(records, sort_key, limit, has_next,
+                             has_previous):
+    """Generates the pagination metadata object for cursor pagination
+
+    Args:
+        records (list): The records on the current page
+        sort_key (str): The attribute the records are sorted by
+        limit (int): The count of records per page
+        has_next (bool): Whether there are records after this page
+        has_previous (bool): Whether there are records before this page
+
+    Returns:
+        dict: The pagination meta dict
+    """
+    next_cursor = previous_cursor = ''
+
+    if records and has_next:
+        last_record = records[-1]
+        next_cursor = encode_cursor(
+            getattr(last_record, sort_key), last_record.id, 'next')
+    if records and has_previous:
+        first_record = records[0]
+        previous_cursor = encode_cursor(
+            getattr(first_record, sort_key), first_record.id, 'previous')
+
+    return {
+        "firstPage": get_cursor_page_url(''),
+        "currentPage": request.url,
+        "nextPage": get_cursor_page_url(next_cursor) if next_cursor else '',
+        "previousPage":
+        get_cursor_page_url(previous_cursor) if previous_cursor else '',
+        "nextCursor": next_cursor,
+        "previousCursor": previous_cursor,
+        "limit": limit
+    }
+
+
+def get_cursor_page_url(cursor, **params):
+    """ Method to get the url of a page in cursor pagination
+    args:
+        cursor(str): The cursor of the page
+        params(dict): Query params to set on the url e.g the searched type
+    returns:
+        page_url(str): The request url pointing to the cursor
+    """
+    url = urlparse(request.url)
+    query_params = [
+        (key, value)
+        for key, value in parse_qsl(url.query, keep_blank_values=True)
+        if key not in ('cursor', 'page', *params)
+    ]
+    query_params.extend(params.items())
+    query_params.append(('cursor', cursor))
+    return url._replace(query=urlencode(query_params)).geturl()
+
+
 def list_paginator(list_data, paginate=None):
     """Paginate data that is in list form
 
@@ -0,0 +1,120 @@
+"""
+Module for executing the raw SQL queries as prepared statements
+"""
+# Standard
+import re
+from collections import OrderedDict
+from hashlib import sha1
+
+# Third party
+from flask import current_app
+from sqlalchemy import text
+
+# Database
+from api.models.database import db
+
+# Utilities
+from .constants import PREPARED_QUERIES_CACHE_SIZE, \
+    PREPARED_STATEMENTS_PER_CONNECTION
+from .helpers.lru_cache import LRUCache
+
+# the named bind parameters of a query, as matched by sqlalchemy `text`
+BIND_PARAMS = re.compile(r'(?<![:\w\\]):(\w+)(?![:\w])')
+
+# the statements and parameter names of the most recently prepared queries
+prepared_queries = LRUCache(PREPARED_QUERIES_CACHE_SIZE)
+
+
+def prepare_query(sql):
+    """Converts a query with named bind parameters into a statement that can
+    be prepared
+
+    Args:
+        sql (str): the query e.g `SELECT * FROM spaces WHERE id = :id`
+
+    Returns:
+        tuple: the name of the statement, the query with positional
+            parameters and the names of the parameters in their order
+    """
+    prepared = prepared_queries.get(sql)
+    if prepared is None:
+        names = []
+
+        def to_positional(match):
+            name = match.group(1)
+            if name not in names:
+                names.append(name)
+            return f'${names.index(name) + 1}'
+
+        statement = BIND_PARAMS.sub(to_positional, sql)
+        statement_name = f'activo_{sha1(sql.encode()).hexdigest()[:24]}'
+        prepared = (statement_name, statement, tuple(names))
+        prepared_queries.set(sql, prepared)
+    return prepared
+
+
+def execute_query(sql, bind=None, **params):
+    """Executes a query of the registry with bound values
+
+    The query is prepared once on each database connection, so Postgres
+    parses and plans it once and then only executes it with the values. Each
+    connection keeps its most recently used statements only, so the queries
+    formatted with identifiers do not pile up on the server.
+    When `PREPARE_SQL_QUERIES` is off, e.g behind a transaction pooler, the
+    query is executed with its bind parameters directly.
+
+    Args:
+        sql (str): the query with named bind parameters e.g `:start_date`
+        bind (Connection): the connection to execute the query on. Defaults
+            to a connection of the engine that is closed with the result
+        params (dict): the values of the bind parameters
+
+    Returns:
+        ResultProxy: the result of the query
+    """
+    connection = bind if bind is not None else db.engine.connect()
+
+    try:
+        query = get_prepared_query(connection, sql) \
+            if current_app.config.get('PREPARE_SQL_QUERIES', True) \
+            else text(sql)
+    except Exception:
+        if bind is None:
+            connection.close()
+        raise
+
+    if bind is None:
+        # like `engine.execute`, the connection is released with the result
+        connection.should_close_with_result = True
+    return connection.execute(query, **params)
+
+
+def get_prepared_query(connection, sql):
+    """Prepares a query on a connection unless it was already prepared on it
+
+    Once the connection holds `PREPARED_STATEMENTS_PER_CONNECTION`
+    statements, its least recently used statement is deallocated.
+
+    Args:
+        connection (Connection): the connection to prepare the query on
+        sql (str): the query with named bind parameters
+
+    Returns:
+        TextClause: the statement executing the prepared query
+    """
+    statement_name, statement, names = prepare_query(sql)
+    prepared = connection.connection.info.setdefault('prepared_statements',
+                                                     OrderedDict())
+    if statement_name in prepared:
+        prepared.move_to_end(statement_name)
+    else:
+        while len(prepared) >= PREPARED_STATEMENTS_PER_CONNECTION:
+            evicted_name, _ = prepared.popitem(last=False)
+            connection.execute(text(f'DEALLOCATE {evicted_name}')).close()
+        connection.execute(
+            text(f'PREPARE {statement_name} AS {statement}')).close()
+        prepared[statement_name] = None
+
+    arguments = ', '.join(f':{name}' for name in names)
+    return text(f'EXECUTE {statement_name}({arguments})'
+                if names else f'EXECUTE {statement_name}')
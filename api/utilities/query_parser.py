@@ -16,6 +16,8 @@ from api.models.base.base_model import BaseModel
 # Error messages
 from ..utilities.messages.error_messages import query_errors, filter_errors
 from ..utilities.helpers.check_prefix import check_prefix
+from ..utilities.helpers.lru_cache import LRUCache
+from ..utilities.constants import FILTER_PLAN_CACHE_SIZE
 
 
 class QueryParser():
@@ -24,7 +26,13 @@ class QueryParser():
     """
 
     # Queries excluded from parsing
-    excluded_keys = ['include', 'limit', 'page', 'deleted', 'sort', 'order']
+    excluded_keys = [
+        'include', 'limit', 'page', 'deleted', 'sort', 'order', 'cursor',
+        'total_count'
+    ]
+
+    # The parsed queries of the most recent url queries of each model
+    parsed_queries = LRUCache(FILTER_PLAN_CACHE_SIZE)
 
     @classmethod
     def parse(cls, model, key, value):
@@ -45,7 +53,8 @@ class QueryParser():
         value = value.strip().lower()
         operator = ''
         # Don't parse queries that are excluded
-        if actual_key.lower() in cls.excluded_keys:
+        if actual_key.lower() in cls.excluded_keys or \
+                cls.to_snake_case(actual_key) in cls.excluded_keys:
             return None
 
         # Parse as old syntax, if key is `where`
@@ -72,17 +81,25 @@ class QueryParser():
         """
         Parses multiple url queries
 
+        The parsed queries are cached per model and url queries, so polling
+        with the same queries does not parse and validate them again.
+
         Parameters:
             model (BaseModel): the model a filter is being generated for
             url_queries (ImmutableMultiDict): the arguments being sent via
               the url
         """
-        where_list = []
-        for key, value in url_queries.items():
-            result = cls.parse(model, key, value)
-            if result:
-                where_list.append(('where', result.get('where')))
-        return ImmutableMultiDict(where_list)
+        items = tuple(url_queries.items())
+        parsed = cls.parsed_queries.get((model, items))
+        if parsed is None:
+            where_list = []
+            for key, value in items:
+                result = cls.parse(model, key, value)
+                if result:
+                    where_list.append(('where', result.get('where')))
+            parsed = ImmutableMultiDict(where_list)
+            cls.parsed_queries.set((model, items), parsed)
+        return parsed
 
     @classmethod
     def parse_where_query(cls, value):
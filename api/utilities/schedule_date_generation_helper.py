@@ -12,13 +12,15 @@ from dateutil import parser
 class ScheduleGeneratorHelper:
     """ This is a helper to generate dates """
 
-    def __init__(self, work_order_object):
+    def __init__(self, work_order_object, until=None):
         """ Constructor to init common data
         Args:
             work_order_object(obj): Object of inserted work order
+            until(datetime): the date after which no dates are generated
         """
         self.start_date = work_order_object.start_date
         self.work_order_object = work_order_object
+        self.until = until
         self.end_date = ScheduleGeneratorHelper.get_end_date(self)
 
     def get_end_date(self):
@@ -28,8 +30,19 @@ class ScheduleGeneratorHelper:
                 self.end_date(datetime) : e.g. datetime(2019,2,23,4,5))
         """
         if self.work_order_object.end_date:
-            return self.work_order_object.end_date
-        return self.get_end_of_year()
+            return self.cap(self.work_order_object.end_date)
+        return self.cap(self.get_end_of_year())
+
+    def cap(self, end_date):
+        """ This method limits an end date to the until date
+            Args:
+                end_date(datetime): e.g. datetime(2019,2,23,4,5))
+            Returns:
+                (datetime): the earliest of the end date and the until date
+        """
+        if self.until and end_date > self.until:
+            return self.until
+        return end_date
 
     def mapper_for_specific_days(self):
         """ This method maps specific weekdays to dateutl objects for dates
@@ -89,12 +102,13 @@ class ScheduleGeneratorHelper:
 class GenerateCustomDates(ScheduleGeneratorHelper):
     """This class generates dates for custom fields"""
 
-    def __init__(self, work_order_object):
+    def __init__(self, work_order_object, until=None):
         """ Init method getting
             Args:
               work_order_object(obj):Object of inserted work order
+              until(datetime): the date after which no dates are generated
         """
-        ScheduleGeneratorHelper.__init__(self, work_order_object)
+        ScheduleGeneratorHelper.__init__(self, work_order_object, until)
         self.start_date = work_order_object.start_date
         self.custom_occurrence = {} if not self.work_order_object.custom_occurrence else \
             self.work_order_object.custom_occurrence
@@ -151,12 +165,12 @@ class GenerateCustomDates(ScheduleGeneratorHelper):
         json_date = self.get_end_date()
         end_date = None if not json_date else parser.parse(json_date)
         if end_date:
-            kwargs["until"] = end_date
+            kwargs["until"] = self.cap(end_date)
         elif self.custom_occurrence.get("ends") \
             and self.custom_occurrence.get("ends").get("after"):
             kwargs["count"] = self.custom_occurrence.get("ends").get("after")
         else:
-            kwargs["until"] = self.get_end_of_year()
+            kwargs["until"] = self.cap(self.get_end_of_year())
 
         return [
             date for date in rrule(
@@ -173,8 +187,8 @@ class GenerateDates(GenerateCustomDates):
     custom to inherited class
     """
 
-    def __init__(self, work_order_object):
-        GenerateCustomDates.__init__(self, work_order_object)
+    def __init__(self, work_order_object, until=None):
+        GenerateCustomDates.__init__(self, work_order_object, until)
         self.work_order_object = work_order_object
         self.end_date = ScheduleGeneratorHelper.get_end_date(self)
 
@@ -19,33 +19,32 @@ SELECT_CATEGORIES_WITH_STATS = \
     """
 ASSET_CATEGORIES_WITH_STATS_CTE = \
     """
-     WITH categories AS (SELECT ac.id,ac.name,ac.priority,ac.running_low, ac.parent_id,
+     WITH category_stats AS (SELECT stats.asset_category_id, NULLIF(stats.center_id, '') AS center_id,
+    stats.status, stats.assignee_type, stats.assets_count FROM asset_category_stats stats),
+
+    categories AS (SELECT ac.id,ac.name,ac.priority,ac.running_low, ac.parent_id,
     ac.created_at,ac.updated_at,ac.deleted,ac.deleted_at,ac.created_by,ac.updated_by,ac.deleted_by,ac.low_in_stock,ac.image::jsonb,
-    count(a.id) AS assets_count
-    FROM asset_categories ac LEFT JOIN  asset a ON ac.id = a.asset_category_id
-    AND a.deleted = false
+    COALESCE(sum(a.assets_count), 0)::bigint AS assets_count
+    FROM asset_categories ac LEFT JOIN category_stats a ON ac.id = a.asset_category_id
     WHERE ac.deleted = false GROUP BY ac.id),
 
-    total_ok_assets AS (SELECT count(asset.id) AS total_ok_assets, asset.asset_category_id FROM asset
-    WHERE asset.deleted = false  AND asset.center_id IS NOT NULL AND asset.status
+    total_ok_assets AS (SELECT sum(asset.assets_count)::bigint AS total_ok_assets, asset.asset_category_id
+    FROM category_stats asset
+    WHERE asset.assets_count > 0 AND asset.center_id IS NOT NULL AND asset.status
     IN {ok_status}
     GROUP BY asset.asset_category_id),
 
-    assets_assigned_to_spaces AS (SELECT count(asset.assignee_type) AS space_assignee, asset_category_id
-    FROM asset WHERE asset.assignee_type = 'space' AND asset.deleted = False  AND asset.center_id IS NOT NULL
+    assets_assigned_to_spaces AS (SELECT sum(asset.assets_count)::bigint AS space_assignee, asset_category_id
+    FROM category_stats asset WHERE asset.assignee_type = 'space' AND asset.assets_count > 0 AND asset.center_id IS NOT NULL
     AND asset.status IN {ok_status}
     GROUP BY asset.asset_category_id),
 
-    assets_assigned_to_users AS (SELECT count(asset.assignee_type) AS people_assignee, asset_category_id
-    FROM asset WHERE asset.assignee_type = 'user'  AND asset.deleted = False  AND asset.center_id IS NOT NULL 
-    AND  asset.status IN {ok_status}
+    assets_assigned_to_users AS (SELECT sum(asset.assets_count)::bigint AS people_assignee, asset_category_id
+    FROM category_stats asset WHERE asset.assignee_type = 'user' AND asset.assets_count > 0 AND asset.center_id IS NOT NULL
+    AND asset.status IN {ok_status}
     GROUP BY asset.asset_category_id),
 
-    {LAST_STOCK},
-
-    last_stock_count AS (SELECT stock_counts.count AS last_stock_count, stock_date, stock_counts.asset_category_id
-    FROM stock_counts JOIN last_stock ON stock_counts.created_at = last_stock.stock_date
-    WHERE stock_counts.deleted = False AND stock_counts.center_id IS NOT NULL AND stock_counts.asset_category_id = last_stock.asset_category_id),
+    {LAST_STOCK_COUNT},
 
     categories_with_stats AS (SELECT c.*,
     COALESCE(total_ok_assets,0) AS total_ok_assets, COALESCE(space_assignee,0) AS space_assignee,
@@ -57,11 +56,35 @@ ASSET_CATEGORIES_WITH_STATS_CTE = \
 
     {select}
     """
-date_filter = "AND stock_counts.created_at between {startDate} and {endDate}"
-LAST_STOCK = last_stock()
+
+# last stock counts of the categories read from the maintained table
+MAINTAINED_LAST_STOCK_COUNT = \
+    """
+    last_stock_count AS (SELECT stock_counts.last_stock_count, stock_counts.stock_date, stock_counts.asset_category_id
+    FROM asset_category_last_stock stock_counts
+    WHERE stock_counts.last_stock_count IS NOT NULL AND stock_counts.center_id IS NOT NULL)
+    """
+
+# last stock counts of the categories within a date range
+LAST_STOCK_COUNT_IN_RANGE = \
+    """
+    {LAST_STOCK},
+
+    last_stock_count AS (SELECT stock_counts.count AS last_stock_count, stock_date, stock_counts.asset_category_id
+    FROM stock_counts JOIN last_stock ON stock_counts.created_at = last_stock.stock_date
+    WHERE stock_counts.deleted = False AND stock_counts.center_id IS NOT NULL AND stock_counts.asset_category_id = last_stock.asset_category_id)
+    """
+
+# the range defaults to the dates of the first and last stock counts
+date_filter = """AND stock_counts.created_at BETWEEN
+    COALESCE(CAST(:start_date AS timestamp), (select min(stock_counts.created_at) from stock_counts))
+    AND COALESCE(CAST(:end_date AS timestamp), (select max(stock_counts.created_at) from stock_counts))"""
 
 LAST_STOCK_WITH_DATE = last_stock(extra_filter=date_filter)
 
+LAST_STOCK_COUNT_WITH_DATE = LAST_STOCK_COUNT_IN_RANGE.format(
+    LAST_STOCK=LAST_STOCK_WITH_DATE)
+
 # sql to get list of asset categories with custom attributes and  stats from CTE
 SELECT_CATEGORIES_WITH_ATTRIBUTES_AND_STATS = \
     """
@@ -78,14 +101,13 @@ SELECT_CATEGORIES_WITH_ATTRIBUTES_AND_STATS = \
 # sql to get a single asset category with stats from CTE
 SELECT_CATEGORY_STATS = "SELECT * FROM categories_with_stats cws WHERE cws.id = :cat_id"
 
-start = "(select min(stock_counts.created_at) from stock_counts)"
-end = "(select max(stock_counts.created_at) from stock_counts)"
-
-
 EXISTS = \
     """
     SELECT 1
     FROM {table}
-    WHERE {table}.{column} = '{value}'
+    WHERE {table}.{column} = :value
     AND {table}.deleted = false
     """
+
+# filters the rows of the maintained stats tables by asset category
+STATS_CATEGORY_FILTER = "AND {table}.asset_category_id = ANY(:category_ids)"
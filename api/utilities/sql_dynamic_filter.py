@@ -5,7 +5,6 @@ from datetime import datetime
 # Local Modules
 from api.middlewares.base_validator import ValidationError
 from api.utilities.messages.error_messages import filter_errors
-from api.utilities.constants import DATE_COLUMNS
 from api.utilities.error import raises
 from .dynamic_filter import DynamicFilter
 import re
@@ -24,7 +23,8 @@ class SQLDynamicFilter(DynamicFilter):
             columns (list): list of columns that belongs to a particular table
 
         Returns:
-            (str): the filters for sql query
+            (tuple): the filters for sql query and the values of their bind
+                parameters
         """
 
         # get table columns and types
@@ -45,45 +45,67 @@ class SQLDynamicFilter(DynamicFilter):
         column_types = dict(zip(columns, valid_types))
 
         filter_conditions = ''
+        params = {}
 
         raw_filters = args.getlist('where')
         for raw in raw_filters:
 
             filter_conditions = self.get_where_conditions(
-                raw, filter_conditions, columns)
+                raw, filter_conditions, columns, params)
 
         filter_conditions = self.get_key_conditions(args, filter_conditions,
-                                                    columns, column_types)
+                                                    columns, column_types,
+                                                    params)
 
-        return filter_conditions
+        return filter_conditions, params
 
-    def sql_filter_mapper(self, column, op, value):
+    @staticmethod
+    def bind_value(params, value):
+        """Adds the value of a filter condition to the bind parameters
+
+        Args:
+            params (dict): The values of the bind parameters of the filters
+            value (str): The filter condition value
+
+        Returns:
+            (str): The bind parameter of the value e.g `:filter_0`
+        """
+
+        name = f'filter_{len(params)}'
+        params[name] = value
+        return f':{name}'
+
+    def sql_filter_mapper(self, column, op, value, params):
         """Maps an operator to sql filter condition
 
         Args:
             column (str): The table column for filter
             op (str): The operator to be mapped
             value (str): The filter condition value to be matched
+            params (dict): The values of the bind parameters of the filters
 
         Returns:
             (str): A filter condition
         """
 
-        if column in DATE_COLUMNS:
-            value = f"'{value}'"
+        op = op.lower().strip()
         op_mapper = {
-            'like': f"{column} ilike '%{value}%'",
-            'eq': f"{column} = {value}",
-            'lt': f"{column} < {value}",
-            'ne': f"{column} != {value}",
-            'gt': f"{column} > {value}",
-            'le': f"{column} <= {value}",
-            'ge': f"{column} >= {value}",
+            'like': 'ILIKE',
+            'eq': '=',
+            'lt': '<',
+            'ne': '!=',
+            'gt': '>',
+            'le': '<=',
+            'ge': '>=',
         }
+        if op not in op_mapper:
+            return ''
 
-        return op_mapper.get(op.lower().strip(), '')
+        if op == 'like':
+            value = f'%{value}%'
+        return f'{column} {op_mapper[op]} {self.bind_value(params, value)}'
 
-    def get_where_conditions(self, raw, filter_conditions, columns):
+    def get_where_conditions(self, raw, filter_conditions, columns, params):
         """Returns filters for sql query from where parameters.
 
         Builds filter condition from the where parameters
@@ -96,6 +118,7 @@ class SQLDynamicFilter(DynamicFilter):
             raw (str): the conditions to be parsed
             filter_conditions (str): The request query object
             columns (list): list of columns that belongs to a particular table
+            params (dict): The values of the bind parameters of the filters
 
         Returns:
             (str): the sql filter conditions
@@ -109,7 +132,7 @@ class SQLDynamicFilter(DynamicFilter):
             raise ValidationError(
                 dict(message=filter_errors['INVALID_COLUMN'].format( key_in_snake_case)))
 
-        return filter_conditions + f' AND {self.sql_filter_mapper(column, op, value)}'
+        return filter_conditions + f' AND {self.sql_filter_mapper(column, op, value, params)}'
 
     def to_type(self, value):
         """Converts string value to int if the
@@ -145,7 +168,7 @@ class SQLDynamicFilter(DynamicFilter):
             raises('invalid_value', 400, value, key + ' field')
 
     def get_key_conditions(self, args, filter_conditions, columns,
-                           column_types):
+                           column_types, params):
         """Returns filters condition from query fields.
 
         Builds filter condition from the query parameters
@@ -160,6 +183,7 @@ class SQLDynamicFilter(DynamicFilter):
             filter_conditions (str): The request query object
             columns (list): list of columns that belongs to a particular table
             columns_types (dict): dict mapping column names to types
+            params (dict): The values of the bind parameters of the filters
 
         Returns:
             (str): the sql filter conditions
@@ -178,6 +202,7 @@ class SQLDynamicFilter(DynamicFilter):
 
             if snake_case_key in columns:
                 self.validate_value_type(snake_case_key, value, column_types)
-                filters += f" AND {snake_case_key} = '{value}'"
+                filters += \
+                    f' AND {snake_case_key} = {self.bind_value(params, value)}'
 
         return filters
@@ -1,12 +1,17 @@
 """
 Module for raw SQL queries
+
+The values of the queries are bind parameters e.g `:start_date`, so that each
+query has one statement text that is prepared once per connection by
+`execute_query`. Only identifiers and the conditions of dynamic filters, whose
+values are bind parameters as well, are formatted into the queries.
 """
 
 from ..utilities.enums import AssetStatus
 from ..utilities.sql_constants import \
-    ASSET_CATEGORIES_WITH_STATS_CTE, LAST_STOCK, LAST_STOCK_WITH_DATE,\
-    SELECT_CATEGORIES_WITH_STATS, SELECT_CATEGORIES_WITH_ATTRIBUTES_AND_STATS,\
-    SELECT_CATEGORY_STATS
+    ASSET_CATEGORIES_WITH_STATS_CTE, MAINTAINED_LAST_STOCK_COUNT,\
+    LAST_STOCK_COUNT_WITH_DATE, SELECT_CATEGORIES_WITH_STATS,\
+    SELECT_CATEGORIES_WITH_ATTRIBUTES_AND_STATS, SELECT_CATEGORY_STATS
 
 ok_status = AssetStatus.get_ok_status()
 get_reconciliation_status = AssetStatus.get_reconciliation_status()
@@ -14,7 +19,7 @@ get_reconciliation_status = AssetStatus.get_reconciliation_status()
 # CTE implementation to get asset categories with stats
 """
 ALIAS USED IN THIS CTE
-a     asset
+a     asset category stats
 aas   assets_assigned_to_spaces
 aau   assets_assigned_to_users
 ac    asset categories
@@ -35,33 +40,99 @@ sql_queries = {
     JOIN resource_permissions ON resource_permissions.resource_access_level_id = resource_access_levels.id
     JOIN permissions ON permissions.id = resource_permissions.permission_id
     JOIN resources ON resources.id = resource_access_levels.resource_id
-    WHERE users.token_id = '{0}' AND users.deleted=False  AND resources.name = '{1}' AND permissions.type != '{2}' AND (permissions.type = '{3}' OR permissions.type = '{4}')
+    WHERE users.token_id = :token_id AND users.deleted=False  AND resources.name = :resource_name AND permissions.type != :no_access AND (permissions.type = :full_access OR permissions.type = :permission_type)
+    ''',
+    'permission_matrix':
+    '''\
+    SELECT resource_access_levels.role_id AS role_id, resources.name AS resource_name, permissions.type AS permission_type
+    FROM resource_access_levels
+    JOIN resource_permissions ON resource_permissions.resource_access_level_id = resource_access_levels.id
+    JOIN permissions ON permissions.id = resource_permissions.permission_id
+    JOIN resources ON resources.id = resource_access_levels.resource_id
     ''',
     'check_asset_category_levels':
     '''
     SELECT name, running_low,low_in_stock, COUNT(asset.id) AS available_assets FROM asset_categories
-    LEFT JOIN asset ON asset.asset_category_id = asset_categories.id AND asset.status IN ('{0}', '{1}', '{2}') AND asset.deleted = False
+    LEFT JOIN asset ON asset.asset_category_id = asset_categories.id AND asset.status = ANY(:statuses) AND asset.deleted = False
     WHERE asset_categories.deleted = False GROUP BY asset_categories.id
     ''',
     'unreconciled_asset':
         ASSET_CATEGORIES_WITH_STATS_CTE
-        .format(ok_status=ok_status, LAST_STOCK=LAST_STOCK_WITH_DATE, select=SELECT_CATEGORIES_WITH_STATS),
+        .format(ok_status=ok_status, LAST_STOCK_COUNT=LAST_STOCK_COUNT_WITH_DATE, select=SELECT_CATEGORIES_WITH_STATS),
 
     'categories_with_stats':
     ASSET_CATEGORIES_WITH_STATS_CTE
-        .format(ok_status=ok_status, LAST_STOCK=LAST_STOCK, select=SELECT_CATEGORIES_WITH_STATS),
+        .format(ok_status=ok_status, LAST_STOCK_COUNT=MAINTAINED_LAST_STOCK_COUNT, select=SELECT_CATEGORIES_WITH_STATS),
     'attributes_and_stats':
     ASSET_CATEGORIES_WITH_STATS_CTE
-        .format(ok_status=ok_status, LAST_STOCK=LAST_STOCK, select=SELECT_CATEGORIES_WITH_ATTRIBUTES_AND_STATS),
+        .format(ok_status=ok_status, LAST_STOCK_COUNT=MAINTAINED_LAST_STOCK_COUNT, select=SELECT_CATEGORIES_WITH_ATTRIBUTES_AND_STATS),
     'single_category_stats': ASSET_CATEGORIES_WITH_STATS_CTE
-        .format(ok_status=ok_status, LAST_STOCK=LAST_STOCK, select=SELECT_CATEGORY_STATS),
+        .format(ok_status=ok_status, LAST_STOCK_COUNT=MAINTAINED_LAST_STOCK_COUNT, select=SELECT_CATEGORY_STATS),
+    'increment_asset_category_stats':
+    '''
+    INSERT INTO asset_category_stats (asset_category_id, center_id, status, assignee_type, assets_count)
+    VALUES (:asset_category_id, :center_id, :status, :assignee_type, :delta)
+    ON CONFLICT (asset_category_id, center_id, status, assignee_type)
+    DO UPDATE SET assets_count = asset_category_stats.assets_count + EXCLUDED.assets_count
+    ''',
+    'clear_asset_category_stats':
+    'DELETE FROM asset_category_stats WHERE TRUE {filter}',
+    'rebuild_asset_category_stats':
+    '''
+    INSERT INTO asset_category_stats (asset_category_id, center_id, status, assignee_type, assets_count)
+    SELECT asset.asset_category_id, COALESCE(asset.center_id, ''), asset.status, asset.assignee_type::text, count(asset.id)
+    FROM asset WHERE asset.deleted = false {filter}
+    GROUP BY asset.asset_category_id, COALESCE(asset.center_id, ''), asset.status, asset.assignee_type
+    ''',
+    'clear_asset_category_last_stock':
+    'DELETE FROM asset_category_last_stock WHERE TRUE {filter}',
+    'rebuild_asset_category_last_stock':
+    '''
+    INSERT INTO asset_category_last_stock (stock_count_id, asset_category_id, center_id, last_stock_count, stock_date)
+    SELECT stock_counts.id, stock_counts.asset_category_id, stock_counts.center_id, stock_counts.count, stock_counts.created_at
+    FROM stock_counts JOIN (SELECT max(stock_counts.created_at) AS stock_date, stock_counts.asset_category_id
+    FROM stock_counts WHERE stock_counts.deleted = false {filter} GROUP BY stock_counts.asset_category_id) AS last_stock
+    ON stock_counts.asset_category_id = last_stock.asset_category_id AND stock_counts.created_at = last_stock.stock_date
+    WHERE stock_counts.deleted = false
+    ''',
+    'create_asset_staging':
+    '''
+    DROP TABLE IF EXISTS pg_temp.asset_staging;
+    CREATE TEMP TABLE asset_staging (LIKE asset INCLUDING DEFAULTS, ordinal integer NOT NULL) ON COMMIT DROP
+    ''',
+    'copy_asset_staging': 'COPY asset_staging ({columns}) FROM STDIN WITH (FORMAT csv)',
+    'resolve_staged_store_assignees':
+    '''
+    UPDATE asset_staging SET assignee_type = 'store'
+    FROM spaces JOIN space_types ON space_types.id = spaces.space_type_id
+    WHERE asset_staging.assignee_type = 'space' AND asset_staging.assignee_id = spaces.id
+    AND spaces.deleted = false AND space_types.type = 'Store'
+    ''',
+    'delete_staged_missing_assignees':
+    '''
+    DELETE FROM asset_staging
+    WHERE NOT EXISTS (
+        SELECT 1 FROM users WHERE asset_staging.assignee_type = 'user' AND users.token_id = asset_staging.assignee_id
+    ) AND NOT EXISTS (
+        SELECT 1 FROM spaces WHERE asset_staging.assignee_type <> 'user' AND spaces.id = asset_staging.assignee_id
+        AND spaces.deleted = false
+    )
+    RETURNING asset_staging.id
+    ''',
+    'estimate_table_count':
+    'SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table_name AS regclass)',
+    'insert_staged_assets':
+    '''
+    INSERT INTO asset ({columns}) SELECT DISTINCT ON (tag) {columns} FROM asset_staging
+    ORDER BY tag, ordinal ON CONFLICT (tag) DO NOTHING RETURNING asset.id
+    ''',
     'asset_categories_count': 'SELECT COUNT(*) FROM asset_categories ac WHERE ac.deleted=FALSE AND ac.parent_id IS NULL',
     'get_total_reconciliation':
     '''
     WITH category AS (SELECT DISTINCT asset_categories.name, asset_categories.id, stock_counts.count FROM asset_categories
     JOIN asset ON asset.asset_category_id = asset_categories.id
     JOIN stock_counts ON stock_counts.asset_category_id = asset_categories.id
-    WHERE asset.deleted = False AND asset.center_id IS NOT NULL AND asset_categories.deleted=False AND stock_counts.created_at BETWEEN '{0}' AND '{1}'),
+    WHERE asset.deleted = False AND asset.center_id IS NOT NULL AND asset_categories.deleted=False AND stock_counts.created_at BETWEEN :start_date AND :end_date),
 
     ok_asset_expected_store_count AS (select COUNT(asset.id) AS ok_asset_expected_store_count FROM asset
     JOIN category ON category.id = asset.asset_category_id AND asset.deleted = False ''' + f'''
@@ -73,10 +144,10 @@ sql_queries = {
     '''
     WITH inflow AS (SELECT COUNT(id) AS inflow
     FROM asset WHERE asset.deleted = False AND asset.assignee_type = 'store'
-    AND asset.date_assigned BETWEEN '{0}' AND '{1}'), outflow AS (select COUNT(id) AS outflow
+    AND asset.date_assigned BETWEEN :start_date AND :end_date), outflow AS (select COUNT(id) AS outflow
     FROM asset
     WHERE asset.deleted = False AND asset.assignee_type != 'store'
-    AND asset.date_assigned BETWEEN '{0}' AND '{1}')
+    AND asset.date_assigned BETWEEN :start_date AND :end_date)
     SELECT * FROM inflow, outflow
     ''',
     'get_summary_request':
@@ -88,7 +159,7 @@ sql_queries = {
     sum(case when status = 'closed' then 1 else 0 end) as totalClosedRequests,
     sum(case when due_by < now() and (status='open' or status='in_progress') then 1 else 0 end) as totalOverdueRequests
     from  requests
-    {}
+    {filter}
     ''',
     'get_due_schedules':
     '''
@@ -121,31 +192,54 @@ sql_queries = {
     (SELECT hot_desk_ref_no FROM hot_desk_requests WHERE created_at = MAX(hot.created_at) LIMIT 1),
     (SELECT requester_id FROM hot_desk_requests WHERE created_at = MAX(hot.created_at) LIMIT 1),
     (SELECT assignee_id FROM hot_desk_requests WHERE created_at = MAX(hot.created_at) LIMIT 1)
-    FROM hot_desk_requests AS hot WHERE status='{0}' AND \
-    deleted=FALSE AND created_at BETWEEN '{1}' AND '{2}'
+    FROM hot_desk_requests AS hot WHERE status = :status AND \
+    deleted=FALSE AND created_at BETWEEN :start_date AND :end_date
     group by requester_id
     ''',
     'trends_allocation':
     '''
     SELECT
-    date_part('{0}', created_at::date) AS {1},
-    sum(case when hot_desk_requests.status = 'approved' then 1 else 0 end) as sum  
+    date_part(CAST(:frequency AS text), created_at::date) AS {period},
+    sum(case when hot_desk_requests.status = 'approved' then 1 else 0 end) as sum
     FROM hot_desk_requests
-    WHERE hot_desk_ref_no LIKE '{2}%'
-    AND created_at between '{3}' and '{4}'
-    GROUP BY {1}
-    ORDER BY {1}
+    WHERE hot_desk_ref_no LIKE CAST(:floor AS text) || '%'
+    AND created_at between :start_date and :end_date
+    GROUP BY {period}
+    ORDER BY {period}
     ''',
     'get_building_spaces':
     '''
-    WITH RECURSIVE CTE AS (
-    SELECT * from spaces where spaces.id='{}'
-    UNION ALL
-    SELECT spaces.*
-    from CTE c
-    JOIN spaces
-    on spaces.parent_id=c.id)
-    SELECT CTE.id,name,parent_id as "parentId",space_type_id as "spaceTypeId", type, color, center_id as "centerId" from CTE JOIN space_types ON space_type_id=space_types.id WHERE CTE.deleted=FALSE
+    SELECT spaces.id, name, parent_id as "parentId", space_type_id as "spaceTypeId", type, color, center_id as "centerId"
+    FROM spaces JOIN space_types ON space_type_id=space_types.id
+    WHERE spaces.path LIKE :pattern AND spaces.deleted=FALSE
+    ''',
+    'get_space_path':
+    'SELECT path FROM spaces WHERE id = :id',
+    'move_space_descendants':
+    '''
+    UPDATE spaces SET path = :path || substr(path, length(:previous_path) + 1)
+    WHERE path LIKE :pattern AND id != :id
+    ''',
+    'subtree_assets_count':
+    '''
+    SELECT split_part(spaces.path, '/', :level) AS id, count(asset.id) AS assets_count
+    FROM spaces LEFT JOIN asset ON asset.assignee_id = spaces.id
+    AND asset.assignee_type IN ('space', 'store') AND asset.deleted = FALSE
+    WHERE spaces.path LIKE :pattern AND spaces.deleted = FALSE
+    GROUP BY 1
+    ''',
+    'close_expired_requests':
+    '''
+    UPDATE requests SET status = 'closed', closed_by_system = TRUE, closed_at = :now
+    FROM request_types
+    WHERE requests.request_type_id = request_types.id
+    AND requests.status = 'completed' AND requests.deleted = FALSE
+    AND requests.completed_at < :now - (
+    COALESCE(CAST(request_types.closure_time->>'weeks' AS float), 0) * interval '1 week' +
+    COALESCE(CAST(request_types.closure_time->>'days' AS float), 0) * interval '1 day' +
+    COALESCE(CAST(request_types.closure_time->>'hours' AS float), 0) * interval '1 hour' +
+    COALESCE(CAST(request_types.closure_time->>'minutes' AS float), 0) * interval '1 minute' +
+    COALESCE(CAST(request_types.closure_time->>'seconds' AS float), 0) * interval '1 second')
     ''',
     'get_space_types':
     '''
@@ -162,7 +256,7 @@ sql_queries = {
     AS other_count
     FROM  hot_desk_requests
     WHERE status ='cancelled'
-    AND created_at between '{0}' AND '{1}'
+    AND created_at between :start_date AND :end_date
     ''',
     'hotdesk_responder_counts':
     '''
@@ -171,29 +265,29 @@ sql_queries = {
     ) as approvals_count,
     COUNT(CASE WHEN status='rejected' and (is_escalated is not True) THEN 1 ELSE NULL END
     ) as rejections_count,
-    COUNT(CASE WHEN (status='pending' and created_at < '{0}') or is_escalated THEN 1 ELSE NULL END
+    COUNT(CASE WHEN (status='pending' and created_at < :pending_time) or is_escalated THEN 1 ELSE NULL END
     ) as missed_count,
     assignee_id
-    FROM hot_desk_responses where created_at between '{1}' and '{2}'
+    FROM hot_desk_responses where created_at between :start_date and :end_date
     GROUP BY assignee_id
     ''',
     'trends_allocation_of_user':
     '''
     SELECT
-    date_part('{0}', created_at::date) AS {1},
-    sum(case when hot_desk_requests.requester_id = '{2}' then 1 else 0 end) AS sum
+    date_part(CAST(:frequency AS text), created_at::date) AS {period},
+    sum(case when hot_desk_requests.requester_id = :user_id then 1 else 0 end) AS sum
     FROM hot_desk_requests
-    WHERE hot_desk_ref_no LIKE '{3}%'
+    WHERE hot_desk_ref_no LIKE CAST(:floor AS text) || '%'
     AND status='approved'
-    AND created_at between '{4}' and '{5}'
-    GROUP BY {1}
-    ORDER BY {1}
+    AND created_at between :start_date and :end_date
+    GROUP BY {period}
+    ORDER BY {period}
     ''',
     'get_asset_category_subcategories':
     '''
     WITH RECURSIVE CTE AS (
     SELECT * FROM asset_categories
-    WHERE asset_categories.id = '{}'
+    WHERE asset_categories.id = :category_id
     UNION ALL
     SELECT ac.* from CTE
     JOIN asset_categories ac ON ac.parent_id = CTE.id)
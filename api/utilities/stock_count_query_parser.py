@@ -67,8 +67,22 @@ class StockCountQueryParser(QueryParser):
 
     @classmethod
     def get_filtered_stock_counts(cls, url_queries, include_deleted=False):
-        column_filters, month_filter, year_filter = \
-            cls.parse_all(StockCount, url_queries)
+        return cls.filter_stock_counts(
+            cls.parse_all(StockCount, url_queries), include_deleted)
+
+    @classmethod
+    def filter_stock_counts(cls, filters, include_deleted=False):
+        """Queries the stock counts matching parsed filters
+
+        Args:
+            filters (tuple): The column, month and year filters returned by
+                `parse_all`
+            include_deleted (bool): Whether to include deleted stock counts
+
+        Returns:
+            Query: the stock counts
+        """
+        column_filters, month_filter, year_filter = filters
 
         raw_stock_counts = StockCount.query_(column_filters, include_deleted=include_deleted) \
             .join(AssetCategory) \
@@ -0,0 +1,11 @@
+"""
+This module contains export job collection definitions for use by swagger UI
+"""
+
+from ..collections import api
+
+export_job_namespace = api.namespace(
+    'export jobs',
+    description='A collection of asynchronous export endpoints',
+    path='/export-jobs'
+)
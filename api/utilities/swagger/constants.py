@@ -9,7 +9,9 @@ EXPORT_USER_REQUEST_PARAMS = {
 
 PAGINATION_PARAMS = {
     "page": {"description": "page number"},
-    "limit": {"description": "limit number of items"}
+    "limit": {"description": "limit number of items"},
+    "cursor": {"description": "cursor of the page, enables cursor pagination"},
+    "totalCount": {"description": "count strategy: exact, estimated or cached"}
 }
 
 USER_REQUEST_PARAMS = {}
@@ -0,0 +1,21 @@
+"""
+Model Definition for export jobs collection
+"""
+
+from flask_restplus import fields
+
+from ..collections.export_job import export_job_namespace
+
+export_job_model = export_job_namespace.model(
+    "export_job_model", {
+        'exportType': fields.String(
+            required=True,
+            description='assets, users, stock-counts, asset-analytics or '
+            'hot-desk-analytics'),
+        'fileFormat': fields.String(
+            required=False, description='csv or xlsx'),
+        'query': fields.Raw(
+            required=False,
+            description='the query parameters of the export endpoint')
+    }
+)
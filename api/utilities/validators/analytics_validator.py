@@ -10,6 +10,24 @@ from flask import request
 from ..error import raises
 
 
+def validate_report_query(query, report_queries):
+    """Validates the report query of url queries
+
+    Args:
+        query (dict): the url queries
+        report_queries (list): a list of supported queries
+
+    Returns:
+        str: the report query
+    """
+    report_query = query.get('report', '').lower().strip()
+
+    if report_query and report_query not in report_queries:
+        raises('invalid_request_param', 400, 'report query',
+               ', '.join(report_queries))
+    return report_query
+
+
 def report_query_validator(report_queries):
     """Validates report query
 
@@ -24,16 +42,13 @@ def report_query_validator(report_queries):
     def decorator(func):
         @wraps(func)
         def decorated_function(*args, **kwargs):
-            report_query = request.args.get('report', '').lower().strip()
-
-            if report_query and report_query not in report_queries:
-                raises('invalid_request_param', 400, 'report query', ', '.join(report_queries))
-            else:
-                # to make the function wrapped by the decorator accept more
-                # arguments and report_query has to be passed, to whatever
-                # function the decorator is used for, remember to make
-                # report_query the last positional argument for the function
-                return func(*args, report_query, **kwargs)
+            report_query = validate_report_query(request.args, report_queries)
+
+            # to make the function wrapped by the decorator accept more
+            # arguments and report_query has to be passed, to whatever
+            # function the decorator is used for, remember to make
+            # report_query the last positional argument for the function
+            return func(*args, report_query, **kwargs)
 
         return decorated_function
 
@@ -0,0 +1,40 @@
+"""Module for validating export job requests"""
+
+# Exception handlers
+from marshmallow import ValidationError
+
+# Constants
+from ..constants import EXPORT_FILE_FORMATS
+
+# Messages
+from ..messages.error_messages import serialization_errors
+
+
+def validate_export_type(export_type):
+    """Check that the supplied export type is one of the export job types
+
+    Args:
+        export_type (string): The export type to validate
+    Raises:
+        ValidationError: When the export type is not supported
+    """
+    from ..helpers.export_jobs import EXPORT_JOB_TYPES
+
+    if export_type not in EXPORT_JOB_TYPES:
+        raise ValidationError(
+            serialization_errors['invalid_request_param'].format(
+                'exportType', ', '.join(EXPORT_JOB_TYPES)))
+
+
+def validate_export_file_format(file_format):
+    """Check that the supplied file format is one of the export file formats
+
+    Args:
+        file_format (string): The file format to validate
+    Raises:
+        ValidationError: When the file format is not supported
+    """
+    if file_format not in EXPORT_FILE_FORMATS:
+        raise ValidationError(
+            serialization_errors['invalid_request_param'].format(
+                'fileFormat', ', '.join(EXPORT_FILE_FORMATS)))
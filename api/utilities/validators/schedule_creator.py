@@ -1,7 +1,22 @@
-"""This module will receive inserted work order and generate schedules to db"""
+"""This module will receive inserted work order and generate schedules to db
+
+The schedules are only created up to a rolling horizon of some weeks ahead,
+which a periodic task extends every day.
+"""
+from datetime import datetime, timedelta
+from itertools import takewhile
+
+from sqlalchemy import func, or_
+
 from api.models.database import db
+from api.utilities.constants import SCHEDULES_HORIZON_WEEKS
 from api.utilities.schedule_date_generation_helper import GenerateDates
-from api.utilities.enums import ScheduleStatusEnum
+from api.utilities.enums import ScheduleStatusEnum, StatusEnum
+
+# fields of a work order its schedules are generated from
+SCHEDULE_FIELDS = [
+    'frequency', 'custom_occurrence', 'start_date', 'end_date', 'assignee_id'
+]
 
 
 def generate_schedule_due_dates(saved_work_order, dates_maps):
@@ -43,19 +58,30 @@ def create_schedule_data(**kwargs):
     }
 
 
-def create_schedules(saved_work_order):
-    """ This function will insert generate schedules and insert them
-        into schedules model
+def get_schedules_horizon():
+    """Gets the date up to which the schedules are created
+        Returns:
+            (datetime): the date some weeks ahead of today
+    """
+    return datetime.now() + timedelta(weeks=SCHEDULES_HORIZON_WEEKS)
+
+
+def generate_due_dates(work_order, until):
+    """Generates the due dates of a work order up to a date
         Args:
-            saved_work_order(object): object of inserted work oder
+            work_order(object): the work order
+            until(datetime): the date after which no due dates are generated
+        Returns:
+            (list): the due dates or None if the values of the work order
+                were not deserialized
     """
-    if isinstance(saved_work_order.frequency, str):
+    if isinstance(work_order.frequency, str):
         # This means '.save' has been used to save the work order.
         # This will not how serializer saves the frequency of work order
-        return
-    if saved_work_order.frequency.value == "custom" and saved_work_order.custom_occurrence is None:
-        return
-    schedule_object = GenerateDates(saved_work_order)
+        return None
+    if work_order.frequency.value == "custom" and work_order.custom_occurrence is None:
+        return []
+    schedule_object = GenerateDates(work_order, until)
     schedule_mapper = {
         "no_repeat": schedule_object.no_repeat_dates,
         "daily": schedule_object.daily_dates,
@@ -63,25 +89,127 @@ def create_schedules(saved_work_order):
         "weekday": schedule_object.weekday_dates,
         "custom": schedule_object.custom_dates
     }
-    dates_maps = schedule_mapper.get(saved_work_order.frequency.value)
-    if dates_maps:
-        from api.models import Schedule
-        schedules_details = generate_schedule_due_dates(
-            saved_work_order, dates_maps())
-        schedules = [Schedule(**schedule) for schedule in schedules_details]
-        db.session.add_all(schedules)
+    dates_maps = schedule_mapper.get(work_order.frequency.value)
+    if not dates_maps:
+        return []
+    # the dates are ordered, and occurrences counted from the start date are
+    # generated past the until date
+    return list(takewhile(lambda date: date <= until, dates_maps() or []))
 
 
-def remove_pending_schedules(schedule_model, work_order):
-    """Hard deletes schedules with pending statuses
-         Args:
-            schedule_model (Schedule): Schedule model class
-            work_order (object): updated work_oder instance
+def add_schedules(work_order, due_dates):
+    """Adds the pending schedules of a work order to the session
+        Args:
+            work_order(object): the work order
+            due_dates(list): the due dates of the schedules
+        Returns:
+            (int): the count of schedules added
     """
+    from api.models import Schedule
+    schedules_details = generate_schedule_due_dates(work_order, due_dates)
+    db.session.add_all(
+        [Schedule(**schedule) for schedule in schedules_details])
+    return len(schedules_details)
 
-    schedules = schedule_model.query.filter_by(
-        work_order=work_order, status=ScheduleStatusEnum.pending)
-    schedules.delete()
+
+def create_schedules(saved_work_order, until=None):
+    """ This function will insert generate schedules and insert them
+        into schedules model
+        Args:
+            saved_work_order(object): object of inserted work oder
+            until(datetime): the date up to which the schedules are created.
+                Defaults to the rolling horizon
+    """
+    due_dates = generate_due_dates(saved_work_order, until
+                                   or get_schedules_horizon())
+    if due_dates:
+        add_schedules(saved_work_order, due_dates)
+
+
+def sync_schedules(work_order, until=None):
+    """Applies the changes of a work order to its pending schedules
+
+    Only the schedules whose due date is no longer generated are deleted and
+    only the missing due dates are added, so the schedules that did not
+    change are kept as they are.
+        Args:
+            work_order(object): updated work_oder instance
+            until(datetime): the date up to which the schedules are created.
+                Defaults to the rolling horizon or the latest due date
+    """
+    from api.models import Schedule
+    schedules = db.session.query(
+        Schedule.id, Schedule.due_date, Schedule.status,
+        Schedule.assignee_id).filter(
+            Schedule.work_order_id == work_order.id).all()
+
+    until = max([until or get_schedules_horizon()] +
+                [schedule.due_date for schedule in schedules])
+    due_dates = generate_due_dates(work_order, until)
+    if due_dates is None:
+        return
+
+    due_dates = set(due_dates)
+    materialized = {
+        schedule.due_date
+        for schedule in schedules
+        if schedule.status != ScheduleStatusEnum.pending
+    }
+    removed, reassigned = [], []
+    for schedule in schedules:
+        if schedule.status != ScheduleStatusEnum.pending:
+            continue
+        if schedule.due_date not in due_dates or \
+                schedule.due_date in materialized:
+            removed.append(schedule.id)
+            continue
+        materialized.add(schedule.due_date)
+        if schedule.assignee_id != work_order.assignee_id:
+            reassigned.append(schedule.id)
+
+    if removed:
+        Schedule.query.filter(Schedule.id.in_(removed)).delete(
+            synchronize_session=False)
+    if reassigned:
+        Schedule.query.filter(Schedule.id.in_(reassigned)).update(
+            {'assignee_id': work_order.assignee_id},
+            synchronize_session=False)
+    add_schedules(work_order, sorted(due_dates - materialized))
+
+
+def extend_schedules(until=None):
+    """Creates the schedules of the enabled work orders up to the horizon
+        Args:
+            until(datetime): the date up to which the schedules are created.
+                Defaults to the rolling horizon
+        Returns:
+            (int): the count of schedules created
+    """
+    from api.models import Schedule, WorkOrder
+    until = until or get_schedules_horizon()
+    latest = db.session.query(
+        Schedule.work_order_id,
+        func.max(Schedule.due_date).label('due_date')).group_by(
+            Schedule.work_order_id).subquery()
+    work_orders = WorkOrder.query.outerjoin(
+        latest, latest.c.work_order_id == WorkOrder.id).add_columns(
+            latest.c.due_date).filter(
+                WorkOrder.status == StatusEnum.enabled,
+                or_(latest.c.due_date.is_(None),
+                    latest.c.due_date < until),
+                or_(latest.c.due_date.is_(None),
+                    WorkOrder.end_date.is_(None),
+                    WorkOrder.end_date > latest.c.due_date))
+
+    created = 0
+    for work_order, latest_due_date in work_orders:
+        due_dates = generate_due_dates(work_order, until) or []
+        created += add_schedules(work_order, [
+            due_date for due_date in due_dates
+            if latest_due_date is None or due_date > latest_due_date
+        ])
+    db.session.commit()
+    return created
 
 
 def regenerate_schedules(work_order, changed_fields):
@@ -90,11 +218,5 @@ def regenerate_schedules(work_order, changed_fields):
             work_order (object): updated work_oder instance
             changed_fields (list): list if fields changed on a work_order
     """
-    from api.models import Schedule
-    fields_considered = [
-        'frequency', 'custom_occurrence', 'start_date', 'end_date'
-    ]
-    if any(True for key in changed_fields if key in fields_considered):
-        remove_pending_schedules(Schedule, work_order)
-
-    create_schedules(work_order)
+    if any(True for key in changed_fields if key in SCHEDULE_FIELDS):
+        sync_schedules(work_order)
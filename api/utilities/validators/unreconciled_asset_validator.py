@@ -27,7 +27,7 @@ def validate_request_param(request):
             raises('missing_entry', 400, param)
         try:
             date_stripped = datetime.strptime(date_value, '%Y-%m-%d')
-            parameter_dict[param] = "'{}'::date".format(date_stripped)
+            parameter_dict[param] = date_stripped
 
         except ValueError:
             raises('invalid_date', 400, date_value)
@@ -96,6 +96,34 @@ def default_date_range(start, end, url):
     return start_date, end_date
 
 
+def get_report_date_range(query, url):
+    """Gets the validated date range of the url queries of a report
+
+    Args:
+        query (dict): the url queries
+        url (str): the path of the report
+
+    Returns:
+        tuple of start_date and end_date
+
+    Raises:
+        Throws error if date not in the format '%YYYY-%mm-%dd'
+    """
+    # normalize the query keys
+    norm_query = {
+        key.lower().strip(): value
+        for key, value in query.items()
+    }
+
+    start_date = norm_query.get('startdate', '')
+    end_date = norm_query.get('enddate', '')
+
+    # set default date range if not provided
+    start_date, end_date = default_date_range(start_date, end_date, url)
+    # verify that date range is valid
+    return verify_date_range(start_date, end_date)
+
+
 def report_query_date_validator(func):
     """Validates report query date range
 
@@ -114,22 +142,8 @@ def report_query_date_validator(func):
 
     @wraps(func)
     def decorated_function(*args, **kwargs):
-        query = request.args.to_dict()
-
-        # normalize the query keys
-        norm_query = {
-            key.lower().strip(): value
-            for key, value in query.items()
-        }
-
-        start_date = norm_query.get('startdate', '')
-        end_date = norm_query.get('enddate', '')
-
-        # set default date range if not provided
-        start_date, end_date = default_date_range(start_date, end_date,
-                                                  request.path)
-        # verify that date range is valid
-        start_date, end_date = verify_date_range(start_date, end_date)
+        start_date, end_date = get_report_date_range(
+            request.args.to_dict(), request.path)
 
         return func(*args, start_date, end_date, **kwargs)
 
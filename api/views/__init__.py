@@ -13,6 +13,8 @@ from .permission import PermissionResource
 from .space import SpaceResource
 from .space import SingleSpaceResource
 from .user_csv import ExportUserResource
+from .export_job import (ExportJobResource, SingleExportJobResource,
+                         ExportJobDownloadResource)
 from .asset_analytics import AssetAnalyticsReportResource
 from .stock_count_csv import ExportStockCountResource
 from .stock_count import StockCountResource
@@ -1,6 +1,5 @@
 """Module for analytics report"""  # pylint: disable=F0002
 import datetime
-from sqlalchemy import text
 from flask_restplus import Resource  # pylint: disable=E0401
 
 from flask import request
@@ -13,8 +12,8 @@ from api.utilities.swagger.constants import ASSET_ANALYTICS_REQUEST_PARAMS
 from ..models import Asset
 
 # decorators
-from api.models.database import db
 from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
 from ..middlewares.token_required import token_required
 from ..utilities.validators.analytics_validator import report_query_validator
 
@@ -145,10 +144,13 @@ class AssetAnalyticsReportResource(Resource, AnalyticsBase):
             Asset.date_assigned.between(start_date, end_date)).count()
 
         # Get the total number of reconcilable asset categories
-        get_total_reconciliation = add_center_to_query(
-            sql_queries['get_total_reconciliation'].format(
-                start_date, end_date))
-        result = db.engine.execute(text(get_total_reconciliation)).first()
+        get_total_reconciliation, center_params = add_center_to_query(
+            sql_queries['get_total_reconciliation'])
+        result = execute_query(
+            get_total_reconciliation,
+            start_date=start_date,
+            end_date=end_date,
+            **center_params).first()
         return {
             'data': {
                 'outflow': asset_out_flow,
@@ -207,12 +209,11 @@ class AssetAnalyticsReportResource(Resource, AnalyticsBase):
         context = {'start_date': start_date, 'end_date': end_date}
 
         # Generates the query for all asset categories
-        asset_categories_stats = text(
-            add_center_to_query(sql_queries['categories_with_stats'].format(
-                filter='', sort='created_at', order='desc')))
-        params = {'limit': None, 'offset': None}
-        records = db.engine.execute(asset_categories_stats,
-                                    **params).fetchall()
+        asset_categories_stats, center_params = add_center_to_query(
+            sql_queries['categories_with_stats'].format(
+                filter='', sort='created_at', order='desc'))
+        params = {'limit': None, 'offset': None, **center_params}
+        records = execute_query(asset_categories_stats, **params).fetchall()
         # stock level schema instance
         schema = StockLevelSchema(many=True, exclude=excludes, context=context)
         # serializes and returns the data
@@ -228,11 +229,10 @@ class AssetAnalyticsReportResource(Resource, AnalyticsBase):
         Returns
             List: The report for incidence reporting
         """
+        incidence_report_query, center_params = add_center_to_query(
+            sql_queries['get_incidence_report'], 'requests')
         get_incidence_report = list(
-            db.engine.execute(
-                text(
-                    add_center_to_query(sql_queries['get_incidence_report'],
-                                        'requests'))))
+            execute_query(incidence_report_query, **center_params))
         report_by_categories = []
         total_open, total_in_progress, total_completed, total_closed, total_overdue = \
             0, 0, 0, 0, 0
@@ -1,24 +1,24 @@
 """Module for export analytics report as csv format"""
 
 # Library Imports
-import flask_excel as excel
+from flask import request
 from flask_restplus import Resource
-from sqlalchemy import text
+from sqlalchemy.orm import joinedload
 
 # Local Imports
 from api.utilities.swagger.collections.asset import asset_namespace
 from api.utilities.swagger.constants import ANALYTICS_REQUEST_PARAMS
 
-# database
-from api.models.database import db
-
 from ..middlewares.token_required import token_required
-from ..utilities.validators.analytics_validator import report_query_validator
+from ..utilities.validators.analytics_validator import validate_report_query
 from ..schemas.asset import AssetInflowAnalyticsSchema
 from ..utilities.constants import ASSET_REPORT_QUERIES
 from ..utilities.enums import AssigneeType
-from ..utilities.verify_date_range import report_query_date_validator
+from ..utilities.verify_date_range import get_report_date_range
 from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
+from ..utilities.helpers.csv_export import (get_schema_headers,
+                                            make_csv_response, stream_query)
 
 # Model
 from ..models import Asset, AssetCategory
@@ -36,11 +36,36 @@ class ExportAssetAnalyticsReportResource(Resource):
 
     @token_required
     @permission_required(Resources.ASSETS)
-    @report_query_validator(ASSET_REPORT_QUERIES)
-    @report_query_date_validator
     @asset_namespace.doc(params=ANALYTICS_REQUEST_PARAMS)
-    def get(self, report_query, start_date, end_date):
-        """Handles get request for /assets/analytics/export endpoint
+    def get(self):
+        """Handles GET request for /assets/analytics/export endpoint
+
+        Returns:
+            csv: The records of the report parameter value
+        """
+        return make_csv_response(
+            **self.export(**self.parse_export_args(request.args)))
+
+    @staticmethod
+    def parse_export_args(query):
+        """Parses and validates the report and date range of an export
+
+        Args:
+            query (dict): The url queries
+
+        Returns:
+            dict: The arguments of `export`
+        """
+        report_query = validate_report_query(query, ASSET_REPORT_QUERIES)
+        start_date, end_date = get_report_date_range(
+            query, '/assets/analytics/export')
+        return dict(
+            report_query=report_query,
+            start_date=start_date,
+            end_date=end_date)
+
+    def export(self, report_query, start_date, end_date):
+        """Builds the export of the requested asset report
 
         Args:
             report_query (str): The value of the report parameter in the request.
@@ -48,8 +73,8 @@ class ExportAssetAnalyticsReportResource(Resource):
             end_date (datetime): The end date value.
 
         Returns:
-            csv: The return value from any of the methods handling
-                  the corresponding report parameter value
+            dict: The chunks of records and headers returned by the method
+                  handling the corresponding report parameter value
         """
 
         # Maps the methods of this class that generates report in csv to a key
@@ -64,14 +89,14 @@ class ExportAssetAnalyticsReportResource(Resource):
 
         # records when no report query is provided
         if not report:
-            records = [{'to_be_implemented': "Endpoint yet to be implemented"}]
+            return dict(
+                chunks=[[{
+                    'to_be_implemented': "Endpoint yet to be implemented"
+                }]],
+                headers=['to_be_implemented'])
 
         # executes the method to return the records for the csv file
-        else:
-            records = report(start_date, end_date)
-
-        # makes a csv response from the records
-        return excel.make_response_from_records(records, 'csv')
+        return report(start_date, end_date)
 
     def asset_inflow(self, start_date, end_date):
         """Handles asset inflow
@@ -82,7 +107,7 @@ class ExportAssetAnalyticsReportResource(Resource):
             end_date (datetime): The end date value.
 
          Returns:
-             list: a list of records (dict)
+             dict: chunks of records (list of dict) and their headers
         """
 
         only = [
@@ -104,7 +129,7 @@ class ExportAssetAnalyticsReportResource(Resource):
             end_date (datetime): The end date value.
 
          Returns:
-             list: a list of records (dict)
+             dict: chunks of records (list of dict) and their headers
         """
 
         only = [
@@ -127,30 +152,35 @@ class ExportAssetAnalyticsReportResource(Resource):
             end_date (datetime): The end date value.
 
          Returns:
-             list: a list of records (dict)
+             dict: chunks of records (list of dict) and their headers
          """
-        asset_flow_query = sql_queries['get_asset_flow_count'].format(
-            start_date, end_date)
-        reconciliation_query = sql_queries['get_total_reconciliation'].format(
-            start_date, end_date)
-
         # execute the query and get back sqlalchemy result proxy object
-        asset_flow_proxy = db.engine.execute(text(asset_flow_query))
+        asset_flow_proxy = execute_query(
+            sql_queries['get_asset_flow_count'],
+            start_date=start_date,
+            end_date=end_date)
         asset_flow_result = list(asset_flow_proxy)[0]
 
         # execute the query and get back sqlalchemy result proxy object
-        reconciliation = db.engine.execute(
-            text(reconciliation_query)).first()[0]
+        reconciliation = execute_query(
+            sql_queries['get_total_reconciliation'],
+            start_date=start_date,
+            end_date=end_date).first()[0]
 
-        asset_flows = [{
+        asset_flows = [[{
             'Asset Inflow':
             asset_flow_result[0],
             'Asset Outflow':
             asset_flow_result[1],
             'Asset category requiring reconciliation':
             reconciliation
-        }]
-        return asset_flows
+        }]]
+        return dict(
+            chunks=asset_flows,
+            headers=[
+                'Asset Inflow', 'Asset Outflow',
+                'Asset category requiring reconciliation'
+            ])
 
     def stock_level(self, start_date, end_date):
         """Handles stock level of asset
@@ -161,12 +191,11 @@ class ExportAssetAnalyticsReportResource(Resource):
             end_date (datetime): The end date value.
 
          Returns:
-             list: a list of records (dict)
+             dict: chunks of records (list of dict) and their headers
          """
 
-        stock_level = self.get_stock_level_records(
+        return self.get_stock_level_records(
             AssetCategory, ExportStockLevelSchema, start_date, end_date)
-        return stock_level
 
     def get_records(self, *args):
         """Helper method to return data csv data
@@ -177,19 +206,24 @@ class ExportAssetAnalyticsReportResource(Resource):
             end_date (datetime): The end date value.
 
          Returns:
-             list: a list of records (dict)
+             dict: chunks of records (list of dict) and their headers
         """
 
         model, schema, start_date, end_date, query_filter, only = args
 
+        # the joined collections of asset categories cannot be streamed
         records = model.query.filter_by() \
             .filter(query_filter) \
-            .filter(Asset.date_assigned.between(start_date, end_date)).order_by(Asset.date_assigned.desc()).all()
+            .filter(Asset.date_assigned.between(start_date, end_date)).order_by(Asset.date_assigned.desc()) \
+            .options(joinedload(Asset.asset_category).lazyload('*'),
+                     joinedload(Asset.center))
 
-        records_data = schema(many=True, only=only) \
-            .dump(records).data
+        records_schema = schema(many=True, only=only)
 
-        return records_data
+        return dict(
+            chunks=(records_schema.dump(chunk).data
+                    for chunk in stream_query(records)),
+            headers=get_schema_headers(records_schema))
 
     def get_stock_level_records(self, model, schema, start_date, end_date):
         """Helper method to return csv data.
@@ -201,11 +235,12 @@ class ExportAssetAnalyticsReportResource(Resource):
             end_date (datetime): The end date value.
 
           Returns:
-             list: a list of records (dict)
+             dict: a chunk of records (dict) and their headers
         """
         records = model.query_().all()
         only = ['name', 'stock_count', 'running_low', 'low_in_stock']
         context = {'start_date': start_date, 'end_date': end_date}
-        records_data = schema(many=True, only=only, context=context)\
-            .dump(records).data
-        return records_data
+        records_schema = schema(many=True, only=only, context=context)
+        return dict(
+            chunks=[records_schema.dump(records).data],
+            headers=get_schema_headers(records_schema))
@@ -12,6 +12,7 @@ from api.schemas.bulk_asset_schema import BulkAssetSchema
 # Helpers
 from api.tasks.notifications.asset_bulk import AssetBulkNotifications
 from api.utilities.constants import EXCLUDED_FIELDS
+from api.utilities.helpers.asset_ingestion import ingest_assets
 from api.utilities.helpers.bulk_asset_helper import BulkAssetHelper
 from api.utilities.messages.error_messages import serialization_error
 from api.utilities.messages.success_messages import SUCCESS_MESSAGES
@@ -50,6 +51,15 @@ class AssetBulkResource(Resource):
         helper = BulkAssetHelper(assets, asset_schema)
         error_free_assets, assets_with_errors, custom_attributes = \
             helper.pass_data_schema_and_validator()
+        asset_ids = []
+        if error_free_assets:
+            user_info = request.decoded_token['UserInfo']
+            asset_ids, skipped_assets = ingest_assets(
+                error_free_assets,
+                actor_id=user_info['id'],
+                assigned_by=user_info['name'])
+            assets_with_errors.extend(skipped_assets)
+        del error_free_assets
         assets_with_errors_json = []
         for asset in assets_with_errors:
             asset_object = asset_schema.dump(asset[0])[0]
@@ -58,14 +68,21 @@ class AssetBulkResource(Resource):
         del assets_with_errors
         added_assets_json = None
         failed_records, successful_records = \
-            len(assets_with_errors_json), len(error_free_assets)
+            len(assets_with_errors_json), len(asset_ids)
         summary = {
             "TotalNoRecords": failed_records + successful_records,
             "FailedRecords": failed_records,
             "SuccessfulRecords": successful_records
         }
-        if error_free_assets:
-            assets_objects = Asset.bulk_create(error_free_assets)
+        if asset_ids:
+            positions = {
+                asset_id: index
+                for index, asset_id in enumerate(asset_ids)
+            }
+            # the ids come from the insert, so the read is not center scoped
+            assets_objects = sorted(
+                Asset.query.filter(Asset.id.in_(asset_ids)),
+                key=lambda asset: positions[asset.id])
             added_assets_json = asset_schema.dump(
                 assets_objects, many=True).data
             response = {
@@ -3,15 +3,17 @@
 from datetime import date
 import dateutil.parser
 
-import flask_excel as excel
 from flask_restplus import Resource
-from flatten_dict import flatten
+from sqlalchemy import func
 
 from api.utilities.swagger.collections.asset import asset_categories_namespace
+from ..models.asset import Asset
 from ..models.asset_category import AssetCategory
 from ..middlewares.token_required import token_required
 from ..utilities.validators.validate_id import validate_id
 from ..schemas.asset import AssetSchema
+from ..utilities.helpers.csv_export import (get_schema_headers,
+                                            make_csv_response, stream_query)
 # Resourses
 from ..middlewares.permission_required import Resources
 # Permissions
@@ -28,15 +30,79 @@ class ExportAssets(Resource):
     def get(self, asset_category_id):
         """Download assets under an asset category"""
 
+        return make_csv_response(**self.export(asset_category_id))
+
+    @staticmethod
+    def parse_export_args(query):
+        """Parses the url queries of an export of assets
+
+        Args:
+            query (dict): The url queries
+
+        Returns:
+            dict: The arguments of `export`
+        """
+        return dict(asset_category_id=query['assetCategoryId'])
+
+    def export(self, asset_category_id):
+        """Builds the export of the assets under an asset category
+
+        Args:
+            asset_category_id (str): The id of the asset category
+
+        Returns:
+            dict: The chunks of records, file name and headers
+        """
         asset_category = AssetCategory.get_or_404(asset_category_id)
-        assets = asset_category.assets.filter_by(deleted=False).all()
+        assets = asset_category.assets.filter_by(deleted=False)
         asset_schema = AssetSchema(
             many=True,
             exclude=[
                 'id', 'asset_category_id', 'deleted', 'deleted_at',
                 'created_by', 'deleted_by', 'updated_at', 'updated_by'
             ])
-        assets_data = asset_schema.dump(assets).data
+        # the custom attributes of the assets are columns of their own
+        attribute_keys = {
+            attribute._key
+            for attribute in asset_category.attributes
+        }.union(key for key, in self.get_custom_attribute_keys(assets))
+        headers = sorted(
+            attribute_keys.union(
+                get_schema_headers(asset_schema, skip=['custom_attributes'])))
+
+        assets_data_records = (self.format_assets(
+            asset_schema.dump(chunk).data) for chunk in stream_query(assets))
+
+        return dict(
+            chunks=assets_data_records,
+            file_name=f'{asset_category.name} Assets Export - {date.today()}',
+            headers=headers)
+
+    @staticmethod
+    def get_custom_attribute_keys(assets):
+        """Gets the keys of the custom attributes of assets
+
+        Args:
+            assets (BaseQuery): The query of the assets
+
+        Returns:
+            BaseQuery: The query of the distinct keys
+        """
+        return assets.filter(
+            func.json_typeof(Asset.custom_attributes) == 'object'
+        ).with_entities(func.json_object_keys(
+            Asset.custom_attributes)).order_by(None).distinct()
+
+    @staticmethod
+    def format_assets(assets_data):
+        """Formats serialized assets into csv records
+
+        Args:
+            assets_data (list): The serialized assets
+
+        Returns:
+            list: a list of records (dict)
+        """
         assets_data_record = []
 
         for asset in assets_data:
@@ -44,13 +110,11 @@ class ExportAssets(Resource):
             asset['assignee'] = assignee['name']
             # Flatten the asset dict object so as to have
             # the custom attributes as a separate column in the csv file
-            asset_data = flatten(asset, reducer=lambda key1, key2: key2)
+            asset_data = asset.copy()
+            asset_data.update(asset_data.pop('customAttributes', None) or {})
 
             asset_data['createdAt'] = dateutil.parser.parse(
                 asset_data['createdAt']).date()
             assets_data_record.append(asset_data)
 
-        return excel.make_response_from_records(
-            assets_data_record,
-            'csv',
-            file_name=f'{asset_category.name} Assets Export - {date.today()}')
+        return assets_data_record
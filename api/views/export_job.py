@@ -0,0 +1,134 @@
+"""Module for asynchronous export job resources"""
+
+# Third party
+from flask import request, send_file
+from flask_restplus import Resource
+
+# Models
+from ..models.push_id import PushID
+
+# Schemas
+from ..schemas.export_job import ExportJobSchema
+
+# Middlewares
+from ..middlewares.token_required import token_required
+from ..middlewares.base_validator import ValidationError
+
+# Utilities
+from ..utilities.enums import ExportJobStatusEnum
+from ..utilities.helpers.artifact_store import artifact_store
+from ..utilities.helpers.env_resource_adapter import adapt_resource_to_env
+from ..utilities.helpers.export_jobs import (
+    check_export_permission, create_export_job, get_export_job,
+    parse_export_args)
+from ..utilities.helpers.identity import get_identity
+from ..utilities.validators.validate_id import validate_id
+from ..utilities.validators.validate_json_request import validate_json_request
+from ..tasks.export import ExportJobs
+
+# Messages
+from ..utilities.messages.success_messages import SUCCESS_MESSAGES
+from ..utilities.messages.error_messages import serialization_errors
+
+# Documentation
+from api.utilities.swagger.collections.export_job import export_job_namespace
+from api.utilities.swagger.swagger_models.export_job import export_job_model
+
+MIMETYPES = {
+    'csv': 'application/gzip',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+}
+
+
+def get_own_export_job(job_id):
+    """Gets an export job created by the current user
+
+    Args:
+        job_id (str): the id of the export job
+
+    Returns:
+        dict: the export job
+
+    Raises:
+        ValidationError: if the job does not exist, has expired or was
+            created by another user
+    """
+    job = get_export_job(job_id)
+    identity = get_identity()
+    if not job or (job['createdBy'] != identity.token_id
+                   and not identity.is_super_user):
+        raise ValidationError(
+            {'message': serialization_errors['export_job_not_found']}, 404)
+    return job
+
+
+@export_job_namespace.route('/')
+class ExportJobResource(Resource):
+    """Resource class for creating export jobs"""
+
+    @token_required
+    @validate_json_request
+    @export_job_namespace.expect(export_job_model)
+    def post(self):
+        """Creates an export job whose file is written in the background"""
+
+        data = ExportJobSchema().load_object_into_schema(request.get_json())
+        export_type, query = data['export_type'], data['query']
+        check_export_permission(export_type)
+
+        # fails early on invalid filters instead of in the job
+        parse_export_args(export_type, query)
+
+        job = create_export_job(PushID().next_id(), export_type,
+                                data['file_format'], query)
+        run_export_job = adapt_resource_to_env(
+            ExportJobs.run_export_job.delay)
+        run_export_job(job['id'], request.decoded_token)
+
+        return {
+            'status': 'success',
+            'message': SUCCESS_MESSAGES['export_job_created'],
+            'data': job
+        }, 202
+
+
+@export_job_namespace.route('/<string:job_id>')
+class SingleExportJobResource(Resource):
+    """Resource class for the status of an export job"""
+
+    @token_required
+    @validate_id
+    def get(self, job_id):
+        """Gets the status and progress of an export job"""
+
+        return {
+            'status': 'success',
+            'message': SUCCESS_MESSAGES['fetched'].format('Export job'),
+            'data': get_own_export_job(job_id)
+        }, 200
+
+
+@export_job_namespace.route('/<string:job_id>/download')
+class ExportJobDownloadResource(Resource):
+    """Resource class for the file of an export job"""
+
+    @token_required
+    @validate_id
+    def get(self, job_id):
+        """Downloads the file of a completed export job"""
+
+        job = get_own_export_job(job_id)
+        path = artifact_store.get(job_id, job['fileFormat'])
+        if job['status'] != ExportJobStatusEnum.completed.value or not path:
+            raise ValidationError({
+                'message':
+                serialization_errors['export_job_not_ready'].format(
+                    job['status'])
+            }, 409)
+
+        extension = artifact_store.extensions[job['fileFormat']]
+        return send_file(
+            path,
+            mimetype=MIMETYPES[job['fileFormat']],
+            as_attachment=True,
+            attachment_filename=f"{job['fileName']}.{extension}")
@@ -1,28 +1,48 @@
 """Module that handles asset-related operations"""
 # standard libraries
+from collections import OrderedDict
+from decimal import Decimal, InvalidOperation
+
 from flask import request
 from flask_restplus import Resource
+from sqlalchemy import Numeric, String, cast, func, literal, literal_column, \
+    select, tuple_, union_all
+from sqlalchemy_searchable import search_manager
 
 # models
 from api.models import (Asset, HotDeskRequest, User, WorkOrder)
+from api.models.database import db
 
 # Decorators
 from api.middlewares.token_required import token_required
 
-# schemas
-from api.schemas.asset import AssetSchema
-from api.schemas.hot_desk import HotDeskRequestSchema
-from api.schemas.user import UserSchema
-from api.schemas.work_order import WorkOrderSchema
-
 # Utilities
-from ..utilities.constants import EXCLUDED_FIELDS
+from ..utilities.constants import SUGGESTIONS_LIMIT, SUGGESTIONS_MAX_LIMIT
+from ..utilities.error import raises
+from ..utilities.helpers.suggestions import SUGGEST_TYPES, get_suggestions
+from ..utilities.paginator import (validate_pagination_args, encode_cursor,
+                                   decode_cursor, get_cursor_page_url)
 from ..utilities.validators.search_validator import validate_search_query_param
 from ..utilities.messages.success_messages import SUCCESS_MESSAGES
 from api.utilities.swagger.collections.global_search import global_search_namespace
 from api.middlewares.permission_required import Resources
 from ..middlewares.permission_required import permission_required
 
+# The searched types with the columns projected as the id, title and
+# subtitle of their results
+SEARCH_TYPES = OrderedDict([
+    ('assets', lambda: (Asset, Asset.id, Asset.tag, Asset.status)),
+    ('hotdeskrequests', lambda: (HotDeskRequest, HotDeskRequest.id,
+                                 HotDeskRequest.hot_desk_ref_no,
+                                 HotDeskRequest.status)),
+    ('users', lambda: (User, User.token_id, User.name, User.email)),
+    ('workorders', lambda: (WorkOrder, WorkOrder.id, WorkOrder.title,
+                            WorkOrder.status)),
+])
+
+# Ranks are rounded so that they survive the round trip through a cursor
+RANK_SCALE = 6
+
 
 @global_search_namespace.route('/')
 class SearchResource(Resource):
@@ -31,53 +51,214 @@ class SearchResource(Resource):
     @token_required
     @permission_required(Resources.ASSETS)
     @global_search_namespace.doc(
-        params={"q": {
-            "description": "The search criteria",
-            "required": True
-        }})
+        params={
+            "q": {
+                "description": "The search criteria",
+                "required": True
+            },
+            "type": {
+                "description": "Only search this type of record",
+                "enum": list(SEARCH_TYPES)
+            },
+            "limit": {
+                "description": "The count of results of each type",
+                "default": 10
+            },
+            "cursor": {
+                "description":
+                "The nextCursor of the searched type to get its next results"
+            }
+        })
     def get(self):
         """
-        Global Search endpoint 
+        Global Search endpoint
         """
 
         qry_dict = request.args.to_dict()
         text = qry_dict.get('q')
         validate_search_query_param(request)
-        results = GlobalSearch.search(text=text)
+        limit = validate_pagination_args(
+            request.args.get('limit', 'None'), 'limit')
+        search_type = qry_dict.get('type')
+        if search_type is not None and search_type not in SEARCH_TYPES:
+            raises('invalid_request_param', 400, 'type',
+                   ', '.join(SEARCH_TYPES))
+        cursor = qry_dict.get('cursor')
+        if cursor and not search_type:
+            raises('search_cursor_without_type', 400)
+
+        results, meta = GlobalSearch.search(
+            text=text, limit=limit, search_type=search_type, cursor=cursor)
         return {
             'message':
             SUCCESS_MESSAGES['successfully_fetched'].format('search results'),
             'status':
             'success',
             'data':
-            results
+            results,
+            'meta':
+            meta
+        }, 200
+
+
+@global_search_namespace.route('/suggest')
+class SuggestResource(Resource):
+    """Resource for typeahead suggestions."""
+
+    @token_required
+    @permission_required(Resources.ASSETS)
+    @global_search_namespace.doc(
+        params={
+            "q": {
+                "description": "The typed text",
+                "required": True
+            },
+            "type": {
+                "description": "The type of record to suggest",
+                "enum": list(SUGGEST_TYPES),
+                "required": True
+            },
+            "limit": {
+                "description": "The count of suggestions",
+                "default": SUGGESTIONS_LIMIT
+            }
+        })
+    def get(self):
+        """
+        Suggests the records whose labels start with or resemble the text
+        """
+
+        qry_dict = request.args.to_dict()
+        validate_search_query_param(request)
+        suggest_type = qry_dict.get('type')
+        if suggest_type not in SUGGEST_TYPES:
+            raises('invalid_request_param', 400, 'type',
+                   ', '.join(SUGGEST_TYPES))
+        limit = min(
+            validate_pagination_args(
+                qry_dict.get('limit', str(SUGGESTIONS_LIMIT)), 'limit'),
+            SUGGESTIONS_MAX_LIMIT)
+
+        suggestions = get_suggestions(suggest_type, qry_dict['q'].strip(),
+                                      limit)
+        return {
+            'message':
+            SUCCESS_MESSAGES['successfully_fetched'].format('suggestions'),
+            'status':
+            'success',
+            'data':
+            suggestions
         }, 200
 
 
 class GlobalSearch:
+    """Ranks the records of every searched type matching a search in a single
+    query"""
+
     @staticmethod
-    def search(text):
+    def rank(model, tsquery):
+        """Ranks how well the records of a model match a search
+
+        Args:
+            model (class): the searched model
+            tsquery (Function): the parsed search
+
+        Returns:
+            Function: the rounded ts_rank of the search vector of the records
+        """
+        return func.round(
+            cast(func.ts_rank(model.search_vector, tsquery), Numeric),
+            RANK_SCALE)
+
+    @classmethod
+    def type_query(cls, search_type, tsquery, limit, cursor=None):
+        """Builds the query of the best matches of one type
+
+        Args:
+            search_type (str): the searched type e.g assets
+            tsquery (Function): the parsed search
+            limit (int): the count of results to return
+            cursor (str): the nextCursor of the type
+
+        Returns:
+            Select: the statement selecting the type, id, title, subtitle and
+                rank of one more match than the limit
+        """
+        model, id_column, title, subtitle = SEARCH_TYPES[search_type]()
+        rank = cls.rank(model, tsquery)
+        query = model.query_().order_by(None).filter(
+            model.search_vector.op('@@')(tsquery))
+        if cursor:
+            rank_value, record_id, direction = decode_cursor(cursor, rank)
+            try:
+                rank_value = Decimal(str(rank_value))
+            except InvalidOperation:
+                direction = None
+            if direction != 'next':
+                raises('invalid_query_strings', 400, 'cursor', cursor)
+            query = query.filter(
+                tuple_(rank, id_column) < tuple_(
+                    literal(rank_value, Numeric), record_id))
+
+        # The extra match tells if the type has more results
+        return query.with_entities(
+            literal(search_type).label('type'),
+            cast(id_column, String).label('id'),
+            cast(title, String).label('title'),
+            cast(subtitle, String).label('subtitle'),
+            rank.label('rank')).order_by(
+                rank.desc(), id_column.desc()).limit(limit + 1).subquery()
+
+    @classmethod
+    def search(cls, text, limit=10, search_type=None, cursor=None):
         """
         Function to implement full text search
 
+        The types are searched in one UNION ALL query, each of them returning
+        its best ranked matches only. The matches are ordered by the database
+        so that the cursors seek in the same order.
+
         Args:
             text : The search criteria provided
+            limit (int): The count of results of each type
+            search_type (str): Only search this type
+            cursor (str): The nextCursor of the searched type
+
+        Returns:
+            tuple: the results of each type and their pagination meta dict
         """
-        categories_mapper = {
-            'asset': [Asset, AssetSchema],
-            'hot_desk': [HotDeskRequest, HotDeskRequestSchema],
-            'user': [User, UserSchema],
-            'work_order': [WorkOrder, WorkOrderSchema]
-        }
-        excluded = EXCLUDED_FIELDS.copy()
-        excluded.extend(['assigned_by', 'custom_attributes', 'updated_at'])
-        results = []
-        for each in categories_mapper:
-            result = {}
-            model, schema = categories_mapper[each]
-            model_query = model.query_()
-            model_schema = schema(many=True, exclude=excluded)
-            result[model.__name__.lower() + 's'] = model_schema.dump(
-                model_query.search(text).all()).data
-            results.append(result)
-        return results
+        search_types = [search_type] if search_type else list(SEARCH_TYPES)
+        tsquery = func.tsq_parse(search_manager.options['regconfig'], text)
+        statement = union_all(*[
+            select([query]) for query in [
+                cls.type_query(each, tsquery, limit, cursor)
+                for each in search_types
+            ]
+        ]).order_by(
+            literal_column('rank').desc(), literal_column('id').desc())
+
+        matches = OrderedDict((each, []) for each in search_types)
+        for row in db.session.execute(statement):
+            matches[row.type].append(row)
+
+        results, meta = [], {}
+        for each, rows in matches.items():
+            results.append({
+                each: [{
+                    'id': row.id,
+                    'title': row.title,
+                    'subtitle': row.subtitle,
+                    'rank': float(row.rank)
+                } for row in rows[:limit]]
+            })
+            next_cursor = encode_cursor(
+                rows[limit - 1].rank, rows[limit - 1].id,
+                'next') if len(rows) > limit else ''
+            meta[each] = {
+                'nextCursor': next_cursor,
+                'nextPage':
+                get_cursor_page_url(next_cursor, type=each)
+                if next_cursor else '',
+                'limit': limit
+            }
+        return results, meta
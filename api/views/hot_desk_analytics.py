@@ -1,5 +1,4 @@
 """Module for hot desk analytics report"""
-from sqlalchemy import text
 from flask_restplus import Resource  # pylint: disable=E0401
 from flask import request
 
@@ -12,8 +11,8 @@ from api.schemas.user import UserSchema
 from bot.utilities.google_sheets.google_sheets_helper import GoogleSheetHelper
 
 # decorators
-from api.models.database import db
 from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
 from ..utilities.validators.validate_id import validate_id
 from ..middlewares.token_required import token_required
 from ..utilities.validators.analytics_validator import report_query_validator
@@ -120,9 +119,11 @@ class HotDesksAnalyticsReportResource(Resource, AnalyticsBase):
             dictionary: a dictionary of the hot-desk allocation data and meta data
 
         """
-        approved_hot_desk_requests = sql_queries[
-            'get_hot_desks_of_users'].format('approved', start_date, end_date)
-        data = db.engine.execute(text(approved_hot_desk_requests)).fetchall()
+        data = execute_query(
+            sql_queries['get_hot_desks_of_users'],
+            status='approved',
+            start_date=start_date,
+            end_date=end_date).fetchall()
         schema = HotDeskRequestSchema(many=True, exclude=EXCLUDED_FIELDS)
         data, meta = list_paginator(schema.dump(data).data)
         return {'data': data, 'meta': meta}
@@ -1,14 +1,16 @@
 # s
-import flask_excel as excel
+from flask import request
 from flask_restplus import Resource
 
 # utilities
 from api.utilities.swagger.collections.hot_desk import hot_desk_namespace
 from api.utilities.swagger.constants import ANALYTICS_REQUEST_PARAMS
 from ..middlewares.token_required import token_required
-from ..utilities.validators.analytics_validator import report_query_validator
+from ..utilities.validators.analytics_validator import validate_report_query
 from ..utilities.constants import HOT_DESK_REPORT_QUERIES
-from ..utilities.verify_date_range import report_query_date_validator
+from ..utilities.verify_date_range import get_report_date_range
+from ..utilities.helpers.csv_export import (get_schema_headers,
+                                            make_csv_response, stream_query)
 
 # models
 from api.models import HotDeskRequest, User
@@ -26,20 +28,45 @@ class ExportHotDeskAnalyticsReportResource(Resource):
 
     @token_required
     @permission_required(Resources.HOT_DESKS)
-    @report_query_validator(HOT_DESK_REPORT_QUERIES)
-    @report_query_date_validator
     @hot_desk_namespace.doc(params=ANALYTICS_REQUEST_PARAMS)
-    def get(self, report_query, start_date, end_date):
+    def get(self):
         """Handles GET request for /hot-desks/analytics/export endpoint
 
+        Returns:
+            csv: The records of the report parameter value
+        """
+        return make_csv_response(
+            **self.export(**self.parse_export_args(request.args)))
+
+    @staticmethod
+    def parse_export_args(query):
+        """Parses and validates the report and date range of an export
+
+        Args:
+            query (dict): The url queries
+
+        Returns:
+            dict: The arguments of `export`
+        """
+        report_query = validate_report_query(query, HOT_DESK_REPORT_QUERIES)
+        start_date, end_date = get_report_date_range(
+            query, '/hot-desks/analytics/export')
+        return dict(
+            report_query=report_query,
+            start_date=start_date,
+            end_date=end_date)
+
+    def export(self, report_query, start_date, end_date):
+        """Builds the export of the requested hot desk report
+
         Args:
             report_query (str): The value of the report parameter in the request.
             start_date (datetime): The start date value.
             end_date (datetime): The end date value.
 
         Returns:
-            csv: The return value from any of the methods handling
-                  the corresponding report parameter value
+            dict: The chunks of records and headers returned by the method
+                  handling the corresponding report parameter value
         """
         # Maps the methods of this class that generates report in csv to a key
         report_mapper = {
@@ -50,14 +77,14 @@ class ExportHotDeskAnalyticsReportResource(Resource):
 
         # records when no report query is provided
         if not report:
-            records = [{'to_be_implemented': "Endpoint yet to be implemented"}]
+            return dict(
+                chunks=[[{
+                    'to_be_implemented': "Endpoint yet to be implemented"
+                }]],
+                headers=['to_be_implemented'])
 
         # executes the method to return the records for the csv file
-        else:
-            records = report(start_date, end_date)
-
-        # makes a csv response from the records
-        return excel.make_response_from_records(records, 'csv')
+        return report(start_date, end_date)
 
     def hot_desk_requests(self, start_date, end_date):
         """ Helper method to fetch hot desk requests for a specified date range
@@ -65,7 +92,8 @@ class ExportHotDeskAnalyticsReportResource(Resource):
             start_date(date): the start date
             end_date(date): the end date
         returns:
-            hot_desk_data(list): A list of hot desk for the specified date range
+            hot_desk_data(dict): Chunks of hot desk records for the
+                specified date range and their headers
         """
         only = ['created_at', 'requester_id', 'status', 'hot_desk_ref_no']
         hot_desk_data = self.get_records(HotDeskRequest, HotDeskRequestSchema,
@@ -83,23 +111,44 @@ class ExportHotDeskAnalyticsReportResource(Resource):
             only(list): A list of fields needed.
 
          Returns:
-             list: a list of records (dict)
+             dict: chunks of records (list of dict) and their headers
         """
 
         model, schema, start_date, end_date, only = args
 
         records = model.query.filter_by() \
-            .filter(HotDeskRequest.created_at.between(start_date, end_date)).order_by(HotDeskRequest.created_at.desc()).all()
+            .filter(HotDeskRequest.created_at.between(start_date, end_date)).order_by(HotDeskRequest.created_at.desc())
+
+        records_schema = schema(many=True, only=only)
+
+        # the requester ids are replaced by the emails of the requesters
+        headers = get_schema_headers(
+            records_schema, skip=['requester_id']) + ['email']
+
+        return dict(
+            chunks=(self.add_requester_emails(records_schema.dump(chunk).data)
+                    for chunk in stream_query(records)),
+            headers=headers)
+
+    @staticmethod
+    def add_requester_emails(records_data):
+        """Replaces the requester id of hot desk records with their email
 
-        records_data = schema(many=True, only=only) \
-            .dump(records).data
+        The emails of all the requesters in the records are fetched at once.
+
+        Args:
+            records_data (list): The serialized hot desk requests
+
+        Returns:
+            list: a list of records (dict)
+        """
+        requester_ids = {record.get('requester_id') for record in records_data}
+        emails = dict(
+            User.query_().with_entities(User.token_id, User.email).filter(
+                User.token_id.in_(requester_ids)))
 
-        # Get hot desk requester email and add it to the records_data
         for record in records_data:
-            requester_id = record.get('requester_id')
-            email = User.query_().filter_by(
-                token_id=requester_id).first().email
-            del record['requester_id']
-            record['email'] = email
+            requester_id = record.pop('requester_id')
+            record['email'] = emails.get(requester_id)
 
         return records_data
@@ -1,18 +1,18 @@
 """Module for Hot Desk Resource report """
-from sqlalchemy import text, and_, or_
+from sqlalchemy import and_, or_
 from main import api
 
 from datetime import datetime, timedelta
 from flask import request
 from flask_restplus import Resource
 from api.models import HotDeskRequest, User, HotDeskResponse
-from api.models.database import db
 from config import AppConfig
 
 from api.utilities.swagger.collections.hot_desk import hot_desk_namespace
 from api.utilities.swagger.constants import (HOTDESK_REQUEST_PARAMS,
                                              PAGINATION_PARAMS)
 from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
 from ..utilities.base_analytics import AnalyticsBase
 from ..utilities.constants import (
     USER_SCHEMA_FIELDS, EXCLUDED_FIELDS, HOT_DESK_QUERY_PARAMS,
@@ -172,10 +172,10 @@ class HotDesksResource(Resource, AnalyticsBase):
 
         validate_param_value(param_value)
 
-        cancelled_hot_dest_reasons_count = sql_queries[
-            'get_cancellation_reasons_count'].format(start_date, end_date)
-        count_data = db.engine.execute(
-            text(cancelled_hot_dest_reasons_count)).fetchall()
+        count_data = execute_query(
+            sql_queries['get_cancellation_reasons_count'],
+            start_date=start_date,
+            end_date=end_date).fetchall()
         schema = HotDeskRequestCancellationCountSchema(
             many=True, exclude=EXCLUDED_FIELDS)
         reasons_count = schema.dump(count_data).data[0]
@@ -204,12 +204,11 @@ class HotDesksResource(Resource, AnalyticsBase):
         validate_param_value(param_value)
         pending_time = (datetime.utcnow() -
                         timedelta(milliseconds=int(AppConfig.BOT_COUNTDOWN)))
-        responders_hot_desk_data = sql_queries[
-            'hotdesk_responder_counts'].format(pending_time, start_date,
-                                               end_date)
-
-        count_data = db.engine.execute(
-            text(responders_hot_desk_data)).fetchall()
+        count_data = execute_query(
+            sql_queries['hotdesk_responder_counts'],
+            pending_time=pending_time,
+            start_date=start_date,
+            end_date=end_date).fetchall()
         schema = ResponderHotdeskCountSchema(
             many=True, exclude=EXCLUDED_FIELDS)
         all_data, meta = list_paginator(schema.dump(count_data).data)
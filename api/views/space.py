@@ -1,14 +1,12 @@
 """Module for spaces resource"""
 from flask_restplus import Resource
 from flask import request
-from sqlalchemy import text
 
 # Documentation
 from api.utilities.swagger.collections.space_type import space_namespace
 from api.utilities.swagger.swagger_models.space_type import space_models
 
 from api.middlewares.base_validator import ValidationError
-from api.models.database import db
 from ..schemas.space_type import SpaceTypeSchema
 from ..models import Center, SpaceType, Space
 from ..schemas.space import SpaceSchema
@@ -16,6 +14,7 @@ from ..middlewares.token_required import token_required
 from ..utilities.messages.error_messages import database_errors
 from ..utilities.validators.validate_id import validate_id
 from ..utilities.helpers.spaces import space_query, update_space_type
+from ..utilities.helpers.space_hierarchy import subtree_pattern
 from ..utilities.validators.space_validator import SpaceValidator
 from ..utilities.validators.space_query_validator import validate_query
 from ..utilities.validators.validate_json_request import validate_json_request
@@ -25,6 +24,7 @@ from ..utilities.helpers.resource_manipulation_for_delete import delete_by_id
 from ..utilities.helpers.endpoint_response \
     import get_success_responses_for_post_and_patch
 from ..utilities.sql_queries import sql_queries
+from ..utilities.prepared_statements import execute_query
 from api.utilities.swagger.constants import SPACE_REQUEST_PARAMS
 # Resources
 from ..middlewares.permission_required import Resources
@@ -131,14 +131,12 @@ class SpaceResource(Resource):
         # Check if buildingId filter param is provided. If so, validate it
         # and use it to filter response before returning it
         if building_id:
-            SpaceValidator.validate_parent_exists(building_id)
-            space_sql_query = sql_queries['get_building_spaces'].format(
-                building_id)
-            space_types_sql_query = sql_queries['get_space_types']
+            building = SpaceValidator.validate_parent_exists(building_id)
 
             # execute the query and get back sqlalchemy result proxy object
-            spaces = db.engine.execute(text(space_sql_query))
-            space_types = db.engine.execute(text(space_types_sql_query))
+            spaces = execute_query(sql_queries['get_building_spaces'],
+                                   pattern=subtree_pattern(building.path))
+            space_types = execute_query(sql_queries['get_space_types'])
 
             # Mapping dictionary with rows values
             spaces = [dict(row) for row in spaces]
@@ -240,3 +238,90 @@ class SingleSpaceResource(Resource):
             'Space',
             status_code=200,
             message_key='updated')
+
+
+@space_namespace.route('/<string:space_id>/descendants')
+class SpaceDescendantsResource(Resource):
+    """Resource class for the spaces under a space"""
+
+    @token_required
+    @permission_required(Resources.SPACES)
+    @validate_id
+    def get(self, space_id):
+        """
+        Gets the spaces under a space at any depth
+        :param space_id:
+        :returns dict with the descendants ordered from the top down
+        """
+        space = Space.get_or_404(space_id)
+        descendants = space.descendants().all()
+        space_schema = SpaceSchema(
+            many=True,
+            only=[
+                'id', 'name', 'parent_id', 'space_type', 'center_id',
+                'children_count'
+            ],
+            context={
+                'children_counts':
+                Space.children_counts([space.id for space in descendants])
+            })
+        return {
+            'status': 'success',
+            'message': SUCCESS_MESSAGES['fetched'].format('Spaces'),
+            'data': space_schema.dump(descendants).data
+        }
+
+
+@space_namespace.route('/<string:space_id>/ancestors')
+class SpaceAncestorsResource(Resource):
+    """Resource class for the spaces a space is under"""
+
+    @token_required
+    @permission_required(Resources.SPACES)
+    @validate_id
+    def get(self, space_id):
+        """
+        Gets the spaces a space is under
+        :param space_id:
+        :returns dict with the ancestors ordered from the root down
+        """
+        space = Space.get_or_404(space_id)
+        space_schema = SpaceSchema(
+            many=True,
+            only=['id', 'name', 'parent_id', 'space_type', 'center_id'])
+        return {
+            'status': 'success',
+            'message': SUCCESS_MESSAGES['fetched'].format('Spaces'),
+            'data': space_schema.dump(space.ancestors()).data
+        }
+
+
+@space_namespace.route('/<string:space_id>/assets-count')
+class SpaceAssetsCountResource(Resource):
+    """Resource class for the count of assets in the subtree of a space"""
+
+    @token_required
+    @permission_required(Resources.SPACES)
+    @validate_id
+    def get(self, space_id):
+        """
+        Counts the assets assigned to a space and the spaces under it
+        :param space_id:
+        :returns dict with the count of assets of the subtree, of the space
+            and of the subtree of each child
+        """
+        space = Space.get_or_404(space_id)
+        total, own, children = space.subtree_assets_count()
+        return {
+            'status': 'success',
+            'message': SUCCESS_MESSAGES['fetched'].format('Assets count'),
+            'data': {
+                'id': space.id,
+                'assetsCount': total,
+                'ownAssetsCount': own,
+                'children': [{
+                    'id': child_id,
+                    'assetsCount': count
+                } for child_id, count in children.items()]
+            }
+        }
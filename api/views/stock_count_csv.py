@@ -1,7 +1,7 @@
 # Third party
 from flask import request
 from flask_restplus import Resource
-import flask_excel as excel
+from sqlalchemy.orm import contains_eager, joinedload
 
 # Documentation
 from api.utilities.swagger.collections.stock_count import stock_count_namespace
@@ -9,6 +9,10 @@ from api.utilities.swagger.collections.stock_count import stock_count_namespace
 # Utilities
 from ..middlewares.token_required import token_required
 from ..utilities.stock_count_query_parser import StockCountQueryParser
+from ..utilities.helpers.csv_export import make_csv_response, stream_query
+# Models
+from ..models import StockCount
+
 # Resources
 from ..middlewares.permission_required import Resources
 # Permissions
@@ -24,14 +28,44 @@ class ExportStockCountResource(Resource):
     def get(self):
         """Filter and export stock counts to csv"""
 
-        stock_counts = StockCountQueryParser.get_filtered_stock_counts(
-            request.args)
+        return make_csv_response(
+            **self.export(**self.parse_export_args(request.args)))
+
+    @staticmethod
+    def parse_export_args(query):
+        """Parses and validates the filters of an export of stock counts
+
+        Args:
+            query (dict): The url queries
+
+        Returns:
+            dict: The arguments of `export`
+        """
+        return dict(
+            filters=StockCountQueryParser.parse_all(StockCount, query))
+
+    def export(self, filters):
+        """Builds the export of the stock counts matching filters
+
+        Args:
+            filters (tuple): The parsed column, month and year filters
+
+        Returns:
+            dict: The chunks of records and headers of the export
+        """
+        # the joined collections of asset categories cannot be streamed
+        stock_counts = StockCountQueryParser.filter_stock_counts(
+            filters).options(
+                contains_eager(StockCount.asset_category).lazyload('*'),
+                joinedload(StockCount.user))
 
-        stock_count_data = ({
+        stock_count_data = ([{
             'Category': data.asset_category.name,
             'Date': data.created_at.date(),
             'Stock Count': data.count,
             'User': data.user.name
-        } for data in stock_counts)
+        } for data in chunk] for chunk in stream_query(stock_counts))
 
-        return excel.make_response_from_records(stock_count_data, 'csv')
+        return dict(
+            chunks=stock_count_data,
+            headers=['Category', 'Date', 'Stock Count', 'User'])
@@ -1,10 +1,11 @@
 from flask import request
 from flask_restplus import Resource
-import flask_excel as excel
+from sqlalchemy.orm import contains_eager
 
 from ..models import User, Center, Role
 from ..middlewares.token_required import token_required
 from ..utilities.query_parser import QueryParser
+from ..utilities.helpers.csv_export import make_csv_response, stream_query
 from api.utilities.swagger.collections.user import user_namespace
 from api.utilities.swagger.constants import EXPORT_USER_REQUEST_PARAMS
 from api.utilities.swagger.constants import USER_REQUEST_PARAMS
@@ -25,17 +26,43 @@ class ExportUserResource(Resource):
     def get(self):
         """Filter and export users to csv"""
 
-        filters = QueryParser.parse_all(User, request.args)
-        users = User.query_(filters).join(Center,
-                                          Role).filter(User.deleted == False)
+        return make_csv_response(
+            **self.export(**self.parse_export_args(request.args)))
 
-        user_data = ({
+    @staticmethod
+    def parse_export_args(query):
+        """Parses and validates the filters of an export of users
+
+        Args:
+            query (dict): The url queries
+
+        Returns:
+            dict: The arguments of `export`
+        """
+        return dict(filters=QueryParser.parse_all(User, query))
+
+    def export(self, filters):
+        """Builds the export of the users matching filters
+
+        Args:
+            filters (ImmutableMultiDict): The parsed filters of the users
+
+        Returns:
+            dict: The chunks of records and headers of the export
+        """
+        users = User.query_(filters).join(Center, Role) \
+            .options(contains_eager(User.center), contains_eager(User.role)) \
+            .filter(User.deleted == False)
+
+        user_data = ([{
             'name': user.name,
             'email': user.email,
             'center': user.center.name,
             'role': user.role.title,
             'status': user.status.name,
             'image url': user.image_url
-        } for user in users)
+        } for user in chunk] for chunk in stream_query(users))
 
-        return excel.make_response_from_records(user_data, 'csv')
+        return dict(
+            chunks=user_data,
+            headers=['center', 'email', 'image url', 'name', 'role', 'status'])
@@ -0,0 +1,10 @@
+"""
+Benchmark suite driving the hot endpoints of the API against synthetic
+datasets
+
+Example:
+    A dataset of 10k assets is loaded into the test database, the endpoints
+    are benchmarked and compared with the saved baseline with::
+
+        $ FLASK_ENV=testing flask benchmark --size 10k
+"""
@@ -0,0 +1,310 @@
+"""
+Module for generating the synthetic datasets the endpoints are benchmarked
+against
+"""
+# Standard library
+import random
+from datetime import datetime, timedelta
+from itertools import islice
+
+# Third party
+from faker import Faker
+from sqlalchemy import text
+
+# Models
+from api.models import (Asset, AssetCategory, Center, History, PushID,
+                        Request, RequestType, Role, Space, StockCount, User)
+
+# Database
+from api.models.database import db
+
+# Utilities
+from api.utilities.enums import AssetStatus, AssigneeType, RequestStatusEnum
+from api.utilities.helpers.asset_category_stats import \
+    rebuild_asset_category_stats
+
+# Seeders
+from seeders import seed_db
+
+# The count of assets of each dataset size
+DATASET_SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+# The seeders of the reference data the synthetic records point at
+REFERENCE_DATA = [
+    'centers', 'asset_categories', 'space_types', 'spaces', 'permissions',
+    'resources', 'roles', 'users', 'resource_access_levels', 'request_types'
+]
+
+# The same seed generates the same dataset on every run
+DATASET_SEED = 2019
+
+# The count of rows inserted per statement
+CHUNK_SIZE = 5000
+
+# The email of the super user the benchmarks authenticate as
+BENCHMARK_USER_EMAIL = 'benchmark.user@andela.com'
+
+# Prefix of the tags of the synthetic assets
+ASSET_TAG_PREFIX = 'BM'
+
+
+class DatasetGenerator(object):
+    """Generates a reproducible synthetic dataset of a given size
+
+    The reference data comes from the seeders. The bulk of the records,
+    i.e users, assets, stock counts, history and requests, is generated with
+    Faker and inserted in chunks with core inserts, so the ORM events of the
+    models do not run for each record. The maintained asset category stats
+    are rebuilt once the assets are inserted.
+
+    attributes:
+        assets (int): the count of assets to generate
+        fake (Faker): the seeded generator of fake values
+        random (Random): the seeded generator of random choices
+    """
+
+    def __init__(self, assets, seed=DATASET_SEED):
+        self.assets = assets
+        self.fake = Faker()
+        self.fake.seed_instance(seed)
+        self.random = random.Random(seed)
+        self.push_id = PushID()
+        self.now = datetime.utcnow()
+
+    @property
+    def counts(self):
+        """The count of records generated for each table"""
+        return {
+            'users': max(self.assets // 100, 50),
+            'assets': self.assets,
+            'stock_counts': max(self.assets // 10, 100),
+            'history': self.assets,
+            'requests': max(self.assets // 20, 100)
+        }
+
+    def generate(self):
+        """Generates the dataset
+
+        Returns:
+            dict: the count of records generated for each table and the
+                values the benchmark scenarios look up
+        """
+        for resource_name in REFERENCE_DATA:
+            seed_db(resource_name)
+
+        # ordered, so the same seed makes the same choices
+        self.centers = [center.id for center in Center.query.order_by('id')]
+        self.categories = [
+            category.id for category in AssetCategory.query.order_by('id')
+        ]
+        self.spaces = [space.id for space in Space.query.order_by('id')]
+        self.request_types = [
+            request_type.id
+            for request_type in RequestType.query.order_by('id')
+        ]
+        benchmark_user = self.create_benchmark_user()
+
+        counts = self.counts
+        users = self.insert(User, self.user_rows(counts['users']))
+        self.users = [row['token_id'] for row in users
+                      ] + [benchmark_user.token_id]
+        assets = self.insert(Asset, self.asset_rows(counts['assets']),
+                             keep=('id', ))
+        self.insert(StockCount, self.stock_count_rows(counts['stock_counts']))
+        self.insert(History,
+                    self.history_rows([row['id'] for row in assets]))
+        self.insert(Request, self.request_rows(counts['requests']))
+
+        rebuild_asset_category_stats(db.session)
+        db.session.commit()
+
+        # refresh the planner statistics of the loaded tables
+        connection = db.engine.connect().execution_options(
+            isolation_level='AUTOCOMMIT')
+        connection.execute(text('ANALYZE'))
+        connection.close()
+
+        return {
+            'size': counts,
+            'token_id': benchmark_user.token_id,
+            'category_id': self.categories[0],
+            'space_id': root_space_id(),
+            'search_text': ASSET_TAG_PREFIX,
+        }
+
+    def create_benchmark_user(self):
+        """Creates the super user the benchmarks authenticate as
+
+        Returns:
+            User: the benchmark user
+        """
+        user = User.query.filter_by(email=BENCHMARK_USER_EMAIL).first()
+        if user is None:
+            role = Role(
+                title='Benchmark',
+                description='Super user of the benchmarks',
+                super_user=True).save()
+            user = User(
+                email=BENCHMARK_USER_EMAIL,
+                name='Benchmark User',
+                token_id=self.push_id.next_id(),
+                role_id=role.id,
+                center_id=self.centers[0]).save()
+        return user
+
+    def insert(self, model, rows, keep=None):
+        """Inserts generated rows in chunks
+
+        Args:
+            model (class): the model of the table
+            rows (iterable): the generated rows
+            keep (tuple): the columns of the rows to return. All the columns
+                are returned when not given
+
+        Returns:
+            list: the inserted rows
+        """
+        inserted = []
+        rows = iter(rows)
+        chunk = list(islice(rows, CHUNK_SIZE))
+        while chunk:
+            db.session.execute(model.__table__.insert(), chunk)
+            inserted.extend(chunk if keep is None else [{
+                column: row[column]
+                for column in keep
+            } for row in chunk])
+            chunk = list(islice(rows, CHUNK_SIZE))
+        db.session.commit()
+        return inserted
+
+    def past_date(self, days=365):
+        """A random date in the past days"""
+        return self.now - timedelta(
+            seconds=self.random.randint(0, days * 24 * 60 * 60))
+
+    def user_rows(self, count):
+        """Generates users spread across the centers"""
+        role_id = Role.query.filter(Role.super_user.isnot(True)).first().id
+        for index in range(count):
+            yield {
+                'id': self.push_id.next_id(),
+                'token_id': self.push_id.next_id(),
+                'name': self.fake.name()[:60],
+                'email': f'{index}.{self.fake.user_name()}@andela.com'[:60],
+                'role_id': role_id,
+                'center_id': self.random.choice(self.centers),
+            }
+
+    def asset_rows(self, count):
+        """Generates assets across the centers and categories, assigned to
+        spaces and users"""
+        statuses = [status.value for status in AssetStatus]
+        for index in range(count):
+            assigned_to_user = self.random.random() < 0.6
+            yield {
+                'id': self.push_id.next_id(),
+                'tag': f'{ASSET_TAG_PREFIX}/{index:07d}',
+                'asset_category_id': self.random.choice(self.categories),
+                'center_id': self.random.choice(self.centers),
+                'assignee_type': AssigneeType.user
+                if assigned_to_user else AssigneeType.space,
+                'assignee_id': self.random.choice(
+                    self.users if assigned_to_user else self.spaces),
+                'status': self.random.choice(statuses),
+                'date_assigned': self.past_date(),
+                'custom_attributes': {
+                    'serial': self.fake.ean8(),
+                    'colour': self.fake.safe_color_name()
+                },
+                'created_at': self.past_date(),
+            }
+
+    def stock_count_rows(self, count):
+        """Generates weekly stock counts of the categories"""
+        for _ in range(count):
+            created_at = self.past_date()
+            yield {
+                'id': self.push_id.next_id(),
+                'asset_category_id': self.random.choice(self.categories),
+                'center_id': self.random.choice(self.centers),
+                'token_id': self.random.choice(self.users),
+                'week': (created_at.day - 1) // 7 + 1,
+                'count': self.random.randint(0, 500),
+                'created_at': created_at,
+            }
+
+    def history_rows(self, asset_ids):
+        """Generates a history entry for each asset"""
+        for asset_id in asset_ids:
+            yield {
+                'id': self.push_id.next_id(),
+                'resource_id': asset_id,
+                'resource_type': 'Asset',
+                'action': 'Added',
+                'actor_id': self.random.choice(self.users),
+                'activity': self.fake.sentence(),
+                'created_at': self.past_date(),
+            }
+
+    def request_rows(self, count):
+        """Generates requests in every status"""
+        statuses = list(RequestStatusEnum)
+        for _ in range(count):
+            yield {
+                'id': self.push_id.next_id(),
+                'subject': self.fake.sentence(nb_words=4)[:60],
+                'description': self.fake.paragraph(),
+                'request_type_id': self.random.choice(self.request_types),
+                'center_id': self.random.choice(self.centers),
+                'requester_id': self.random.choice(self.users),
+                'responder_id': self.random.choice(self.users),
+                'status': self.random.choice(statuses),
+                'due_by': self.now + timedelta(
+                    days=self.random.randint(-30, 30)),
+                'created_at': self.past_date(),
+            }
+
+
+def root_space_id():
+    """Gets the id of the first space that is not under another space"""
+    return Space.query.filter_by(parent_id=None).order_by('id').first().id
+
+
+def load_dataset(size, seed=DATASET_SEED):
+    """Recreates the tables and loads a dataset
+
+    Args:
+        size (str): the size of the dataset e.g 10k
+        seed (int): the seed of the generated values
+
+    Returns:
+        dict: the generated counts and the values the scenarios look up
+    """
+    db.session.remove()
+    db.drop_all()
+    db.create_all()
+    return DatasetGenerator(DATASET_SIZES[size], seed).generate()
+
+
+def describe_dataset(size):
+    """Describes the dataset loaded by an earlier run
+
+    Args:
+        size (str): the size the dataset was loaded with e.g 10k
+
+    Returns:
+        dict: the generated counts and the values the scenarios look up
+
+    Raises:
+        ValueError: if no dataset was loaded
+    """
+    user = User.query.filter_by(email=BENCHMARK_USER_EMAIL).first()
+    if user is None:
+        raise ValueError('No benchmark dataset is loaded')
+    return {
+        'size': DatasetGenerator(DATASET_SIZES[size]).counts,
+        'token_id': user.token_id,
+        'category_id': AssetCategory.query.order_by('id').first().id,
+        'space_id': root_space_id(),
+        'search_text': ASSET_TAG_PREFIX,
+    }
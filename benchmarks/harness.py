@@ -0,0 +1,296 @@
+"""
+Module for running the benchmark scenarios and comparing their results with
+a saved baseline
+"""
+# Standard library
+import json
+import math
+import tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+
+# Third party
+import jwt
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+
+# App config
+from config import AppConfig
+
+# Models
+from api.models import User
+
+# Schemas
+from api.schemas.user import UserSchema
+
+# Utilities
+from api.utilities.constants import (CHARSET, EXCLUDED_FIELDS,
+                                     METRICS_DEBUG_HEADER, MIMETYPE)
+
+# Latency and memory may grow by this fraction of the baseline before they
+# count as a regression
+REGRESSION_TOLERANCE = 0.25
+
+# Latency differences below these milliseconds are noise
+LATENCY_NOISE_MS = 5
+
+
+def auth_header(token_id):
+    """Builds the headers of a user signed in with the testing key
+
+    The token holds the dumped user like the tokens of the identity
+    provider do, as the endpoints read the name and role of the user from
+    it.
+
+    Args:
+        token_id (str): the token id of the user
+
+    Returns:
+        dict: the headers of the requests of the benchmarks
+    """
+    secret_key = serialization.load_pem_private_key(
+        AppConfig.JWT_SECRET_KEY.encode(),
+        password=None,
+        backend=default_backend())
+    user_info = UserSchema(exclude=EXCLUDED_FIELDS +
+                           ['center', 'created_at', 'updated_at']).dump(
+                               User.get_or_404(token_id)).data
+    user_info['id'] = token_id
+    payload = {
+        'UserInfo': user_info,
+        'exp': datetime.utcnow() + timedelta(hours=6)
+    }
+    token = jwt.encode(payload, secret_key, algorithm='RS256').decode(CHARSET)
+    return {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': MIMETYPE,
+        'Accept': MIMETYPE,
+        METRICS_DEBUG_HEADER: 'true'
+    }
+
+
+def percentile(values, rank):
+    """Gets the nearest rank percentile of values
+
+    Args:
+        values (list): the measured values
+        rank (int): the percentile e.g 90
+
+    Returns:
+        float: the value at the percentile
+    """
+    ordered = sorted(values)
+    index = max(math.ceil(rank / 100 * len(ordered)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def parse_debug_header(header):
+    """Parses the numbers of a request from its debug header
+
+    Args:
+        header (str): e.g `latency=0.012; sql-statements=3; ...`
+
+    Returns:
+        dict: the numbers keyed by their names
+    """
+    numbers = {}
+    for pair in (header or '').split(';'):
+        name, _, value = pair.strip().partition('=')
+        if value:
+            numbers[name] = float(value)
+    return numbers
+
+
+def send(client, scenario, dataset, headers, iteration):
+    """Sends a request of a scenario and reads its whole response
+
+    Returns:
+        tuple: the response and the seconds it took
+    """
+    url, kwargs = scenario.request_args(dataset, iteration)
+    started = perf_counter()
+    response = client.open(
+        url, method=scenario.method, headers=headers, **kwargs)
+    response.get_data()
+    return response, perf_counter() - started
+
+
+def run_scenario(client, scenario, dataset, headers, runs, warmup=2):
+    """Benchmarks a scenario
+
+    The latency is measured on untraced runs. The peak memory is measured on
+    one more run, as tracing the allocations slows the requests down.
+
+    Args:
+        client (FlaskClient): the test client
+        scenario (Scenario): the scenario to benchmark
+        dataset (dict): the values the dataset was generated with
+        headers (dict): the headers of the requests
+        runs (int): the count of measured requests
+        warmup (int): the count of requests made before measuring
+
+    Returns:
+        dict: the latency percentiles in milliseconds, the sql statements
+            and time of a request and the peak memory in kilobytes
+    """
+    iteration = 0
+    for iteration in range(warmup):
+        send(client, scenario, dataset, headers, iteration)
+
+    latencies, statements, sql_times, statuses = [], [], [], set()
+    for iteration in range(warmup, warmup + runs):
+        response, latency = send(client, scenario, dataset, headers,
+                                 iteration)
+        numbers = parse_debug_header(
+            response.headers.get(METRICS_DEBUG_HEADER))
+        latencies.append(latency * 1000)
+        statements.append(numbers.get('sql-statements', 0))
+        sql_times.append(numbers.get('sql-time', 0) * 1000)
+        statuses.add(response.status_code)
+
+    tracemalloc.start()
+    try:
+        send(client, scenario, dataset, headers, warmup + runs)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'runs': runs,
+        'statuses': sorted(statuses),
+        'p50_ms': round(percentile(latencies, 50), 3),
+        'p90_ms': round(percentile(latencies, 90), 3),
+        'p99_ms': round(percentile(latencies, 99), 3),
+        'max_ms': round(max(latencies), 3),
+        'sql_statements': int(max(statements)),
+        'sql_p50_ms': round(percentile(sql_times, 50), 3),
+        'peak_memory_kb': round(peak_memory / 1024, 1)
+    }
+
+
+def run_benchmarks(client, scenarios, dataset, runs):
+    """Benchmarks the scenarios
+
+    Args:
+        client (FlaskClient): the test client
+        scenarios (list): the scenarios to benchmark
+        dataset (dict): the values the dataset was generated with
+        runs (int): the count of measured requests of each scenario
+
+    Returns:
+        dict: the dataset and the results of each scenario
+    """
+    headers = auth_header(dataset['token_id'])
+    return {
+        'dataset': dataset['size'],
+        'scenarios': {
+            scenario.name: run_scenario(client, scenario, dataset, headers,
+                                        runs)
+            for scenario in scenarios
+        }
+    }
+
+
+def status_errors(results):
+    """Gets the scenarios answered with a non 2xx status
+
+    Such a run measures error responses, not the endpoints.
+
+    Args:
+        results (dict): the results of a run
+
+    Returns:
+        list: the scenarios with their failed statuses
+    """
+    errors = []
+    for name, result in results['scenarios'].items():
+        failed = [
+            status for status in result.get('statuses', [])
+            if not 200 <= status < 300
+        ]
+        if failed:
+            errors.append(f'{name}: responded with statuses {failed}')
+    return errors
+
+
+def compare(results, baseline, tolerance=REGRESSION_TOLERANCE):
+    """Compares the results of a run with a baseline
+
+    A scenario regresses when it responds with a non 2xx status or other
+    statuses than the baseline, when its p90 latency or peak memory grows by
+    more than the tolerance, or when it executes more sql statements.
+
+    Args:
+        results (dict): the results of the run
+        baseline (dict): the results of the baseline run
+        tolerance (float): the allowed growth of latency and memory
+
+    Returns:
+        list: the regressions found
+    """
+    regressions = []
+    if results.get('dataset') != baseline.get('dataset'):
+        return [
+            f'the baseline was run on a different dataset: '
+            f'{baseline.get("dataset")}'
+        ]
+
+    regressions.extend(status_errors(results))
+    for name, result in results['scenarios'].items():
+        expected = baseline['scenarios'].get(name)
+        if expected is None:
+            continue
+        if result.get('statuses') != expected.get('statuses'):
+            regressions.append(
+                f'{name}: statuses {result.get("statuses")}, '
+                f'baseline {expected.get("statuses")}')
+        if result['p90_ms'] > expected['p90_ms'] * (1 + tolerance) and \
+                result['p90_ms'] - expected['p90_ms'] > LATENCY_NOISE_MS:
+            regressions.append(
+                f'{name}: p90 latency {result["p90_ms"]}ms, '
+                f'baseline {expected["p90_ms"]}ms')
+        if result['sql_statements'] > expected['sql_statements']:
+            regressions.append(
+                f'{name}: {result["sql_statements"]} sql statements, '
+                f'baseline {expected["sql_statements"]}')
+        if result['peak_memory_kb'] > \
+                expected['peak_memory_kb'] * (1 + tolerance):
+            regressions.append(
+                f'{name}: peak memory {result["peak_memory_kb"]}kb, '
+                f'baseline {expected["peak_memory_kb"]}kb')
+    return regressions
+
+
+def load_baseline(path):
+    """Loads a saved baseline
+
+    Args:
+        path (str): the path of the baseline
+
+    Returns:
+        dict: the baseline or None if it was not saved yet
+    """
+    try:
+        with open(path) as baseline_file:
+            return json.load(baseline_file)
+    except FileNotFoundError:
+        return None
+
+
+def save_baseline(path, results):
+    """Saves the results of a run as the baseline
+
+    Args:
+        path (str): the path of the baseline
+        results (dict): the results of the run
+
+    Raises:
+        ValueError: if a scenario responded with a non 2xx status
+    """
+    errors = status_errors(results)
+    if errors:
+        raise ValueError(
+            'The results of failed requests cannot be the baseline: ' +
+            '; '.join(errors))
+    with open(path, 'w') as baseline_file:
+        json.dump(results, baseline_file, indent=2, sort_keys=True)
@@ -0,0 +1,81 @@
+"""
+Module for the endpoint scenarios the benchmarks drive
+"""
+# Third party
+from flask import json
+
+# App config
+from config import AppConfig
+
+# Utilities
+from api.utilities.enums import AssigneeType
+
+BASE_URL = AppConfig.API_BASE_URL_V1
+
+
+class Scenario(object):
+    """A request to an endpoint that is benchmarked
+
+    attributes:
+        name (str): the name of the scenario in the results
+        method (str): the method of the request
+        path (str): the path of the request. It is formatted with the values
+            of the dataset e.g `{category_id}`
+        body (function): builds the json body of a request from the values of
+            the dataset and the count of requests made so far
+    """
+
+    def __init__(self, name, path, method='GET', body=None):
+        self.name = name
+        self.path = path
+        self.method = method
+        self.body = body
+
+    def request_args(self, dataset, iteration):
+        """Builds the arguments of a request of the test client
+
+        Args:
+            dataset (dict): the values the dataset was generated with
+            iteration (int): the count of requests made so far
+
+        Returns:
+            tuple: the url and the keyword arguments of the request
+        """
+        kwargs = {}
+        if self.body:
+            kwargs['data'] = json.dumps(self.body(dataset, iteration))
+        return f'{BASE_URL}{self.path.format(**dataset)}', kwargs
+
+
+def bulk_assets(dataset, iteration, count=50):
+    """Builds a batch of new assets with tags unique to the iteration"""
+    return {
+        'assetCategoryId':
+        dataset['category_id'],
+        'assets': [{
+            'tag': f'BM/BULK/{iteration}/{index}',
+            'assigneeId': dataset['token_id'],
+            'assigneeType': AssigneeType.user.value,
+            'status': 'ok'
+        } for index in range(count)]
+    }
+
+
+SCENARIOS = [
+    Scenario('asset_list', '/assets?page=1&limit=20'),
+    Scenario('asset_list_filtered',
+             '/assets?where=status,eq,available&page=2&limit=20'),
+    Scenario('asset_category_stats', '/asset-categories/stats'),
+    Scenario('analytics_asset_flow', '/assets/analytics?report=assetflow'),
+    Scenario('analytics_stock_level', '/assets/analytics?report=stocklevel'),
+    Scenario('analytics_incidence_report',
+             '/assets/analytics?report=incidencereport'),
+    Scenario('global_search', '/search?q={search_text}&limit=10'),
+    Scenario('space_descendants', '/spaces/{space_id}/descendants'),
+    Scenario('space_assets_count', '/spaces/{space_id}/assets-count'),
+    Scenario('bulk_upload', '/assets/bulk', 'POST', bulk_assets),
+    Scenario('csv_export_stock_level',
+             '/assets/analytics/export?report=stocklevel'),
+    Scenario('csv_export_category_assets',
+             '/asset-categories/{category_id}/assets/export'),
+]
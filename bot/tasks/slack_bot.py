@@ -19,7 +19,7 @@ from .slack_bot_notification_handler import NotificationHandler
 
 # Utilities
 from ..utilities.constants import SHEET_HOT_DESK
-from bot.utilities.helpers.spreadsheet_helper import update_spread_sheet_data
+from bot.utilities.helpers.spreadsheet_helper import update_
 from ..utilities.user_hot_desk import cancel_hot_desk_by_id
 from ..utilities.helpers.bot_helpers import (update_approval_response_on_cancel,
                                              check_if_user_email_is_in_google_sheet,
@@ -123,12 +123,7 @@ class BotTasks(NotificationHandler):
         try:
             sheet_data, sheet = GoogleSheetHelper().open_sheet()
             if sheet:
-                bay_column = sheet.col_values(2)[1:]
-
-                for index, (record, column) in enumerate(
-                        zip(sheet_data, bay_column[:])):
-
-                    update_spread_sheet_data(index, record, sheet, hot_desk_ref_no, updated_to)
+                update_(sheet_data, sheet, hot_desk_ref_no, updated_to)
         except Exception as error:
             post_bugsnag_exception(
                 error, f'Could not update spreadsheet with ref no - {hot_desk_ref_no}')
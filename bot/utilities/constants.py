@@ -11,6 +11,14 @@ DEFAULT = {
 HOST_DESK_SOURCE = 'HOST_DESK_SOURCE'
 HOT_DESK = "HOT DESK"
 SHEET_HOT_DESK = 'Hot Desk'
+# the cache key of the snapshot of the hot desks read from the sheet
+HOT_DESK_SNAPSHOT_KEY = 'hot_desk_snapshot'
+# the seconds after which the snapshot is refreshed in the background
+HOT_DESK_SNAPSHOT_MAX_AGE = 300
+# the seconds the snapshot is kept, it is served while it is refreshed
+HOT_DESK_SNAPSHOT_TIMEOUT = 24 * 60 * 60
+# the seconds today's pending hot desk refs are kept in memory
+PENDING_HOT_DESKS_TIMEOUT = 30
 GOOGLE_SHEET_NOT_FOUND = 'Sorry, your request could not be completed, kindly contact the Activo admin through #ask-activo'
 TIMEOUT = 'Whoops, there seems to be an error in connection, try again please.'
 CENTERS = ['lagos']
@@ -84,16 +84,16 @@ class GoogleSheetHelper():
         hot_desks = [{key: value} for key, value in floor_dict.items()]
         return hot_desks
 
-    def retrieve_all_hot_desk(self):
+    def retrieve_all_hot_desk(self, opened_sheet=None):
         """ function to get all hot desk available on google sheet
         arg:
-           workbook name
-           work sheet position in the book
+           opened_sheet(tuple): the records and sheet of an opened sheet.
+               The sheet is opened when not given
         returns:
                a list of hot desk
         """
         list_of_hot_desk = []
-        sheet_data, sheet = self.open_sheet()
+        sheet_data, sheet = opened_sheet or self.open_sheet()
         if sheet:
             bay_column = sheet.col_values(2)[1:]
 
@@ -108,17 +108,17 @@ class GoogleSheetHelper():
                 add_hot_desk_to_list(hot_desk, list_of_hot_desk)
             return self.get_grouped_data(list_of_hot_desk)
 
-    def retrieve_all_hotdesk_eligible_users(self):
+    def retrieve_all_hotdesk_eligible_users(self, opened_sheet=None):
         """Get all hot desk eligible users from google sheet
 
         Args:
-           sheet(instance): an instance of the SpreadSheet
-           sheet_data(list): List of dictionaries containing        the contents of the spreadsheet.
+           opened_sheet(tuple): the records and sheet of an opened sheet.
+               The sheet is opened when not given
 
         Returns:
                list: all hot desk eligible users
         """
-        sheet_data, sheet = self.open_sheet()
+        sheet_data, sheet = opened_sheet or self.open_sheet()
         if sheet:
             bay_column = sheet.col_values(4)[651:]
             users = []
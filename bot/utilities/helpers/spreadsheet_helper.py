@@ -1,36 +1,101 @@
+import re
+
+from gspread.models import Cell
+
 from ..bugsnag import post_bugsnag_exception
 from ..google_sheets.google_sheets_helper import GoogleSheetHelper
 from ..ref_no_info import get_floor_and_seat_no
 
+# the column of the names the seats are allocated to
+NAME_COLUMN = 5
+
+# the row of the first record, below the header row
+FIRST_RECORD_ROW = 2
+
 
-def update_spread_sheet_data(*args):
-    """Method to update google sheet data
+def get_seat_key(floor, seat_no):
+    """Gets the key a seat of the sheet is indexed by
     Args:
-        *args
-            index(int): index of list
-            record(dict): sheet record
+        floor(str): the floor of a record e.g 1st
+        seat_no(int): the seat number of a record
+    Returns:
+        tuple: the floor and seat number or None if the record is not a seat
+    """
+    floor_no = re.match(r'\d+', str(floor or ''))
+    if not floor_no or not isinstance(seat_no, int):
+        return None
+    return int(floor_no.group()), seat_no
+
+
+class SheetSync():
+    """Batches the updates of the seats of the hot desk sheet
+
+    The rows of the seats are indexed by floor and seat number once, the
+    updates of the hot desks are staged against the index and the changed
+    cells are written in one range update.
+    """
+
+    def __init__(self, sheet_data, sheet):
+        """
+        Args:
+            sheet_data(list): the records of the sheet
             sheet(obj): sheet object
+        """
+        self.sheet = sheet
+        self.rows = {}
+        self.values = {}
+        self.changes = {}
+
+        for index, record in enumerate(sheet_data or []):
+            row = index + FIRST_RECORD_ROW
+            self.values[row] = record.get('Name')
+            key = get_seat_key(record.get('Floor'), record.get('# of seats'))
+            if key:
+                self.rows.setdefault(key, []).append(row)
+
+    def stage(self, hot_desk_ref_no, updated_to):
+        """Stages the update of a hot desk
+        Args:
             hot_desk_ref_no(string): hot desk ref number
             updated_to(str): What we want to update to
-    """
+        """
+        for row in self.rows.get(get_floor_and_seat_no(hot_desk_ref_no), []):
+            if self.values[row] == updated_to:
+                self.changes.pop(row, None)
+            else:
+                self.changes[row] = updated_to
 
-    index, record, sheet, hot_desk_ref_no, updated_to = args
-    floor, seat_no = get_floor_and_seat_no(hot_desk_ref_no)
+    def apply(self):
+        """Writes the staged updates to the sheet in one request
+        Returns:
+            int: the count of cells updated
+        """
+        if not self.changes:
+            return 0
 
-    if record.get('# of seats') == seat_no and record.get('Floor')[0] == str(floor):
-        try:
-            sheet.update_cell(index + 2, 5, updated_to)
-        except Exception as error:
-            post_bugsnag_exception(
-                error, f'Could not update spreadsheet seat no - {seat_no}')
+        self.sheet.update_cells([
+            Cell(row, NAME_COLUMN, value)
+            for row, value in sorted(self.changes.items())
+        ])
+        updated = len(self.changes)
+        self.values.update(self.changes)
+        self.changes = {}
+        return updated
 
 
 def update_(*args):
     """ Function to update hot desk
     Args:
+        sheet_data(list): the records of the sheet
+        sheet(obj): sheet object
         hot_desk_ref(string): hot desk ref number
         update_to(str): What we want to update to
     """
-    sheet_data, sheet, bay_column, hot_desk_ref, update_to = args
-    for index, record in enumerate(zip(sheet_data, bay_column[:])):
-        update_spread_sheet_data(index, record[0], sheet, hot_desk_ref, update_to)
+    sheet_data, sheet, hot_desk_ref, update_to = args
+    sheet_sync = SheetSync(sheet_data, sheet)
+    sheet_sync.stage(hot_desk_ref, update_to)
+    try:
+        sheet_sync.apply()
+    except Exception as error:
+        post_bugsnag_exception(
+            error, f'Could not update spreadsheet with ref no - {hot_desk_ref}')
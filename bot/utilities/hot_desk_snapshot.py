@@ -0,0 +1,193 @@
+"""
+Module for the shared snapshot of the hot desk inventory
+
+The hot desks, the eligible users and the permanent seats are read from the
+Space Allocation sheet in the background and cached in redis as one
+versioned snapshot, so the bot reads them from the cache instead of the
+sheet.
+"""
+# Standard library
+from datetime import datetime
+from threading import Lock
+
+# Third party
+from sqlalchemy import event
+
+# Local imports
+from main import cache
+
+# Models
+from api.models import HotDeskRequest
+
+# Utilities
+from api.utilities.helpers.calendar import get_start_or_end_of_day
+from api.utilities.helpers.lru_cache import LRUCache
+from ..attachments.buttons.common.menu import get_floors_list
+from .constants import (HOT_DESK_SNAPSHOT_KEY, HOT_DESK_SNAPSHOT_MAX_AGE,
+                        HOT_DESK_SNAPSHOT_TIMEOUT, PENDING_HOT_DESKS_TIMEOUT)
+from .google_sheets.google_sheets_helper import GoogleSheetHelper
+
+# today's pending hot desk refs, keyed by the date
+pending_hot_desks = LRUCache(1, PENDING_HOT_DESKS_TIMEOUT)
+
+sheet_helper_lock = Lock()
+sheet_helper = None
+
+
+def get_sheet_helper():
+    """Gets the google sheet helper shared by the refreshes
+
+    The credentials are read and gspread is authorized once per process.
+    The client logs in again once its access token expires.
+
+    Returns:
+        GoogleSheetHelper: the shared helper
+    """
+    global sheet_helper
+    with sheet_helper_lock:
+        if sheet_helper is None:
+            sheet_helper = GoogleSheetHelper()
+        elif sheet_helper.credentials.access_token_expired:
+            sheet_helper.client.login()
+        return sheet_helper
+
+
+def get_seat_locations(sheet_data):
+    """Gets the permanent seat of each name of the sheet in one pass
+
+    The room or bay of a seat is the closest one set on a row above it.
+
+    Args:
+        sheet_data (list): the records of the sheet
+
+    Returns:
+        dict: the seat locations keyed by the names e.g `{'Ada Obi': '1N 15'}`
+    """
+    seat_locations = {}
+    room_bay = ''
+    for record in sheet_data:
+        name = str(record.get('Name', '')).strip()
+        if name:
+            seat_locations[name] = f'{room_bay} {record.get("# of seats")}'
+        room_bay = str(record.get('Room/Bay', '')).strip() or room_bay
+    return seat_locations
+
+
+def build_hot_desk_snapshot(google_sheets_helper):
+    """Builds the snapshot of the hot desks from one download of the sheet
+
+    Args:
+        google_sheets_helper (GoogleSheetHelper): the helper to read with
+
+    Returns:
+        dict: the snapshot or None if the sheet was not found
+    """
+    sheet_data, sheet = google_sheets_helper.open_sheet()
+    if not sheet:
+        return None
+
+    hot_desk_floors, hot_desk_list, floors = get_floors_list(
+        google_sheets_helper.retrieve_all_hot_desk(
+            opened_sheet=(sheet_data, sheet)))
+    return {
+        'hot_desk_floors': hot_desk_floors,
+        'hot_desk_floors_with_cancel': hot_desk_floors[:],
+        'hot_desk_list': hot_desk_list,
+        'floors': floors,
+        'hot_desk_users_list':
+        google_sheets_helper.retrieve_all_hotdesk_eligible_users(
+            opened_sheet=(sheet_data, sheet)),
+        'seat_locations': get_seat_locations(sheet_data),
+    }
+
+
+def refresh_hot_desk_snapshot():
+    """Reads the sheet and caches a new version of the snapshot
+
+    Returns:
+        dict: the cached snapshot or None if the sheet was not found
+    """
+    snapshot = build_hot_desk_snapshot(get_sheet_helper())
+    if snapshot is None:
+        return None
+
+    current = get_hot_desk_snapshot() or {}
+    snapshot['version'] = current.get('version', 0) + 1
+    snapshot['refreshed_at'] = datetime.utcnow().timestamp()
+    cache.set(
+        HOT_DESK_SNAPSHOT_KEY, snapshot, timeout=HOT_DESK_SNAPSHOT_TIMEOUT)
+    return snapshot
+
+
+def get_hot_desk_snapshot():
+    """Gets the cached snapshot
+
+    Returns:
+        dict: the snapshot or None if none is cached
+    """
+    return cache.get(HOT_DESK_SNAPSHOT_KEY)
+
+
+def is_stale(snapshot):
+    """Checks if a snapshot should be refreshed
+
+    Args:
+        snapshot (dict): the snapshot
+
+    Returns:
+        bool: True if there is no snapshot or it is older than the max age
+    """
+    return not snapshot or datetime.utcnow().timestamp() - \
+        snapshot['refreshed_at'] > HOT_DESK_SNAPSHOT_MAX_AGE
+
+
+def get_pending_hot_desk_refs():
+    """Gets the refs of the hot desks requested today and still pending
+
+    The refs are queried once and kept in memory until they expire or a hot
+    desk request changes.
+
+    Returns:
+        set: the pending hot desk refs
+    """
+    today = datetime.today()
+    pending_refs = pending_hot_desks.get(today.date())
+    if pending_refs is None:
+        start_date = get_start_or_end_of_day(today, end=False)
+        end_date = get_start_or_end_of_day(today, end=True)
+        pending_requests = HotDeskRequest.query.with_entities(
+            HotDeskRequest.hot_desk_ref_no).filter(
+                HotDeskRequest.created_at.between(start_date, end_date),
+                HotDeskRequest.status == 'pending')
+        pending_refs = {row.hot_desk_ref_no for row in pending_requests}
+        pending_hot_desks.set(today.date(), pending_refs)
+    return pending_refs
+
+
+def get_non_requested_hotdesks(hot_desk_list):
+    """
+    get the hotdesks that have not been requested
+
+    Args:
+        hot_desk_list (list): list of all the hotdesk
+
+    Returns:
+        list: list of hotdesks that have not been requested
+    """
+    pending_hot_desk_refs = get_pending_hot_desk_refs()
+    return [{
+        floor: [
+            desk for desk in (desk.strip(' ') for desk in desks)
+            if desk not in pending_hot_desk_refs
+        ]
+    } for floor_desks in hot_desk_list
+            for floor, desks in floor_desks.items()]
+
+
+def clear_pending_hot_desk_refs(mapper, connection, target):
+    """Drops the pending hot desk refs once a hot desk request changes"""
+    pending_hot_desks.clear()
+
+
+for identifier in ['after_insert', 'after_update']:
+    event.listen(HotDeskRequest, identifier, clear_pending_hot_desk_refs)
@@ -6,33 +6,44 @@ import requests
 from slackclient import SlackClient
 
 from ..bugsnag import post_bugsnag_exception
-from main import cache
+from ..hot_desk_snapshot import get_hot_desk_snapshot, get_non_requested_hotdesks
 
 from ...attachments.elements.reasons import reject_reason
 
 from config import AppConfig
 
 
+def get_snapshot_value(key):
+    """Method which gets a value of the hot desk snapshot
+    Returns: the value or None if there is no snapshot
+    """
+    snapshot = get_hot_desk_snapshot()
+    return snapshot.get(key) if snapshot else None
+
+
 def get_slack_hot_desk_floors():
     """Method which gets all hot desk floors
     Returns: list
     """
-    return cache.get('slack_hot_desk_floors')
+    return get_snapshot_value('hot_desk_floors')
 
 
 def get_slack_hot_desk_floors_with_cancel():
     """Method which gets all hot desk floors with cancel button included
     Returns: list
     """
-    return cache.get('slack_hot_desk_floors_with_cancel')
+    return get_snapshot_value('hot_desk_floors_with_cancel')
 
 
 def get_slack_hot_desk_list():
     """
-    Method which gets list of hot desks
+    Method which gets list of hot desks that have not been requested
     Returns: list
     """
-    return cache.get('slack_hot_desk_list')
+    hot_desk_list = get_snapshot_value('hot_desk_list')
+    if hot_desk_list is None:
+        return None
+    return get_non_requested_hotdesks(hot_desk_list)
 
 
 def get_slack_hot_desk_users_list():
@@ -40,14 +51,23 @@ def get_slack_hot_desk_users_list():
     Method which gets list of hot desk eligible users
     Returns: list
     """
-    return cache.get('hot_desk_users_list')
+    return get_snapshot_value('hot_desk_users_list')
 
 
 def get_slack_floors():
     """Method which gets all floors
     Returns: list
     """
-    return cache.get('floors')
+    return get_snapshot_value('floors')
+
+
+def get_permanent_seat(name):
+    """Method which gets the permanent seat of a user
+    Args:
+        name (str): the name of the user on the sheet e.g Firstname Lastname
+    Returns: str
+    """
+    return (get_snapshot_value('seat_locations') or {}).get(name)
 
 
 class SlackHelper:
@@ -1,22 +1,18 @@
 # Third party
 from flask_restplus import Resource
 from flask import request
-from datetime import datetime as dt
 
 # Local imports
 from bot.utilities.helpers.bot_helpers import store_centers
 from main import activo_bot, cache, dramatiq
-from api.models import HotDeskRequest
 
 # Utilities
 from api.utilities.helpers.env_resource_adapter import adapt_resource_to_env
-
-from api.utilities.helpers.calendar import get_start_or_end_of_day
 from ..attachments.buttons.common.centers import add_cancel_button
-from ..attachments.buttons.common.menu import get_floors_list
-from ..utilities.slack.slack_helper import SlackHelper
+from ..utilities.slack.slack_helper import SlackHelper, get_permanent_seat
 from ..utilities.constants import ACTIVO_BOT_ICON, TIMEOUT, HELP_MESSAGE, INVALID_COMMAND
-from ..utilities.google_sheets.google_sheets_helper import GoogleSheetHelper
+from ..utilities.hot_desk_snapshot import (get_hot_desk_snapshot, is_stale,
+                                          refresh_hot_desk_snapshot)
 from ..utilities.user_hot_desk import get_pending_or_approved_hot_desk
 from ..utilities.constants import HOT_DESK_MSG
 from ..attachments.buttons.common.yes_or_no import yes_or_no_button
@@ -32,88 +28,19 @@ from api.schemas.center import CenterSchema
 slack_helper = SlackHelper()
 
 
-def google_sheet_data():
-    """
-    get all hotdesks from google sheet
-
-    Returns:
-        list: list of all hotdesks
-    """
-    google_sheets_helper = GoogleSheetHelper()
-    hot_desk_list = google_sheets_helper.retrieve_all_hot_desk()
-    return hot_desk_list
-
-
-def get_non_requested_hotdesks(hot_desk_list):
-    """
-    get the hotdesks that have not been requested
-
-    Args:
-        hot_desk_list (list): list of all the hotdesk
-
-    Returns:
-        list: list of hotdesks that have not been requested
-    """
-    today = dt.today()
-    start_date = get_start_or_end_of_day(today, end=False)
-    end_date = get_start_or_end_of_day(today, end=True)
-
-    pending_seats_today = HotDeskRequest.query.\
-        filter(HotDeskRequest.created_at.between(
-            start_date, end_date)).filter_by(status='pending')
-
-    pending_hot_desk_refs = [
-        each.hot_desk_ref_no for each in pending_seats_today
-    ]
-
-    hot_desk_list_ = []
-    for each in hot_desk_list:
-        pp = next(iter(each.items()))
-        hot_desk_list_ = pp[1]
-        key = pp[0]
-        hot_desk_list_ = [x.strip(' ') for x in hot_desk_list_]
-        non_requested_desks = [
-            obj for obj in hot_desk_list_ if obj not in pending_hot_desk_refs
-        ]
-        each[key] = non_requested_desks
-    return hot_desk_list
-
-
 @dramatiq.actor
 def initialize_bot(refresh=True):
-    """Caches hot desk data from google sheet"""
-    cache_hot_desk_list = cache.get('slack_hot_desk_list')
-    cache_floors = cache.get('floors')
-    requester_name = cache.get('name')
-
-    if not cache_floors or not cache_hot_desk_list or refresh:
-        hot_desk_floors, hot_desk_list, floors = get_floors_list(
-            google_sheet_data())
-
-        hot_desk_list = get_non_requested_hotdesks(hot_desk_list)
+    """Refreshes the hot desk snapshot read by the bot in the background
 
-        hot_desk_floors_with_cancel = hot_desk_floors[:]
-
-        google_sheets_helper = GoogleSheetHelper()
-        seat_location = google_sheets_helper.get_requester_seat_location(
-            requester_name)
-        hot_desk_users_list = google_sheets_helper.retrieve_all_hotdesk_eligible_users()
-        cache.set('hot_desk_users_list', hot_desk_users_list, timeout=50)
-        cache.set('permanent_seat', seat_location, timeout=50)
-        cache.set('slack_hot_desk_floors', hot_desk_floors, timeout=50)
-        cache.set(
-            'slack_hot_desk_floors_with_cancel',
-            hot_desk_floors_with_cancel,
-            timeout=50)
-        cache.set('slack_hot_desk_list', hot_desk_list, timeout=50)
-        cache.set('floors', floors, timeout=50)
-        return dict(message='Init Bot: fetched data from spreadsheet')
-
-    hot_desk_list = get_non_requested_hotdesks(cache_hot_desk_list)
-    cache.set('slack_hot_desk_list', hot_desk_list, timeout=50)
+    Args:
+        refresh (bool): whether to refresh a snapshot that is not stale yet
+    """
+    if not refresh and not is_stale(get_hot_desk_snapshot()):
+        return dict(
+            message='Init Bot: maintaining current persisted spreadsheet data')
 
-    return dict(
-        message='Init Bot: maintaining current persisted spreadsheet data')
+    refresh_hot_desk_snapshot()
+    return dict(message='Init Bot: fetched data from spreadsheet')
 
 
 @activo_bot.route('')
@@ -131,7 +58,7 @@ class SlackBotResource(Resource):
         text = request.form.get('text', '')
         username = request.form.get('user_name', '')
         name = (" ".join(username.split("."))).title()
-        cache.set('name', name, timeout=50)
+        cache.set('permanent_seat', get_permanent_seat(name), timeout=50)
         user_id = request.form.get('user_id')
         channel_id = request.form.get('channel_id')
         decision = decision_mapper.get(text)
@@ -23,8 +23,24 @@ celery_scheduler.conf.beat_schedule = {
         'task': 'schedule_due_date_notifier',
         'schedule': crontab(hour=8, minute=0)
     },
+    'run-extend-work-order-schedules-every-day': {
+        'task': 'extend_work_order_schedules',
+        'schedule': crontab(hour=0, minute=30)
+    },
     'run-reset-hotdesk-spreadsheet-every-day': {
         'task': 'reset_hot_desk_spreadsheet',
         'schedule': crontab(day_of_week='1,2,3,4,5,6', hour=0, minute=0),
     },
+    'run-refresh-hot-desk-snapshot-every-5-minutes': {
+        'task': 'refresh_hot_desk_snapshot',
+        'schedule': crontab(minute='*/5')
+    },
+    'run-rebuild-asset-category-stats-every-day': {
+        'task': 'rebuild_asset_category_stats',
+        'schedule': crontab(hour=1, minute=0)
+    },
+    'run-purge-expired-exports-every-hour': {
+        'task': 'purge_expired_exports',
+        'schedule': crontab(minute=15)
+    },
 }
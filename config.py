@@ -41,6 +41,14 @@ class Config(object):
     SQLALCHEMY_DATABASE_URI = getenv(
         'DATABASE_URI', default='postgresql://localhost/activo')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # execute the raw sql queries as prepared statements, turn off behind a
+    # transaction pooler that does not keep the database session
+    PREPARE_SQL_QUERIES = getenv('PREPARE_SQL_QUERIES',
+                                 default='true').lower() == 'true'
+    # return the latency and sql metrics of a request in a response header
+    # when the request asks for them
+    METRICS_DEBUG_HEADER_ENABLED = getenv('METRICS_DEBUG_HEADER_ENABLED',
+                                          default='true').lower() == 'true'
     DEBUG = False
     TESTING = False
     MAIL_SERVER = 'smtp.gmail.com'
@@ -97,6 +105,9 @@ class Config(object):
     DOMAIN = getenv('DOMAIN', 'activo.andela.com')
     SLACK_USER_TOKEN = getenv('SLACK_USER_TOKEN', '')
     SLACK_TEST_URL = getenv('SLACK_TEST_URL', '')
+    # Directory where the files of export jobs are written
+    EXPORT_ARTIFACT_DIR = getenv('EXPORT_ARTIFACT_DIR',
+                                 default='/tmp/activo-exports')
 
 class ProductionConfig(Config):
     """App production configuration."""
@@ -110,6 +121,8 @@ class ProductionConfig(Config):
     HOT_DESK_ASSIGNEE2 = getenv('HOT_DESK_ASSIGNEE2_PROD')
     HOT_DESK_ASSIGNEE3 = getenv('HOT_DESK_ASSIGNEE3_PROD')
     BOT_COUNTDOWN = getenv('BOT_COUNTDOWN_PROD', 600000)
+    METRICS_DEBUG_HEADER_ENABLED = getenv('METRICS_DEBUG_HEADER_ENABLED',
+                                          default='false').lower() == 'true'
     LAGOS_OPS_TEAM = getenv('LAGOS_OPS_TEAM_PROD')
     GOOGLE_CREDENTIALS = getenv('GOOGLE_CREDENTIALS_PROD', '')
 
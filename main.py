@@ -45,7 +45,8 @@ TASK_LIST = [
     'api.tasks.notifications.comment', 'api.tasks.notifications.work_orders',
     'api.tasks.notifications.hot_desk',
     'api.tasks.cloudinary.delete_cloudinary_image', 'bot.views.slack_bot',
-    'api.tasks.notifications.schedule', 'api.tasks.notifications.asset_bulk'
+    'api.tasks.notifications.schedule', 'api.tasks.notifications.asset_bulk',
+    'api.tasks.export'
 ]
 celery_app = Celery(__name__, broker=AppConfig.REDIS_URL, include=TASK_LIST)
 
@@ -109,6 +110,10 @@ def create_app(config=AppConfig):
     # bind app to db
     db.init_app(app)
 
+    # record the latency and sql metrics of each endpoint
+    from api.utilities.helpers.instrumentation import init_instrumentation
+    init_instrumentation(app)
+
     # Configuration for sqlalchemy searchable
     sqlalchemy.orm.configure_mappers()
 
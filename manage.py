@@ -1,12 +1,13 @@
 """Module with application entry point."""
 
 # Third party Imports
+import json
 import sys
 from os import environ
 
 import click
 import bugsnag
-from flask import jsonify, render_template, g
+from flask import Response, jsonify, render_template, g
 from redis.exceptions import ConnectionError
 from flask_mail import Mail
 from bugsnag.flask import handle_exceptions
@@ -17,6 +18,7 @@ from flask_sse import sse
 from api.middlewares.token_required import token_required
 from api.utilities.seed_choices import SEED_OPTIONS
 from api.utilities.helpers.celery import celery_task_state
+from api.utilities.helpers.instrumentation import metrics_registry
 from main import create_app
 from config import config, AppConfig
 from seeders import seed_db
@@ -55,6 +57,15 @@ def health_check():
     return jsonify(dict(message='Healthy App Server')), 200
 
 
+@app.route('/metrics')
+def metrics():
+    """Exposes the latency and sql metrics of each endpoint in the
+    Prometheus text format"""
+    return Response(
+        metrics_registry.render(),
+        content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @app.route('/activo-bot/health')
 def bot_health_check():
     """Checks health of third party applications utilized by the activo bot
@@ -148,6 +159,63 @@ def truncate(table_name=None):
     db.engine.execute(text(f'TRUNCATE {tables} CASCADE'))
 
 
+@app.cli.command()
+@click.option(
+    '--size',
+    default='10k',
+    help='The count of assets of the dataset.',
+    type=click.Choice(['10k', '100k', '1m']))
+@click.option('--runs', default=20, help='Measured requests per endpoint.')
+@click.option(
+    '--baseline',
+    default='benchmarks/baseline.json',
+    help='The baseline the results are compared with.')
+@click.option(
+    '--save', is_flag=True, help='Save the results as the baseline.')
+@click.option(
+    '--reuse-dataset',
+    is_flag=True,
+    help='Benchmark the dataset already in the database.')
+def benchmark(size, runs, baseline, save, reuse_dataset):
+    """
+    Benchmarks the hot endpoints against a synthetic dataset
+    Args:
+        size (string): The size of the dataset
+        runs (int): The count of measured requests per endpoint
+        baseline (string): The path of the baseline
+        save (bool): Whether to save the results as the baseline
+        reuse_dataset (bool): Whether to reuse the loaded dataset
+    """
+    if AppConfig.FLASK_ENV != 'testing':
+        raise click.UsageError(
+            'The benchmarks recreate the tables, run them with '
+            'FLASK_ENV=testing against the test database')
+
+    from benchmarks.datasets import describe_dataset, load_dataset
+    from benchmarks.harness import (compare, load_baseline, run_benchmarks,
+                                    save_baseline)
+    from benchmarks.scenarios import SCENARIOS
+
+    app.config['METRICS_DEBUG_HEADER_ENABLED'] = True
+    dataset = describe_dataset(size) if reuse_dataset else load_dataset(size)
+    results = run_benchmarks(app.test_client(), SCENARIOS, dataset, runs)
+    click.echo(json.dumps(results, indent=2, sort_keys=True))
+
+    if save:
+        try:
+            save_baseline(baseline, results)
+        except ValueError as error:
+            raise click.ClickException(str(error))
+        return
+
+    saved = load_baseline(baseline)
+    regressions = compare(results, saved) if saved else []
+    for regression in regressions:
+        click.echo(f'REGRESSION {regression}', err=True)
+    if regressions:
+        sys.exit(1)
+
+
 @app.route('/celery/health')
 def celery_stats():
     """Checks tasks queued by celery.
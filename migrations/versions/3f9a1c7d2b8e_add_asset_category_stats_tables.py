@@ -0,0 +1,72 @@
+"""add_asset_category_stats_tables
+
+Revision ID: 3f9a1c7d2b8e
+Revises: 6c0824c490e8
+Create Date: 2019-09-12 10:14:32.481205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a1c7d2b8e'
+down_revision = '6c0824c490e8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'asset_category_stats',
+        sa.Column('asset_category_id', sa.String(), nullable=False),
+        sa.Column('center_id', sa.String(), nullable=False),
+        sa.Column('status', sa.String(length=60), nullable=False),
+        sa.Column('assignee_type', sa.String(length=60), nullable=False),
+        sa.Column('assets_count', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['asset_category_id'],
+                                ['asset_categories.id'],
+                                ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('asset_category_id', 'center_id', 'status',
+                                'assignee_type'))
+    op.create_table(
+        'asset_category_last_stock',
+        sa.Column('stock_count_id', sa.String(length=36), nullable=False),
+        sa.Column('asset_category_id', sa.String(), nullable=False),
+        sa.Column('center_id', sa.String(), nullable=False),
+        sa.Column('last_stock_count', sa.Integer(), nullable=False),
+        sa.Column('stock_date', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['asset_category_id'],
+                                ['asset_categories.id'],
+                                ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['stock_count_id'], ['stock_counts.id'],
+                                ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('stock_count_id'))
+    op.create_index(
+        op.f('ix_asset_category_last_stock_asset_category_id'),
+        'asset_category_last_stock', ['asset_category_id'],
+        unique=False)
+
+    # backfill the stats of the existing assets and stock counts
+    op.execute('''
+    INSERT INTO asset_category_stats (asset_category_id, center_id, status, assignee_type, assets_count)
+    SELECT asset.asset_category_id, COALESCE(asset.center_id, ''), asset.status, asset.assignee_type::text, count(asset.id)
+    FROM asset WHERE asset.deleted = false
+    GROUP BY asset.asset_category_id, COALESCE(asset.center_id, ''), asset.status, asset.assignee_type
+    ''')
+    op.execute('''
+    INSERT INTO asset_category_last_stock (stock_count_id, asset_category_id, center_id, last_stock_count, stock_date)
+    SELECT stock_counts.id, stock_counts.asset_category_id, stock_counts.center_id, stock_counts.count, stock_counts.created_at
+    FROM stock_counts JOIN (SELECT max(stock_counts.created_at) AS stock_date, stock_counts.asset_category_id
+    FROM stock_counts WHERE stock_counts.deleted = false GROUP BY stock_counts.asset_category_id) AS last_stock
+    ON stock_counts.asset_category_id = last_stock.asset_category_id AND stock_counts.created_at = last_stock.stock_date
+    WHERE stock_counts.deleted = false
+    ''')
+
+
+def downgrade():
+    op.drop_index(
+        op.f('ix_asset_category_last_stock_asset_category_id'),
+        table_name='asset_category_last_stock')
+    op.drop_table('asset_category_last_stock')
+    op.drop_table('asset_category_stats')
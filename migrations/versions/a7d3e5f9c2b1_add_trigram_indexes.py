@@ -0,0 +1,38 @@
+"""add_trigram_indexes
+
+Revision ID: a7d3e5f9c2b1
+Revises: 3f9a1c7d2b8e
+Create Date: 2019-09-16 09:42:18.305117
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3e5f9c2b1'
+down_revision = '3f9a1c7d2b8e'
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = [
+    ('ix_asset_tag_trgm', 'asset', 'tag'),
+    ('ix_users_name_trgm', 'users', 'name'),
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_spaces_name_trgm', 'spaces', 'name'),
+]
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table, [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade():
+    for name, table, _ in TRIGRAM_INDEXES:
+        op.drop_index(name, table_name=table)
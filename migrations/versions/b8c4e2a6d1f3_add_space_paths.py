@@ -0,0 +1,44 @@
+"""add_space_paths
+
+Revision ID: b8c4e2a6d1f3
+Revises: a7d3e5f9c2b1
+Create Date: 2019-09-18 11:05:43.612097
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8c4e2a6d1f3'
+down_revision = 'a7d3e5f9c2b1'
+branch_labels = None
+depends_on = None
+
+# builds the path of every space from the root spaces down
+BACKFILL_SPACE_PATHS = '''
+WITH RECURSIVE tree AS (
+SELECT id, '/' || id || '/' AS path FROM spaces WHERE parent_id IS NULL
+UNION ALL
+SELECT spaces.id, tree.path || spaces.id || '/'
+FROM spaces JOIN tree ON spaces.parent_id = tree.id)
+UPDATE spaces SET path = tree.path FROM tree WHERE spaces.id = tree.id
+'''
+
+
+def upgrade():
+    op.add_column('spaces', sa.Column('path', sa.Text(), nullable=True))
+    op.execute(BACKFILL_SPACE_PATHS)
+    op.create_index(
+        'ix_spaces_path',
+        'spaces', ['path'],
+        unique=False,
+        postgresql_ops={'path': 'text_pattern_ops'})
+    op.create_index(
+        op.f('ix_asset_assignee_id'), 'asset', ['assignee_id'], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f('ix_asset_assignee_id'), table_name='asset')
+    op.drop_index('ix_spaces_path', table_name='spaces')
+    op.drop_column('spaces', 'path')
@@ -0,0 +1,26 @@
+"""add_requests_status_completed_at_index
+
+Revision ID: c5f1a8e3b7d2
+Revises: b8c4e2a6d1f3
+Create Date: 2019-09-19 08:27:51.904316
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5f1a8e3b7d2'
+down_revision = 'b8c4e2a6d1f3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_requests_status_completed_at',
+        'requests', ['status', 'completed_at'],
+        unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_requests_status_completed_at', table_name='requests')
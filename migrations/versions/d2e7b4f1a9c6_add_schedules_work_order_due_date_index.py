@@ -0,0 +1,27 @@
+"""add_schedules_work_order_id_due_date_index
+
+Revision ID: d2e7b4f1a9c6
+Revises: c5f1a8e3b7d2
+Create Date: 2019-09-23 10:14:37.218546
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2e7b4f1a9c6'
+down_revision = 'c5f1a8e3b7d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_schedules_work_order_id_due_date',
+        'schedules', ['work_order_id', 'due_date'],
+        unique=False)
+
+
+def downgrade():
+    op.drop_index(
+        'ix_schedules_work_order_id_due_date', table_name='schedules')
@@ -0,0 +1,130 @@
+"""Module for the benchmark harness tests"""
+
+# Third party
+import pytest
+
+# Models
+from api.models import AssetCategory
+
+# Benchmarks
+from benchmarks.harness import (auth_header, compare, parse_debug_header,
+                                percentile, run_scenario, save_baseline)
+from benchmarks.scenarios import SCENARIOS
+
+
+def result(p90_ms=10.0, sql_statements=3, peak_memory_kb=100.0,
+           statuses=(200, )):
+    """Builds the results of a run with one scenario"""
+    return {
+        'dataset': {
+            'assets': 10000
+        },
+        'scenarios': {
+            'asset_list': {
+                'statuses': list(statuses),
+                'p90_ms': p90_ms,
+                'sql_statements': sql_statements,
+                'peak_memory_kb': peak_memory_kb
+            }
+        }
+    }
+
+
+class TestBenchmarkHarness:
+    """Tests for measuring and comparing benchmark runs"""
+
+    def test_percentile_uses_the_nearest_rank(self):
+        """Should return the measured value at the percentile"""
+
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 90) == 90
+        assert percentile(values, 99) == 99
+        assert percentile([7], 99) == 7
+
+    def test_parse_debug_header(self):
+        """Should parse the numbers of the debug header"""
+
+        numbers = parse_debug_header(
+            'latency=0.012000; sql-statements=3; sql-time=0.004000')
+
+        assert numbers == {
+            'latency': 0.012,
+            'sql-statements': 3,
+            'sql-time': 0.004
+        }
+        assert parse_debug_header(None) == {}
+
+    def test_compare_within_tolerance_passes(self):
+        """Should not report small changes as regressions"""
+
+        assert compare(result(p90_ms=11.0, peak_memory_kb=110.0),
+                       result()) == []
+
+    def test_compare_reports_regressions(self):
+        """Should report slower, chattier and bigger scenarios"""
+
+        regressions = compare(
+            result(p90_ms=40.0, sql_statements=4, peak_memory_kb=200.0),
+            result())
+
+        assert len(regressions) == 3
+        assert all(
+            regression.startswith('asset_list') for regression in regressions)
+
+    def test_compare_rejects_a_different_dataset(self):
+        """Should not compare runs made on different datasets"""
+
+        baseline = result()
+        baseline['dataset'] = {'assets': 100000}
+
+        assert len(compare(result(), baseline)) == 1
+
+    def test_compare_reports_failed_statuses(self):
+        """Should report the scenarios answered with an error"""
+
+        regressions = compare(result(statuses=(200, 500)),
+                              result(statuses=(200, 500)))
+
+        assert regressions == [
+            'asset_list: responded with statuses [500]'
+        ]
+
+    def test_compare_reports_changed_statuses(self):
+        """Should report statuses other than the baseline's"""
+
+        regressions = compare(result(statuses=(201, )), result())
+
+        assert regressions == ['asset_list: statuses [201], baseline [200]']
+
+    def test_save_baseline_with_failed_statuses_fails(self, tmpdir):
+        """Should refuse to save the results of failed requests"""
+
+        path = str(tmpdir.join('baseline.json'))
+
+        with pytest.raises(ValueError):
+            save_baseline(path, result(statuses=(404, )))
+
+        assert not tmpdir.join('baseline.json').exists()
+
+    def test_run_scenario_bulk_upload_succeeds(self, init_db, client,
+                                               new_user):
+        """Should measure the bulk upload as the benchmark user"""
+
+        new_user.save()
+        asset_category = AssetCategory(name='Benchmarked').save()
+        dataset = {
+            'token_id': new_user.token_id,
+            'category_id': asset_category.id
+        }
+        scenario = next(
+            scenario for scenario in SCENARIOS
+            if scenario.name == 'bulk_upload')
+
+        result = run_scenario(
+            client, scenario, dataset, auth_header(new_user.token_id),
+            runs=1, warmup=0)
+
+        assert result['statuses'] == [201]
+        assert result['runs'] == 1
@@ -0,0 +1,53 @@
+"""Module to test the snapshot of the hot desks read by the bot"""
+
+# Utilities
+from bot.utilities.hot_desk_snapshot import (get_non_requested_hotdesks,
+                                             get_pending_hot_desk_refs,
+                                             get_seat_locations,
+                                             pending_hot_desks)
+
+
+class TestHotDeskSnapshot:
+    """Tests for building and reading the hot desk snapshot"""
+
+    def test_get_seat_locations_uses_the_bay_above_each_seat(self):
+        """Should locate each seat in the closest room or bay above it"""
+
+        sheet_data = [{
+            'Room/Bay': '1N',
+            'Name': '',
+            '# of seats': ''
+        }, {
+            'Room/Bay': '',
+            'Name': 'Ada Obi',
+            '# of seats': 15
+        }, {
+            'Room/Bay': '2S',
+            'Name': 'Hot desk',
+            '# of seats': 3
+        }, {
+            'Room/Bay': '',
+            'Name': 'Kofi Mensah',
+            '# of seats': 4
+        }]
+
+        seat_locations = get_seat_locations(sheet_data)
+
+        assert seat_locations['Ada Obi'] == '1N 15'
+        assert seat_locations['Kofi Mensah'] == '2S 4'
+
+    def test_get_non_requested_hotdesks_leaves_out_pending_requests(
+            self, init_db, new_hot_desk_request):
+        """Should leave out the hot desks requested today"""
+
+        new_hot_desk_request.save()
+        pending_hot_desks.clear()
+        hot_desk_list = [{'1st': ['1G 65 ', '1G 66']}, {'5th': ['5G 1']}]
+
+        assert get_non_requested_hotdesks(hot_desk_list) == [{
+            '1st': ['1G 66']
+        }, {
+            '5th': ['5G 1']
+        }]
+        assert hot_desk_list[0]['1st'] == ['1G 65 ', '1G 66']
+        assert get_pending_hot_desk_refs() == {'1G 65'}
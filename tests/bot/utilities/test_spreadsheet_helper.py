@@ -0,0 +1,60 @@
+"""Module to test the batched updates of the hot desk sheet"""
+
+# Helpers
+from bot.utilities.helpers.spreadsheet_helper import SheetSync, update_
+
+# Mocks
+from tests.mocks.google_sheet import FakeWorksheet
+
+
+def make_sheet():
+    """Builds a sheet of seats on two floors"""
+    seats = [('1st', 1, 'Hot Desk'), ('1st', 2, 'Ada Lovelace'),
+             ('10th', 1, 'Hot Desk'), ('', '', '')]
+    return FakeWorksheet([{
+        'S/N': index,
+        'Room/Bay': '1G',
+        'Floor': floor,
+        '# of seats': seat_no,
+        'Name': name
+    } for index, (floor, seat_no, name) in enumerate(seats)])
+
+
+class TestSheetSync:
+    """Tests for staging and applying the updates of the hot desks"""
+
+    def test_apply_writes_all_changes_in_one_call(self):
+        """Should update the seats of many hot desks in one api call"""
+
+        sheet = make_sheet()
+        sheet_sync = SheetSync(sheet.get_all_records(), sheet)
+        sheet_sync.stage('1st 1', 'Grace Hopper')
+        sheet_sync.stage('1st 2', 'Hot Desk')
+        sheet_sync.stage('10th 1', 'Alan Turing')
+        calls = sheet.api_calls
+
+        assert sheet_sync.apply() == 3
+        assert sheet.api_calls == calls + 1
+        assert [sheet.cell_value(row, 5) for row in range(2, 5)] == [
+            'Grace Hopper', 'Hot Desk', 'Alan Turing'
+        ]
+
+    def test_unchanged_seats_are_not_written(self):
+        """Should not call the api when no seat changes"""
+
+        sheet = make_sheet()
+        sheet_sync = SheetSync(sheet.get_all_records(), sheet)
+        sheet_sync.stage('1st 1', 'Hot Desk')
+        sheet_sync.stage('5th 9', 'Grace Hopper')
+        calls = sheet.api_calls
+
+        assert sheet_sync.apply() == 0
+        assert sheet.api_calls == calls
+
+    def test_update_updates_a_hot_desk(self):
+        """Should update the seat of a hot desk"""
+
+        sheet = make_sheet()
+        update_(sheet.get_all_records(), sheet, '1st 2', 'Hot Desk')
+
+        assert sheet.cell_value(3, 5) == 'Hot Desk'
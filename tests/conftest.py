@@ -38,7 +38,8 @@ pytest_plugins = [
     "tests.fixtures.assets", "tests.fixtures.permissions",
     "tests.fixtures.asset_repair", "tests.fixtures.authorization",
     "tests.fixtures.hot_desk", "tests.fixtures.slack",
-    "tests.fixtures.sendgrid", "tests.fixtures.hot_desk_response",
+    "tests.fixtures.sendgrid", "tests.fixtures.emails",
+    "tests.fixtures.hot_desk_response",
     "tests.fixtures.asset_supporting_document",
     "tests.fixtures.asset_note", "tests.fixtures.asset_insurance",
     "tests.fixtures.asset_warranty",
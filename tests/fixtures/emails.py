@@ -0,0 +1,33 @@
+"""Module with email fixtures """
+
+# System libraries
+from unittest.mock import patch
+
+# Third Party Modules
+import pytest
+
+# Mocks
+from tests.mocks.email import LocalSMTPServer
+
+
+@pytest.fixture(scope='function')
+def local_smtp_server(app):
+    """Fixture for sending the Flask-Mail emails to a local SMTP server
+    Args:
+        app (obj): Instance of Flask test app
+
+    Return:
+        LocalSMTPServer: the running server
+    """
+    with LocalSMTPServer() as server:
+        with patch.dict(
+                app.config, {
+                    'MAIL_SERVER': 'localhost',
+                    'MAIL_PORT': server.port,
+                    'MAIL_USE_TLS': False,
+                    'MAIL_USE_SSL': False,
+                    'MAIL_USERNAME': None,
+                    'MAIL_PASSWORD': None,
+                    'MAIL_SUPPRESS_SEND': False
+                }):
+            yield server
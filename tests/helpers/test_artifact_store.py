@@ -0,0 +1,59 @@
+"""Module for the export artifact store tests"""
+
+# Standard library
+import gzip
+import os
+
+# Third Party Libraries
+import pytest
+
+from api.utilities.helpers.artifact_store import ArtifactStore
+
+
+class TestArtifactStore:
+    """Class to hold test methods for the ArtifactStore class"""
+
+    def test_write_csv_compresses_chunks(self, tmpdir):
+        """Should write all the chunks to a gzip compressed csv file"""
+
+        store = ArtifactStore(root=str(tmpdir))
+        progress = []
+        chunks = [[{'tag': 'AND/1'}], [{'tag': 'AND/2', 'color': 'red'}]]
+
+        path = store.write(
+            'job', 'csv', chunks, ['color', 'tag'], on_chunk=progress.append)
+
+        with gzip.open(path, 'rt') as csv_file:
+            assert csv_file.read() == 'color,tag\n,AND/1\nred,AND/2\n'
+        assert progress == [1, 2]
+        assert store.get('job', 'csv') == path
+
+    def test_write_xlsx(self, tmpdir):
+        """Should write the chunks to a xlsx file"""
+
+        store = ArtifactStore(root=str(tmpdir))
+
+        path = store.write('job', 'xlsx', [[{'tag': 'AND/1', 'count': 2}]],
+                           ['count', 'tag'])
+
+        assert path.endswith('job.xlsx')
+        assert os.path.getsize(path) > 0
+
+    def test_write_xlsx_with_keys_missing_from_headers_fails(self, tmpdir):
+        """Should not drop the values of columns missing from the headers"""
+
+        store = ArtifactStore(root=str(tmpdir))
+
+        with pytest.raises(ValueError):
+            store.write('job', 'xlsx', [[{'tag': 'AND/1', 'count': 2}]],
+                        ['tag'])
+
+    def test_purge_expired_removes_old_files(self, tmpdir):
+        """Should remove the files older than the expiry of the store"""
+
+        store = ArtifactStore(root=str(tmpdir), expiry=-1)
+        store.write('job', 'csv', [[{'tag': 'AND/1'}]], ['tag'])
+
+        assert store.get('job', 'csv') is None
+        assert store.purge_expired() == 1
+        assert os.listdir(str(tmpdir)) == []
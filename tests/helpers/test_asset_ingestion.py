@@ -0,0 +1,72 @@
+"""Module for the bulk asset ingestion tests"""
+
+# Models
+from api.models import Asset, AssetCategory, History
+
+# Helpers
+from api.utilities.helpers.asset_ingestion import ingest_assets
+from api.utilities.messages.error_messages import serialization_errors
+
+
+class TestAssetIngestion:
+    """Tests for inserting assets with set based SQL"""
+
+    def test_ingest_assets_inserts_valid_assets(self, init_db, new_user,
+                                                new_center, new_space):
+        """Should insert the assets in order and skip the invalid ones"""
+
+        new_user.save()
+        new_space.save()
+        asset_category = AssetCategory(name='Ingested').save()
+        asset = {
+            'asset_category_id': asset_category.id,
+            'center_id': new_center.id,
+            'assignee_id': new_space.id,
+            'assignee_type': 'space',
+            'status': 'OK',
+            'custom_attributes': {'color': 'red'}
+        }
+        assets = [
+            {**asset, 'tag': 'AND/ING/001'},
+            {**asset, 'tag': 'AND/ING/002', 'assignee_id': '-Id'},
+            {**asset, 'tag': 'AND/ING/001', 'custom_attributes': {}},
+            {**asset, 'tag': 'AND/ING/003'},
+        ]
+
+        asset_ids, skipped = ingest_assets(
+            assets, actor_id=new_user.token_id, assigned_by=new_user.name)
+
+        ingested = [Asset.get(asset_id) for asset_id in asset_ids]
+        assert [asset.tag for asset in ingested] == [
+            'AND/ING/001', 'AND/ING/003'
+        ]
+        assert ingested[0].status == 'ok'
+        assert ingested[0].assigned_by == new_user.name
+        assert ingested[0].custom_attributes == {'color': 'red'}
+        assert [errors for _, errors in skipped] == [{
+            'assigneeId': [serialization_errors['assignee_not_found']]
+        }, {
+            'tag': [serialization_errors['exists'].format('Tag')]
+        }]
+        assert History.query.filter(
+            History.resource_id.in_(asset_ids)).count() == 2
+
+    def test_ingest_assets_keeps_empty_strings(self, init_db, new_center,
+                                               new_space):
+        """Should insert empty strings as they are rather than as NULLs"""
+
+        new_space.save()
+        asset_category = AssetCategory(name='Ingested empty').save()
+
+        asset_ids, _ = ingest_assets([{
+            'tag': 'AND/ING/004',
+            'asset_category_id': asset_category.id,
+            'center_id': new_center.id,
+            'assignee_id': new_space.id,
+            'assignee_type': 'space',
+            'assigned_by': ''
+        }])
+
+        ingested = Asset.get(asset_ids[0])
+        assert ingested.assigned_by == ''
+        assert ingested.custom_attributes is None
@@ -0,0 +1,68 @@
+"""Module for streaming csv export helpers tests"""
+
+# Third Party Libraries
+import pytest
+
+from api.utilities.helpers.csv_export import check_headers, csv_rows
+
+
+class TestCsvRows:
+    """Class to hold test methods for the csv_rows function"""
+
+    def test_csv_rows_writes_header_once(self):
+        """Should write the header with the first chunk only"""
+
+        chunks = [[{
+            'name': 'Ada',
+            'email': 'ada@example.com'
+        }], [{
+            'name': 'Bob',
+            'email': 'bob@example.com'
+        }]]
+
+        assert list(csv_rows(chunks, ['email', 'name'])) == [
+            'email,name\r\nada@example.com,Ada\r\n', 'bob@example.com,Bob\r\n'
+        ]
+
+    def test_csv_rows_fills_missing_columns(self):
+        """Should leave the missing values of the headers empty"""
+
+        chunks = [[{'tag': 'AND/1'}], [{'tag': 'AND/2', 'color': 'red'}]]
+
+        assert ''.join(csv_rows(chunks, ['color', 'tag'])) == \
+            'color,tag\r\n,AND/1\r\nred,AND/2\r\n'
+
+    def test_csv_rows_leaves_out_keys_missing_from_headers(self):
+        """Should not fail a started export on the keys of a later record"""
+
+        chunks = [[{'tag': 'AND/1'}], [{'tag': 'AND/2', 'color': 'red'}]]
+
+        assert ''.join(csv_rows(chunks, ['tag'])) == \
+            'tag\r\nAND/1\r\nAND/2\r\n'
+
+    def test_csv_rows_without_records(self):
+        """Should write nothing when there are no records"""
+
+        assert list(csv_rows(iter([]), ['tag'])) == []
+        assert list(csv_rows([[]], ['tag'])) == []
+
+
+class TestCheckHeaders:
+    """Class to hold test methods for the check_headers function"""
+
+    def test_check_headers_with_keys_missing_from_headers_fails(self):
+        """Should fail before writing when the first record has other keys"""
+
+        chunks = iter([[], [{'tag': 'AND/1', 'color': 'red'}]])
+
+        with pytest.raises(ValueError):
+            check_headers(chunks, ['tag'])
+
+    def test_check_headers_keeps_every_chunk(self):
+        """Should give back the chunk it read along with the others"""
+
+        chunks = iter([[{'tag': 'AND/1'}], [{'tag': 'AND/2'}]])
+
+        assert list(check_headers(chunks, ['tag'])) == \
+            [[{'tag': 'AND/1'}], [{'tag': 'AND/2'}]]
+        assert list(check_headers(iter([]), ['tag'])) == []
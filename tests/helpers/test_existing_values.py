@@ -0,0 +1,26 @@
+"""Module for the existing values lookup tests"""
+
+# Models
+from api.models import Center
+
+# Helpers
+from api.utilities.helpers.existing_values import get_existing_values
+
+
+class TestExistingValues:
+    """Tests for looking up many values in a column at once"""
+
+    def test_get_existing_values_returns_matches(self, init_db, new_center):
+        """Should return only the values found in the column"""
+
+        new_center.save()
+
+        existing = get_existing_values(Center.name,
+                                       [new_center.name, 'Atlantis', None])
+
+        assert existing == {new_center.name}
+
+    def test_get_existing_values_without_values(self, init_db):
+        """Should not query when there are no values to look up"""
+
+        assert get_existing_values(Center.name, []) == set()
@@ -0,0 +1,48 @@
+"""Module to test the identity of the current request"""
+from flask import request
+
+from api.utilities.helpers.identity import (get_identity, current_identity,
+                                            clear_identity)
+
+
+class TestIdentity(object):
+    """Class to test the request identity helpers"""
+
+    def test_get_identity_returns_user_identity_succeeds(
+            self, init_db, new_user_three, request_ctx,
+            mock_request_three_obj_decoded_token):
+        """Test get_identity builds the identity of the current user"""
+        new_user_three.save()
+        identity = get_identity()
+
+        assert identity.token_id == new_user_three.token_id
+        assert identity.center_id == new_user_three.center_id
+        assert identity.role_id == new_user_three.role_id
+        assert identity.is_super_user is True
+
+    def test_get_identity_is_memoized_per_request_succeeds(
+            self, init_db, new_user_three, request_ctx,
+            mock_request_three_obj_decoded_token):
+        """Test get_identity returns the same identity within a request"""
+        new_user_three.save()
+
+        assert get_identity() is get_identity()
+
+    def test_clear_identity_drops_memoized_identity_succeeds(
+            self, init_db, new_user_three, request_ctx,
+            mock_request_three_obj_decoded_token):
+        """Test clear_identity makes the next call rebuild the identity"""
+        new_user_three.save()
+        identity = get_identity()
+        clear_identity()
+
+        assert request.identity is None
+        assert get_identity() is not identity
+
+    def test_current_identity_for_another_user_returns_none(
+            self, init_db, new_user_three, request_ctx,
+            mock_request_three_obj_decoded_token):
+        """Test current_identity ignores users other than the current one"""
+        new_user_three.save()
+
+        assert current_identity('-another-token-id') is None
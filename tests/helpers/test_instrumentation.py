@@ -0,0 +1,78 @@
+"""Module for the request instrumentation tests"""
+
+# app config
+from config import AppConfig
+
+# Helpers
+from api.utilities.constants import METRICS_DEBUG_HEADER
+from api.utilities.helpers.instrumentation import (MetricsRegistry,
+                                                   RequestStats,
+                                                   metrics_registry)
+
+api_v1_base_url = AppConfig.API_BASE_URL_V1
+
+
+class TestMetricsRegistry:
+    """Tests for recording and rendering the metrics of the endpoints"""
+
+    def test_render_formats_the_metrics_for_prometheus(self):
+        """Should render the latency histogram and sql counters of a route"""
+
+        registry = MetricsRegistry()
+        stats = RequestStats()
+        stats.sql_statements, stats.sql_time, stats.rows = 3, 0.002, 12
+        registry.observe('/api/v1/assets/<id>', 'GET', 0.02, stats)
+        registry.observe('/api/v1/assets/<id>', 'GET', 0.3, stats)
+
+        rendered = registry.render()
+        labels = 'route="/api/v1/assets/<id>",method="GET"'
+
+        assert '# TYPE activo_request_latency_seconds histogram' in rendered
+        assert f'activo_request_latency_seconds_bucket{{{labels},le="0.025"}} 1' \
+            in rendered
+        assert f'activo_request_latency_seconds_bucket{{{labels},le="+Inf"}} 2' \
+            in rendered
+        assert f'activo_request_latency_seconds_count{{{labels}}} 2' in rendered
+        assert f'activo_request_sql_statements_total{{{labels}}} 6' in rendered
+        assert f'activo_request_sql_rows_total{{{labels}}} 24' in rendered
+
+    def test_labels_are_escaped(self):
+        """Should escape the quotes of a label value"""
+
+        assert MetricsRegistry.labels('/"a"', 'GET') == \
+            '{route="/\\"a\\"",method="GET"}'
+
+
+class TestRequestInstrumentation:
+    """Tests for instrumenting the requests"""
+
+    def test_debug_header_returns_the_request_metrics(
+            self, init_db, client, auth_header, new_center):
+        """Should return the numbers of a request asking for them"""
+
+        new_center.save()
+        metrics_registry.clear()
+        response = client.get(
+            f'{api_v1_base_url}/centers',
+            headers={
+                **auth_header, METRICS_DEBUG_HEADER: 'true'
+            })
+
+        assert response.status_code == 200
+        header = response.headers[METRICS_DEBUG_HEADER]
+        assert 'sql-statements=' in header
+        assert 'serialization-time=' in header
+        assert [
+            metrics.count
+            for (route, method), metrics in metrics_registry.routes.items()
+            if route.rstrip('/').endswith('/centers') and method == 'GET'
+        ] == [1]
+
+    def test_debug_header_is_only_returned_when_asked_for(
+            self, init_db, client, auth_header):
+        """Should not return the numbers of a request not asking for them"""
+
+        response = client.get(f'{api_v1_base_url}/centers',
+                              headers=auth_header)
+
+        assert METRICS_DEBUG_HEADER not in response.headers
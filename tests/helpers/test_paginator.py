@@ -1,11 +1,15 @@
 # Standard
+from datetime import datetime
 from unittest.mock import patch
 
 # Third Party Libraries
 import pytest
 
 # Utilities
-from api.utilities.paginator import pagination_helper
+from api.utilities.paginator import (pagination_helper, encode_cursor,
+                                     decode_cursor, get_total_count_strategy,
+                                     count_records, is_unfiltered)
+from api.models import AssetCategory
 from api.utilities.messages.error_messages import serialization_errors
 
 # Middlewares
@@ -39,3 +43,78 @@ class TestPaginationHelper:
 
         assert error.value.error['message'] == serialization_errors[
             'invalid_field']
+
+
+class TestCursorPagination:
+    """tests the cursor helpers of the paginator"""
+
+    def test_decode_cursor_returns_encoded_position_succeeds(self):
+        """Test decode_cursor returns the sort value, id and direction
+        that were encoded
+        """
+        created_at = datetime(2019, 1, 12, 10, 30, 15)
+        cursor = encode_cursor(created_at, '-LG__7v6uQz6RFxQXdGs', 'next')
+
+        assert decode_cursor(cursor, AssetCategory.created_at) == (
+            created_at, '-LG__7v6uQz6RFxQXdGs', 'next')
+
+    def test_decode_cursor_with_invalid_cursor_fails(self):
+        """Test decode_cursor raises ValidationError with an invalid cursor
+        """
+        with pytest.raises(ValidationError) as error:
+            decode_cursor('invalid-cursor', AssetCategory.created_at)
+
+        assert error.value.error['message'] == serialization_errors[
+            'invalid_query_strings'].format('cursor', 'invalid-cursor')
+
+
+class TestTotalCountStrategy:
+    """tests the total count strategy of the paginator"""
+
+    def test_total_count_strategy_defaults_to_exact_succeeds(self, app):
+        """Test get_total_count_strategy returns exact when no strategy
+        is supplied
+        """
+        with app.test_request_context('/test-url'):
+            assert get_total_count_strategy() == 'exact'
+
+    def test_total_count_strategy_with_valid_strategy_succeeds(self, app):
+        """Test get_total_count_strategy returns the supplied strategy"""
+        with app.test_request_context('/test-url?totalCount=Estimated'):
+            assert get_total_count_strategy() == 'estimated'
+
+    def test_total_count_strategy_with_invalid_strategy_fails(self, app):
+        """Test get_total_count_strategy raises ValidationError with an
+        unsupported strategy
+        """
+        with app.test_request_context('/test-url?totalCount=invalid'), \
+                pytest.raises(ValidationError) as error:
+            get_total_count_strategy()
+
+        assert error.value.error['message'] == serialization_errors[
+            'invalid_request_param'].format('totalCount',
+                                            'exact, estimated, cached')
+
+
+class TestEstimatedCount:
+    """tests the estimated total count of the paginator"""
+
+    def test_is_unfiltered_with_plain_query_succeeds(self, app, init_db):
+        """Test is_unfiltered tells the plain query of a model from a
+        filtered one
+        """
+        assert is_unfiltered(AssetCategory, AssetCategory.query)
+        assert not is_unfiltered(
+            AssetCategory,
+            AssetCategory.query.filter(AssetCategory.name == 'Laptop'))
+
+    def test_estimated_count_of_filtered_query_is_exact(self, app, init_db):
+        """Test count_records does not estimate the count of a filtered
+        query
+        """
+        AssetCategory(name='Estimated').save()
+        records_query = AssetCategory.query.filter(
+            AssetCategory.name == 'Estimated')
+
+        with app.test_request_context('/test-url?totalCount=estimated'):
+            assert count_records(AssetCategory, records_query) == 1
@@ -0,0 +1,31 @@
+"""Module to test the cached permission matrix"""
+from main import cache
+
+from api.utilities.constants import PERMISSION_MATRIX_VERSION_CACHE_KEY
+from api.utilities.helpers.permissions import (
+    get_permission_matrix, invalidate_permission_matrix,
+    local_permission_matrix)
+
+
+class TestPermissionMatrix(object):
+    """Class to test the permission matrix helpers"""
+
+    def test_get_permission_matrix_is_kept_in_process_succeeds(self, init_db):
+        """Test the permission matrix is reused while its version holds"""
+        matrix = get_permission_matrix()
+
+        assert get_permission_matrix() is matrix
+        assert local_permission_matrix['version'] == cache.get(
+            PERMISSION_MATRIX_VERSION_CACHE_KEY)
+
+    def test_invalidate_permission_matrix_changes_version_succeeds(
+            self, init_db):
+        """Test invalidating the matrix drops the local copy and bumps the
+        cached version
+        """
+        get_permission_matrix()
+        version = cache.get(PERMISSION_MATRIX_VERSION_CACHE_KEY)
+        invalidate_permission_matrix()
+
+        assert local_permission_matrix['matrix'] is None
+        assert cache.get(PERMISSION_MATRIX_VERSION_CACHE_KEY) != version
@@ -0,0 +1,86 @@
+"""Module for the prepared statements helper tests"""
+# Standard
+from unittest.mock import patch
+
+# Models
+from api.models import Center
+from api.models.database import db
+
+# Helpers
+from api.utilities.prepared_statements import execute_query, prepare_query
+
+
+class TestPrepareQuery:
+    """Tests for converting queries into statements that can be prepared"""
+
+    def test_prepare_query_numbers_the_bind_parameters(self):
+        """Should replace each named parameter with its position"""
+
+        name, statement, names = prepare_query(
+            'SELECT * FROM asset WHERE created_at BETWEEN :start AND :end '
+            'AND updated_at > :start')
+
+        assert name.startswith('activo_')
+        assert statement == ('SELECT * FROM asset WHERE created_at BETWEEN '
+                             '$1 AND $2 AND updated_at > $1')
+        assert names == ('start', 'end')
+
+    def test_prepare_query_keeps_casts_and_strings(self):
+        """Should not mistake casts or times for bind parameters"""
+
+        _, statement, names = prepare_query(
+            "SELECT '10:30'::time, :value::text WHERE id = :id")
+
+        assert statement == "SELECT '10:30'::time, :value::text WHERE id = $1"
+        assert names == ('id', )
+
+    def test_prepare_query_names_the_same_query_the_same(self):
+        """Should give a query the same statement name every time"""
+
+        sql = 'SELECT 1 FROM spaces WHERE id = :space_id'
+
+        assert prepare_query(sql)[0] == prepare_query(sql)[0]
+        assert prepare_query(sql)[0] != prepare_query(f'{sql} LIMIT 1')[0]
+
+
+class TestExecuteQuery:
+    """Tests for executing queries as prepared statements"""
+
+    def test_execute_query_binds_the_values(self, init_db, new_center):
+        """Should return the rows matching the bound values each time"""
+
+        new_center.save()
+        sql = 'SELECT name FROM centers WHERE name = :name'
+
+        for _ in range(2):
+            assert execute_query(sql, name=new_center.name).scalar() == \
+                new_center.name
+        assert execute_query(sql, name="' OR '1'='1").scalar() is None
+
+    def test_exists_binds_the_value(self, init_db, new_center):
+        """Should check whether a value exists without formatting it in"""
+
+        new_center.save()
+
+        assert Center.exists(new_center.name, 'name')
+        assert not Center.exists("' OR '1'='1", 'name')
+
+    @patch('api.utilities.prepared_statements.'
+           'PREPARED_STATEMENTS_PER_CONNECTION', 2)
+    def test_execute_query_deallocates_the_least_recent_statement(
+            self, init_db):
+        """Should keep a bounded count of statements on a connection"""
+
+        connection = db.engine.connect()
+        queries = [f'SELECT {number} WHERE 1 = :one' for number in range(3)]
+        try:
+            for sql in queries:
+                assert execute_query(sql, bind=connection, one=1).scalar() \
+                    is not None
+            statements = connection.execute(
+                'SELECT name FROM pg_prepared_statements').fetchall()
+        finally:
+            connection.close()
+
+        assert {prepare_query(sql)[0] for sql in queries[1:]} == \
+            {statement.name for statement in statements}
@@ -7,6 +7,7 @@ from api.utilities.constants import CHARSET
 from api.utilities.messages.error_messages import filter_errors, serialization_errors
 from api.middlewares.base_validator import ValidationError
 from api.models.asset_category import AssetCategory
+from api.utilities.dynamic_filter import FilterPlan
 
 # app config
 from config import AppConfig
@@ -253,6 +254,31 @@ class TestDynamicFilterClass:
         assert 'Laptop' in names
         assert 'Chromebook' not in names
 
+    def test_filter_plan_is_reused_for_the_same_shape(self, init_db,
+                                                      dynamic_filter):
+        """
+        Assert that filters with the same keys and operators share their
+        compiled plan and are filtered by their own values
+        """
+        plan = FilterPlan.get(AssetCategory, (('name', 'like'), ))
+        assert FilterPlan.get(AssetCategory, (('name', 'like'), )) is plan
+
+        result = dynamic_filter.filter_query(
+            ImmutableMultiDict([('where', 'name,like,chrome')])).all()
+        names = [record.name for record in result]
+        assert 'Chromebook' in names
+        assert 'Apple' not in names
+
+    def test_filter_plan_validates_new_values(self, init_db, dynamic_filter):
+        """
+        Assert that the values of a cached plan are still validated
+        """
+        dynamic_filter.filter_query(
+            ImmutableMultiDict([('where', 'deleted,eq,false')])).all()
+        with pytest.raises(ValidationError):
+            dynamic_filter.filter_query(
+                ImmutableMultiDict([('where', 'deleted,eq,maybe')]))
+
     def test_for_request_with_stats_and_invalid_filter_value(
             self, client, init_db, auth_header):
         """Test request with stats and invalid filter value"""
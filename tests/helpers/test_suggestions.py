@@ -0,0 +1,46 @@
+"""Module for the typeahead suggestions helper tests"""
+
+# Helpers
+from api.utilities.helpers.lru_cache import LRUCache
+from api.utilities.helpers.suggestions import escape_like
+
+
+class TestLRUCache:
+    """Tests for the in-process suggestions cache"""
+
+    def test_get_returns_the_cached_value(self):
+        """Should return the value set for a key"""
+
+        cache = LRUCache(2, 30)
+        cache.set('tag', ['AND/345'])
+
+        assert cache.get('tag') == ['AND/345']
+        assert cache.get('missing') is None
+
+    def test_set_evicts_the_least_recently_used_key(self):
+        """Should drop the least recently used key once the cache is full"""
+
+        cache = LRUCache(2, 30)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_get_drops_expired_values(self):
+        """Should not return values older than the timeout"""
+
+        cache = LRUCache(2, 0)
+        cache.set('a', 1)
+
+        assert cache.get('a') is None
+        assert not cache.entries
+
+
+def test_escape_like_escapes_wildcards():
+    """Should match the like wildcards literally"""
+
+    assert escape_like('50%_off\\') == '50\\%\\_off\\\\'
@@ -1,7 +1,9 @@
 """Test ActivityTracker Module"""
-from api.utilities.history.activity_tracker import ActivityTracker
+from api.utilities.history.activity_tracker import ActivityTracker, prefetched
+from api.utilities.history.asset_activity_tracker import AssetActivityTracker
 from api.utilities.messages.success_messages import HISTORY_MESSAGES
 from api.models import Center
+from api.models.database import db
 
 
 class TestActivityTrackerClass:
@@ -78,3 +80,28 @@ class TestActivityTrackerClass:
             ("<Center Epic Tower>", ))
 
         assert list(response) == ['Epic Tower']
+
+    def test_prefetch_records_looks_up_updated_ids(self, init_db, new_asset):
+        """Test the records referenced by updated id columns are looked up
+        once for all the activities
+
+        Args:
+            init_db (db): initialize database
+            new_asset (fixture): fixture for new asset
+        """
+        center_id = new_asset.center_id
+
+        with db.session.no_autoflush:
+            new_asset.center_id = '-Id'
+            activities = [(new_asset, AssetActivityTracker, None, 'PATCH')]
+
+            with ActivityTracker.prefetch_records(activities):
+                assert prefetched.records[Center, '-Id'] is None
+                assert prefetched.records[Center, center_id].id == center_id
+                response = AssetActivityTracker.convert_id_to_name(
+                    'center_id', '-Id', center_id)
+
+            new_asset.center_id = center_id
+
+        assert prefetched.records is None
+        assert response == ('center', Center.get(center_id).name, 'None')
@@ -381,3 +381,21 @@ class TestQueryParser:
         assert len(spaces) == 3
         assert saved_spaces[0].name in names
         assert saved_spaces[4].name in names
+
+    def test_parse_all_reuses_parsed_queries(self, init_db):
+        """
+        Should return the cached parsed queries for the same url queries
+        and parse different url queries again.
+
+        Parameters:
+            init_db (SQLAlchemy): fixture to initialize the test database
+        """
+        request_args = ImmutableMultiDict([('name', 'To')])
+
+        filter_query = QueryParser.parse_all(Space, request_args)
+
+        assert QueryParser.parse_all(
+            Space, ImmutableMultiDict([('name', 'To')])) is filter_query
+        assert QueryParser.parse_all(
+            Space, ImmutableMultiDict([('name', 'Lagos')])).get(
+                'where') == 'name,like,lagos'
@@ -1,5 +1,11 @@
+import time
+from base64 import b64encode
+
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey
 from flask import json
 
+from api.middlewares.token_required import VerifiedTokenCache, get_public_key
+
 from api.utilities.messages.error_messages import jwt_errors
 from api.utilities.constants import CHARSET
 from tests.helpers.generate_token import generate_token
@@ -44,3 +50,47 @@ class TestTokenRequiredMiddleware:
 
         assert response.status_code == 401
         assert response_json['message'] == jwt_errors['EXPIRED_TOKEN_MSG']
+
+
+class TestVerifiedTokenCache:
+    def test_verified_token_cache_returns_cached_claims(self):
+        cache = VerifiedTokenCache(max_size=2)
+        claims = {'UserInfo': {'id': '-LG__7v6'}, 'exp': time.time() + 60}
+        cache.set('token', claims)
+
+        assert cache.get('token') == claims
+
+    def test_verified_token_cache_skips_tokens_without_exp(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.set('token', {'UserInfo': {'id': '-LG__7v6'}})
+
+        assert cache.get('token') is None
+
+    def test_verified_token_cache_drops_expired_tokens(self):
+        cache = VerifiedTokenCache(max_size=2)
+        cache.set('token', {'UserInfo': {}, 'exp': time.time() - 1})
+
+        assert cache.get('token') is None
+        assert not cache.tokens
+
+    def test_verified_token_cache_evicts_least_recently_used(self):
+        cache = VerifiedTokenCache(max_size=2)
+        exp = time.time() + 60
+        cache.set('token_one', {'exp': exp})
+        cache.set('token_two', {'exp': exp})
+        cache.get('token_one')
+        cache.set('token_three', {'exp': exp})
+
+        assert cache.get('token_two') is None
+        assert cache.get('token_one') == {'exp': exp}
+        assert cache.get('token_three') == {'exp': exp}
+
+    def test_get_public_key_parses_the_encoded_key_once(self):
+        """Should parse the base64 encoded key of the other environments"""
+
+        public_key_64 = b64encode(AppConfig.JWT_PUBLIC_KEY.encode()).decode()
+
+        public_key = get_public_key('production', public_key_64)
+
+        assert isinstance(public_key, RSAPublicKey)
+        assert get_public_key('production', public_key_64) is public_key
@@ -1,3 +1,8 @@
+# System libraries
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from threading import Thread
+
+
 class Error:
     """Class that holds the error objects accepted by python-http-client exceptions"""
     code = None
@@ -6,3 +11,69 @@ class Error:
 
     def read(self):
         pass
+
+
+class SMTPHandler(StreamRequestHandler):
+    """Handles an SMTP session of the local SMTP server"""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        self.server.sessions += 1
+        self.reply('220 localhost SMTP stand-in')
+        recipients = []
+        for line in self.rfile:
+            command = line.decode().strip()
+            verb = command[:4].upper()
+            if verb == 'EHLO' or verb == 'HELO':
+                self.reply('250 localhost')
+            elif verb == 'RCPT' and 'reject' in command:
+                self.reply('550 No such user')
+            elif verb == 'RCPT':
+                recipients.append(command.split(':', 1)[1].strip(' <>'))
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                for data_line in self.rfile:
+                    if data_line == b'.\r\n':
+                        break
+                self.server.messages.append(recipients)
+                recipients = []
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                # MAIL, RSET and NOOP
+                recipients = [] if verb == 'RSET' else recipients
+                self.reply('250 OK')
+
+
+class LocalSMTPServer(ThreadingTCPServer):
+    """SMTP server standing in for the mail server, which records the
+    recipients of the messages it receives and the sessions opened
+
+    attributes:
+        messages (list): the recipients of each message received
+        sessions (int): the count of connections opened
+    """
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('localhost', 0), SMTPHandler)
+        self.messages = []
+        self.sessions = 0
+        self.thread = Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
@@ -10,3 +10,44 @@ class GoogleSheetHelper:
             HOTDESK_GOOGLE(list) list of dist hotdesk
         """
         return HOTDESK_GOOGLE
+
+
+class FakeWorksheet:
+    """An in memory worksheet with the gspread methods the bot uses
+
+    attributes:
+        rows (list): the values of the rows, the header row first
+        api_calls (int): the count of calls that would reach the sheets api
+    """
+
+    def __init__(self, records):
+        self.headers = list(records[0].keys())
+        self.rows = [self.headers] + [[
+            record.get(header, '') for header in self.headers
+        ] for record in records]
+        self.api_calls = 0
+
+    def get_all_records(self):
+        """Returns the rows below the header row keyed by the headers"""
+        self.api_calls += 1
+        return [dict(zip(self.headers, row)) for row in self.rows[1:]]
+
+    def col_values(self, col):
+        """Returns the values of a column"""
+        self.api_calls += 1
+        return [row[col - 1] for row in self.rows]
+
+    def cell_value(self, row, col):
+        """Returns the value of a cell without counting an api call"""
+        return self.rows[row - 1][col - 1]
+
+    def update_cell(self, row, col, value):
+        """Updates the value of a cell"""
+        self.api_calls += 1
+        self.rows[row - 1][col - 1] = value
+
+    def update_cells(self, cell_list):
+        """Updates the values of many cells in one call"""
+        self.api_calls += 1
+        for cell in cell_list:
+            self.rows[cell.row - 1][cell.col - 1] = cell.value
@@ -0,0 +1,74 @@
+"""Module for the maintained asset category stats tests"""
+
+# Models
+from api.models import AssetCategoryStats, AssetCategoryLastStock
+from api.models.database import db
+
+# Helpers
+from api.utilities.helpers.asset_category_stats import \
+    rebuild_asset_category_stats
+
+
+def get_assets_count(asset):
+    """Gets the count of assets of the stats row of an asset"""
+    stats = AssetCategoryStats.query.get(
+        (asset.asset_category_id, asset.center_id, asset.status,
+         asset.assignee_type.name))
+    return stats.assets_count if stats else 0
+
+
+class TestAssetCategoryStatsModel:
+    """Tests for the maintained asset category stats"""
+
+    def test_asset_insert_increments_stats(self, init_db, new_asset):
+        """Should count a new asset in the stats of its category"""
+
+        assert get_assets_count(new_asset) == 1
+
+    def test_asset_status_update_moves_stats(self, init_db, new_asset):
+        """Should move an asset to the stats row of its new status"""
+
+        previous_count = get_assets_count(new_asset)
+        new_asset.status = 'damaged'
+        db.session.commit()
+
+        assert get_assets_count(new_asset) == 1
+        assert AssetCategoryStats.query.get(
+            (new_asset.asset_category_id, new_asset.center_id, 'ok',
+             new_asset.assignee_type.name)).assets_count == previous_count - 1
+
+    def test_asset_soft_delete_decrements_stats(self, init_db, new_asset):
+        """Should remove a soft deleted asset from the stats"""
+
+        new_asset.deleted = True
+        db.session.commit()
+
+        assert get_assets_count(new_asset) == 0
+
+    def test_rebuild_matches_maintained_stats(self, init_db, new_asset):
+        """Should rebuild the same stats the asset events maintain"""
+
+        maintained = {(stats.asset_category_id, stats.center_id, stats.status,
+                       stats.assignee_type): stats.assets_count
+                      for stats in AssetCategoryStats.query.all()
+                      if stats.assets_count}
+
+        rebuild_asset_category_stats(db.session)
+        db.session.commit()
+
+        rebuilt = {(stats.asset_category_id, stats.center_id, stats.status,
+                    stats.assignee_type): stats.assets_count
+                   for stats in AssetCategoryStats.query.all()}
+        assert rebuilt == maintained
+
+    def test_stock_count_insert_updates_last_stock(self, init_db,
+                                                   new_stock_count):
+        """Should keep the latest stock count of the asset category"""
+
+        new_stock_count.save()
+
+        last_stock = AssetCategoryLastStock.query.filter_by(
+            asset_category_id=new_stock_count.asset_category_id).all()
+        assert [stock.stock_count_id for stock in last_stock
+                ] == [new_stock_count.id]
+        assert last_stock[0].last_stock_count == new_stock_count.count
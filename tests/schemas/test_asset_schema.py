@@ -49,3 +49,19 @@ class TestAssetSchema:
         asset_schema = AssetSchema()
         with pytest.raises(ValidationError):
             asset_schema.load_object_into_schema(data)
+
+    def test_asset_schema_dump_loads_assignees_in_batch_succeeds(
+            self, init_db, new_asset, new_space, request_ctx,
+            mock_request_two_obj_decoded_token):
+        """Should dump the assignee from the assignees loaded in batch
+
+        Args:
+            init_db (Fixture): initialize db
+            new_asset (object): fixture used to create new asset
+            new_space (object): fixture used to create new space
+        """
+        asset_data = AssetSchema(many=True).dump([new_asset]).data
+
+        assert new_asset._prefetched_assignee == (new_space.id, new_space)
+        assert asset_data[0]['assignee']['id'] == new_space.id
+        assert asset_data[0]['assigneeType'] == 'space'
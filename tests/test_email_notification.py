@@ -1,6 +1,7 @@
 # System libraries
 from unittest.mock import patch, Mock
-from python_http_client import UnauthorizedError, GatewayTimeoutError
+from python_http_client import (BadRequestsError, UnauthorizedError,
+                                GatewayTimeoutError)
 
 # Third Party Libraries
 import sendgrid
@@ -13,8 +14,10 @@ from api.services.email_notification import low_asset_count_notifier, SendEmail
 # Utilities
 from api.utilities.emails.email_factories.concrete_sendgrid import ConcreteSendGridEmail
 from api.utilities.emails.email_factories.concrete_flask_mail import ConcreteFlaskMail
+from api.utilities.emails.email_factories.concrete_mailgun import ConcreteMailgunEmail
 from api.utilities.emails.email_factories.abstract_send_email import AbstractSendEmail
 from api.utilities.emails.email_factories.send_email_builder import build_email_sender
+from api.utilities.emails.get_mailing_params import get_batch_mailing_params
 from api.utilities.enums import AssetStatus
 
 # mock data
@@ -285,3 +288,209 @@ class TestNotificationAssetStatuses:
         assert AssetStatus.INVENTORY in AssetStatus
         assert AssetStatus.OK_IN_STORE in AssetStatus
         assert AssetStatus.AVAILABLE in AssetStatus
+
+
+class TestSendEmailBatch:
+    """Tests sending emails in batches"""
+
+    def test_flask_mail_batch_shares_connections_succeeds(
+            self, local_smtp_server):
+        """Tests that a batch is sent over one connection per worker
+
+        Args:
+            local_smtp_server(LocalSMTPServer): the local SMTP server
+        """
+        mails = [
+            dict(
+                recipient=f'user{index}@andela.com',
+                mail_subject='test subject',
+                mail_html_body='<b>test body</b>') for index in range(10)
+        ]
+
+        result = ConcreteFlaskMail.send_batch_with_template(
+            mails, concurrency=2)
+
+        assert result == {'sent': 10, 'failures': []}
+        assert len(local_smtp_server.messages) == 10
+        assert local_smtp_server.sessions == 2
+
+    def test_flask_mail_batch_with_rejected_recipient_fails(
+            self, local_smtp_server):
+        """Tests that the failed emails of a batch are reported and the others
+        are still sent
+
+        Args:
+            local_smtp_server(LocalSMTPServer): the local SMTP server
+        """
+        mails = [
+            dict(
+                recipient=recipient,
+                mail_subject='test subject',
+                mail_html_body='<b>test body</b>')
+            for recipient in ('user@andela.com', 'reject@andela.com',
+                              'other.user@andela.com')
+        ]
+
+        result = ConcreteFlaskMail.send_batch_with_template(
+            mails, concurrency=1)
+
+        assert result['sent'] == 2
+        assert [failure['recipient'] for failure in result['failures']
+                ] == ['reject@andela.com']
+        assert local_smtp_server.messages == [['user@andela.com'],
+                                              ['other.user@andela.com']]
+        assert local_smtp_server.sessions == 1
+
+    @patch('requests.Session')
+    def test_mailgun_batch_shares_sessions_succeeds(self, mock_session):
+        """Tests that a batch is sent over one HTTP session per worker
+
+        Args:
+            mock_session(MagicMock): A requests.Session mock instance
+        """
+        session = mock_session.return_value.__enter__.return_value
+        session.post.return_value.status_code = 200
+        mails = [
+            dict(
+                recipient=f'user{index}@andela.com',
+                mail_subject='test subject',
+                mail_html_body='<b>test body</b>') for index in range(6)
+        ]
+
+        result = ConcreteMailgunEmail.send_batch_with_template(
+            mails, concurrency=3)
+
+        assert result == {'sent': 6, 'failures': []}
+        assert mock_session.call_count == 3
+        assert session.post.call_count == 6
+
+    @patch(
+        "api.utilities.emails.email_factories.concrete_sendgrid.ConcreteSendGridEmail.SENDGRID_CLIENT"
+    )
+    def test_sendgrid_batch_groups_mails_by_template_succeeds(
+            self, mock_client):
+        """Tests that the mails of a template are sent in one request
+
+        Args:
+            mock_client(MagicMock): A sendgrid mock instance
+        """
+        mails = [
+            dict(
+                recipient=f'user{index}@andela.com',
+                template_id=f'template-{index % 2}',
+                template_data={'index': index}) for index in range(6)
+        ]
+
+        result = ConcreteSendGridEmail.send_batch_with_template(
+            mails, concurrency=1)
+
+        requests = [
+            call[1]['request_body']
+            for call in mock_client.client.mail.send.post.call_args_list
+        ]
+        assert result == {'sent': 6, 'failures': []}
+        assert [request['template_id'] for request in requests
+                ] == ['template-0', 'template-1']
+        assert [
+            personalization['to'][0]['email']
+            for personalization in requests[0]['personalizations']
+        ] == ['user0@andela.com', 'user2@andela.com', 'user4@andela.com']
+
+    @patch(
+        "api.utilities.emails.email_factories.concrete_sendgrid.ConcreteSendGridEmail.SENDGRID_CLIENT"
+    )
+    def test_sendgrid_batch_splits_personalizations_succeeds(
+            self, mock_client):
+        """Tests that a request holds at most 1000 personalizations
+
+        Args:
+            mock_client(MagicMock): A sendgrid mock instance
+        """
+        mails = [
+            dict(
+                recipient=f'user{index}@andela.com',
+                template_id='template',
+                template_data={}) for index in range(1001)
+        ]
+
+        result = ConcreteSendGridEmail.send_batch_with_template(
+            mails, concurrency=1)
+
+        requests = [
+            call[1]['request_body']
+            for call in mock_client.client.mail.send.post.call_args_list
+        ]
+        assert result == {'sent': 1001, 'failures': []}
+        assert [len(request['personalizations'])
+                for request in requests] == [1000, 1]
+
+    @patch(
+        "api.utilities.emails.email_factories.concrete_sendgrid.ConcreteSendGridEmail.SENDGRID_CLIENT"
+    )
+    def test_sendgrid_batch_with_invalid_recipient_fails(self, mock_client):
+        """Tests that the mails of a rejected request are sent one by one so
+        only the invalid ones fail
+
+        Args:
+            mock_client(MagicMock): A sendgrid mock instance
+        """
+
+        def post(request_body):
+            recipients = [
+                personalization['to'][0]['email']
+                for personalization in request_body['personalizations']
+            ]
+            if 'invalid' in recipients:
+                raise BadRequestsError(Error())
+            return Mock(status_code=202)
+
+        mock_client.client.mail.send.post.side_effect = post
+        mails = [
+            dict(recipient=recipient, template_id='template', template_data={})
+            for recipient in ('user@andela.com', 'invalid',
+                              'other.user@andela.com')
+        ]
+
+        result = ConcreteSendGridEmail.send_batch_with_template(
+            mails, concurrency=1)
+
+        assert result['sent'] == 2
+        assert [failure['recipient']
+                for failure in result['failures']] == ['invalid']
+        assert mock_client.client.mail.send.post.call_count == 4
+
+    def test_get_batch_mailing_params_for_sendgrid_succeeds(self, app):
+        """Tests that the mails of a sendgrid batch hold the template id
+
+        Args:
+            app(Flask): the flask app
+        """
+        with patch.object(AppConfig, 'MAIL_SERVICE', 'sendgrid'):
+            params = get_batch_mailing_params(
+                'low_in_stock',
+                [('user@andela.com', 'subject', {'asset_count': 1})])
+
+        assert params == [
+            dict(
+                recipient='user@andela.com',
+                template_id='d-65e620a5dad14058bb37f17ba1319d68',
+                template_data={'asset_count': 1})
+        ]
+
+    def test_get_batch_mailing_params_renders_each_mail_succeeds(self, app):
+        """Tests that the template is rendered with the data of each mail
+
+        Args:
+            app(Flask): the flask app
+        """
+        with patch.object(AppConfig, 'MAIL_SERVICE', 'mailgun'):
+            params = get_batch_mailing_params(
+                'low_in_stock',
+                [('ada@andela.com', 'Low stock', {'user_first_name': 'Ada'}),
+                 ('bob@andela.com', 'Low stock', {'user_first_name': 'Bob'})])
+
+        assert [(mail['recipient'], mail['mail_subject'])
+                for mail in params] == [('ada@andela.com', 'Low stock'),
+                                        ('bob@andela.com', 'Low stock')]
+        assert 'Hi Ada!' in params[0]['mail_html_body']
+        assert 'Hi Bob!' in params[1]['mail_html_body']
@@ -470,7 +470,11 @@ class TestExportAnalyticReportResource:
         outflow_start_date = dt.datetime.now() - relativedelta(months=2)
 
         e = ExportAssetAnalyticsReportResource()
-        outflow = e.asset_outflow(outflow_start_date, now)
+        outflow = [
+            record
+            for chunk in e.asset_outflow(outflow_start_date, now)['chunks']
+            for record in chunk
+        ]
 
         first_date_assigned = outflow[0]['Date Assigned']
         second_date_assigned = outflow[1]['Date Assigned']
@@ -495,7 +499,11 @@ class TestExportAnalyticReportResource:
         inflow_start_date = dt.datetime.now() - relativedelta(months=2)
 
         e = ExportAssetAnalyticsReportResource()
-        inflow = e.asset_inflow(inflow_start_date, now)
+        inflow = [
+            record
+            for chunk in e.asset_inflow(inflow_start_date, now)['chunks']
+            for record in chunk
+        ]
 
         first_date_assigned = inflow[0]['Date Assigned']
         second_date_assigned = inflow[1]['Date Assigned']
@@ -1,14 +1,17 @@
 """Module for asset resource endpoints."""
 from os import getenv
 
+import pytest
 from flask import json
+from marshmallow import ValidationError
 
 from unittest.mock import patch
 from api.utilities.constants import CHARSET
 from api.schemas.asset import AssetSchema
 from api.utilities.enums import AssigneeType
 from api.utilities.messages.success_messages import SUCCESS_MESSAGES
-from api.utilities.helpers.bulk_asset_helper import BulkAssetHelper
+from api.utilities.helpers.bulk_asset_helper import (BulkAssetHelper,
+                                                     BulkAssetLookup)
 from api.utilities.messages.error_messages.jwt_errors import error_dict
 from api.utilities.messages.error_messages.serialization_error import error_dict as serial_dict
 
@@ -422,3 +425,39 @@ class TestBulkAssetPostEndpoint:
             multiple_assets2, new_space_two)
         assert 'assigneeId' in multiple_assets2
         assert multiple_assets2['assigneeId'] == new_space_two.id
+
+    def test_bulk_asset_lookup_resolves_batch(self, init_db, new_space_two,
+                                              new_center):
+        """
+            Test that the BulkAssetLookup resolves the spaces, assignees and
+            centers of all the assets at once
+            Args:
+                new_space_two(object): Space object
+                new_center(object): Center object
+        """
+        new_space_two.save()
+        assets = [{
+            'assignee': new_space_two.name.upper(),
+            'assigneeType': 'space',
+            'centerId': new_center.id
+        }, {
+            'assignee': 'Atlantis',
+            'assigneeType': 'space',
+            'assigneeId': '-Id',
+            'centerId': '-Id'
+        }, 'not an asset']
+
+        lookup = BulkAssetLookup(assets)
+        assets[0]['assigneeId'] = lookup.get_space_by_name(
+            assets[0]['assignee']).id
+        lookup.load()
+
+        assert assets[0]['assigneeId'] == new_space_two.id
+        assert lookup.get_space_by_name('Atlantis') is None
+        assert lookup.get_assignee('space', new_space_two.id) == new_space_two
+        assert lookup.existing_centers == {new_center.id}
+        lookup.validate_assignee_id(new_space_two.id)
+        with pytest.raises(ValidationError):
+            lookup.validate_assignee_id('-Id')
+        with pytest.raises(ValidationError):
+            lookup.validate_center_id('-Id')
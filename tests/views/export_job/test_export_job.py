@@ -0,0 +1,134 @@
+"""Module to test asynchronous export jobs"""
+
+# Standard library
+import gzip
+import json
+import os
+
+# Third party
+import jwt
+
+# Services
+from api.services.export import purge_expired_exports
+
+# Utilities
+from api.tasks.export import ExportJobs
+from api.utilities.constants import CHARSET
+from api.utilities.helpers.artifact_store import artifact_store
+from api.utilities.messages.error_messages import (serialization_errors,
+                                                   query_errors)
+
+# app config
+from config import AppConfig
+
+BASE_URL = AppConfig.API_BASE_URL_V1
+
+
+class TestExportJobs:
+    """Tests for asynchronous export jobs"""
+
+    def test_create_export_job_with_invalid_export_type_fails(
+            self, init_db, client, auth_header):
+        """Should return an error for an unsupported export type"""
+
+        response = client.post(
+            f'{BASE_URL}/export-jobs',
+            headers=auth_header,
+            data=json.dumps({'exportType': 'planets'}))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['errors']['exportType'][0].startswith(
+            'exportType must be one of')
+
+    def test_create_export_job_with_invalid_query_fails(
+            self, init_db, client, auth_header):
+        """Should validate the query of the export before queueing the job"""
+
+        response = client.post(
+            f'{BASE_URL}/export-jobs',
+            headers=auth_header,
+            data=json.dumps({'exportType': 'users', 'query': {'nam': 'x'}}))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == query_errors[
+            'invalid_query_non_existent_column'].format('nam', 'User')
+
+    def test_create_assets_export_job_without_asset_category_fails(
+            self, init_db, client, auth_header):
+        """Should require the asset category of an assets export"""
+
+        response = client.post(
+            f'{BASE_URL}/export-jobs',
+            headers=auth_header,
+            data=json.dumps({'exportType': 'assets'}))
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 400
+        assert response_json['message'] == serialization_errors[
+            'missing_export_param'].format('assetCategoryId', 'assets')
+
+    def test_export_job_writes_downloadable_file(
+            self, init_db, client, auth_header, new_user, tmpdir,
+            monkeypatch):
+        """Should write the file of the job and serve it once completed"""
+
+        monkeypatch.setattr(artifact_store, 'root', str(tmpdir))
+        new_user.save()
+
+        response = client.post(
+            f'{BASE_URL}/export-jobs',
+            headers=auth_header,
+            data=json.dumps({
+                'exportType': 'users',
+                'query': {
+                    'email': new_user.email
+                }
+            }))
+        job = json.loads(response.data.decode(CHARSET))['data']
+
+        assert response.status_code == 202
+        assert job['status'] == 'pending'
+
+        token = auth_header['Authorization'].split(' ')[-1]
+        ExportJobs.run(job['id'], jwt.decode(token, verify=False))
+
+        response = client.get(
+            f"{BASE_URL}/export-jobs/{job['id']}", headers=auth_header)
+        job = json.loads(response.data.decode(CHARSET))['data']
+
+        assert job['status'] == 'completed'
+        assert job['progress'] == 1
+
+        response = client.get(
+            f"{BASE_URL}/export-jobs/{job['id']}/download",
+            headers=auth_header)
+        content = gzip.decompress(response.data).decode(CHARSET)
+
+        assert response.status_code == 200
+        assert content.startswith('center,email,image url,name,role,status')
+        assert new_user.email in content
+
+    def test_get_non_existing_export_job_fails(self, init_db, client,
+                                               auth_header):
+        """Should return an error when the job does not exist"""
+
+        response = client.get(
+            f'{BASE_URL}/export-jobs/non-existing-job', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 404
+        assert response_json['message'] == serialization_errors[
+            'export_job_not_found']
+
+    def test_purge_expired_exports_removes_expired_files(
+            self, init_db, tmpdir, monkeypatch):
+        """Should remove the expired export files without waiting for a job"""
+
+        monkeypatch.setattr(artifact_store, 'root', str(tmpdir))
+        monkeypatch.setattr(artifact_store, 'expiry', -1)
+        artifact_store.write('job', 'csv', [[{'tag': 'AND/1'}]], ['tag'])
+
+        assert purge_expired_exports() == 1
+        assert os.listdir(str(tmpdir)) == []
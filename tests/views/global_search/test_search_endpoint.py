@@ -4,6 +4,9 @@ from flask import json
 # app config
 from config import AppConfig
 
+# Models
+from api.models import WorkOrder
+
 # Utilities
 from api.utilities.constants import CHARSET
 from api.utilities.messages.success_messages import SUCCESS_MESSAGES
@@ -56,8 +59,11 @@ class TestSearchEndpoint:
         response_data = json.loads(response.data.decode(CHARSET))
         data = response_data.get('data')
         assert response_data['status'] == 'success'
-        assert response_data['data'][3]['workorders'][0]['description'] \
-            == 'change the fuel of the car'
+        work_order = response_data['data'][3]['workorders'][0]
+        assert work_order['id'] == new_work_order.id
+        assert work_order['title'] == 'Fuel Level'
+        assert work_order['rank'] > 0
+        assert response_data['meta']['workorders']['nextCursor'] == ''
         assert response_data['message'] == SUCCESS_MESSAGES[
             'successfully_fetched'].format('search results')
 
@@ -106,3 +112,82 @@ class TestSearchEndpoint:
         assert response_data['message'] == serialization_errors[
             'empty_query_param_value'
         ]
+
+    def test_search_endpoint_paginates_a_type_with_its_cursor(
+            self, init_db, client, auth_header, new_work_order):
+        """Tests that the results of a type are paginated with its cursor
+
+        Args:
+            client (FlaskClient): fixture to get flask test client
+            init_db (SQLAlchemy): fixture to initialize the test database
+            auth_header (dict): fixture to get token
+            new_work_order: fixture that contains the work order
+
+        """
+        new_work_order.save()
+        WorkOrder(
+            title='Fuel Pump',
+            description='check the fuel pump',
+            maintenance_category_id=new_work_order.maintenance_category_id,
+            assignee_id=new_work_order.assignee_id,
+            frequency='weekly',
+            status='enabled',
+            start_date=new_work_order.start_date,
+            end_date=new_work_order.end_date,
+            created_by=new_work_order.created_by).save()
+
+        url = f'{api_v1_base_url}/search?q={work_order_query_text}' \
+            '&type=workorders&limit=1'
+        response = client.get(url, headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        assert response.status_code == 200
+        assert len(response_data['data']) == 1
+        first_page = response_data['data'][0]['workorders']
+        next_cursor = response_data['meta']['workorders']['nextCursor']
+        assert len(first_page) == 1
+        assert next_cursor
+
+        response = client.get(
+            f'{url}&cursor={next_cursor}', headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        second_page = response_data['data'][0]['workorders']
+        assert len(second_page) == 1
+        assert second_page[0]['id'] != first_page[0]['id']
+        assert second_page[0]['rank'] <= first_page[0]['rank']
+
+    def test_search_endpoint_with_invalid_type_fails(
+            self, init_db, client, auth_header):
+        """Tests that searching an unknown type fails
+
+        Args:
+            client (FlaskClient): fixture to get flask test client
+            init_db (SQLAlchemy): fixture to initialize the test database
+            auth_header (dict): fixture to get token
+
+        """
+        response = client.get(
+            f'{api_v1_base_url}/search?q={work_order_query_text}&type=cars',
+            headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        assert response.status_code == 400
+        assert response_data['message'] == serialization_errors[
+            'invalid_request_param'].format(
+                'type', 'assets, hotdeskrequests, users, workorders')
+
+    def test_search_endpoint_with_cursor_and_no_type_fails(
+            self, init_db, client, auth_header):
+        """Tests that a cursor cannot be used when searching every type
+
+        Args:
+            client (FlaskClient): fixture to get flask test client
+            init_db (SQLAlchemy): fixture to initialize the test database
+            auth_header (dict): fixture to get token
+
+        """
+        response = client.get(
+            f'{api_v1_base_url}/search?q={work_order_query_text}&cursor=abc',
+            headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        assert response.status_code == 400
+        assert response_data['message'] == serialization_errors[
+            'search_cursor_without_type']
@@ -0,0 +1,116 @@
+# Flask
+from flask import json
+
+# app config
+from config import AppConfig
+
+# Models
+from api.models import User
+
+# Utilities
+from api.utilities.constants import CHARSET
+from api.utilities.helpers.suggestions import suggestions_cache
+from api.utilities.messages.success_messages import SUCCESS_MESSAGES
+from api.utilities.messages.error_messages import serialization_errors
+
+api_v1_base_url = AppConfig.API_BASE_URL_V1
+
+
+class TestSuggestEndpoint:
+    """ Class for suggest GET endpoint."""
+
+    def test_suggest_endpoint_with_valid_params_succeeds(
+            self, init_db, client, auth_header, new_user):
+        """Tests that the users matching the typed text are suggested
+
+        Args:
+            client (FlaskClient): fixture to get flask test client
+            init_db (SQLAlchemy): fixture to initialize the test database
+            auth_header (dict): fixture to get token
+            new_user (User): fixture for a user
+
+        """
+        new_user.save()
+        suggestions_cache.clear()
+        response = client.get(
+            f'{api_v1_base_url}/search/suggest?type=users'
+            f'&q={new_user.name[:3]}&limit=5',
+            headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        assert response.status_code == 200
+        assert response_data['message'] == SUCCESS_MESSAGES[
+            'successfully_fetched'].format('suggestions')
+        assert len(response_data['data']) <= 5
+        for suggestion in response_data['data']:
+            assert set(suggestion) == {'id', 'label'}
+
+    def test_suggest_endpoint_ranks_prefix_matches_first_succeeds(
+            self, init_db, client, auth_header, new_user, new_role,
+            test_center_without_users):
+        """Tests that the prefix matches are suggested before the similar
+        records and that the records not matching are not suggested
+
+        Args:
+            client (FlaskClient): fixture to get flask test client
+            init_db (SQLAlchemy): fixture to initialize the test database
+            auth_header (dict): fixture to get token
+            new_user (User): fixture for a user
+            new_role (Role): fixture for a role
+            test_center_without_users (Center): fixture for a center
+
+        """
+        new_user.save()
+        for index, name in enumerate([
+                'Zephyrine Okafor', 'Quentin Bello', 'Ade Zephyr',
+                'Zephyr Obi'
+        ]):
+            User(
+                name=name,
+                email=f'suggest{index}@andela.com',
+                role_id=new_role.id,
+                center_id=test_center_without_users.id,
+                token_id=f'-suggest-token-{index}').save()
+        suggestions_cache.clear()
+        response = client.get(
+            f'{api_v1_base_url}/search/suggest?type=users&q=Zephyr&limit=5',
+            headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        assert response.status_code == 200
+        assert [suggestion['label'] for suggestion in response_data['data']
+                ] == ['Zephyr Obi', 'Zephyrine Okafor', 'Ade Zephyr']
+
+    def test_suggest_endpoint_with_invalid_type_fails(
+            self, init_db, client, auth_header):
+        """Tests that suggesting an unknown type fails
+
+        Args:
+            client (FlaskClient): fixture to get flask test client
+            init_db (SQLAlchemy): fixture to initialize the test database
+            auth_header (dict): fixture to get token
+
+        """
+        response = client.get(
+            f'{api_v1_base_url}/search/suggest?type=cars&q=tes',
+            headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        assert response.status_code == 400
+        assert response_data['message'] == serialization_errors[
+            'invalid_request_param'].format('type', 'assets, users, spaces')
+
+    def test_suggest_endpoint_without_text_fails(
+            self, init_db, client, auth_header):
+        """Tests that the typed text is required
+
+        Args:
+            client (FlaskClient): fixture to get flask test client
+            init_db (SQLAlchemy): fixture to initialize the test database
+            auth_header (dict): fixture to get token
+
+        """
+        response = client.get(
+            f'{api_v1_base_url}/search/suggest?type=assets',
+            headers=auth_header)
+        response_data = json.loads(response.data.decode(CHARSET))
+        assert response.status_code == 400
+        assert response_data['message'] == serialization_errors[
+            'required_param_key'].format('q')
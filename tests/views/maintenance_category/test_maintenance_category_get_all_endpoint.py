@@ -1,7 +1,12 @@
 """Module with tests for delete maintenance category endpoint"""
 # System Imports
+from datetime import datetime
+
 from flask import json
 
+# Models
+from api.models import MaintenanceCategory
+
 # Messages
 from api.utilities.constants import CHARSET, MIMETYPE
 from api.utilities.messages.error_messages import jwt_errors
@@ -175,3 +180,57 @@ class TestGetAllMaintenanceCategoryEndpoint:
         assert response_json['status'] == 'error'
         assert response_json[
             'message'] == 'Invalid URL query: `includ` column does not exist on MaintenanceCategory table in the database'
+
+    def test_cursor_pagination_on_nullable_sort_column_walks_all_records(
+            self, client, auth_header, new_maintenance_category,
+            test_center_without_users):
+        """Should return every record once when walking the pages of a sort
+        column holding NULLs in both directions
+
+        Args:
+            client(FlaskClient): fixture to get flask test client
+            auth_header (dict): fixture to get a token
+            new_maintenance_category (obj): fixture for creating maintenance
+                categories
+            test_center_without_users (obj): fixture for a center
+        """
+        for index in range(5):
+            MaintenanceCategory(
+                title=f'Cursor {index}',
+                asset_category_id=new_maintenance_category.asset_category_id,
+                center_id=test_center_without_users.id,
+                updated_at=datetime(2019, 1, index + 1) if index % 2 else None
+            ).save()
+
+        response = client.get(
+            f'{API_V1_BASE_URL}/maintenance-categories?pagination=false',
+            headers=auth_header)
+        all_ids = [
+            each['id']
+            for each in json.loads(response.data.decode(CHARSET))['data']
+        ]
+
+        for order in ('asc', 'desc'):
+            url = f'{API_V1_BASE_URL}/maintenance-categories' \
+                f'?sort=updatedAt&order={order}&limit=2&cursor='
+            pages = []
+            while url:
+                response_json = json.loads(
+                    client.get(url, headers=auth_header).data.decode(CHARSET))
+                pages.append([each['id'] for each in response_json['data']])
+                url = response_json['meta']['nextPage']
+            forward_ids = [record_id for page in pages for record_id in page]
+
+            backward_pages = [pages[-1]]
+            url = response_json['meta']['previousPage']
+            while url:
+                response_json = json.loads(
+                    client.get(url, headers=auth_header).data.decode(CHARSET))
+                backward_pages.insert(
+                    0, [each['id'] for each in response_json['data']])
+                url = response_json['meta']['previousPage']
+
+            assert len(pages) > 1
+            assert len(forward_ids) == len(set(forward_ids))
+            assert sorted(forward_ids) == sorted(all_ids)
+            assert backward_pages == pages
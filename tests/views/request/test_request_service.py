@@ -1,3 +1,6 @@
+# Standard Library
+from datetime import datetime
+
 # Services
 from api.services.request import close_expired_request
 
@@ -5,6 +8,9 @@ from api.services.request import close_expired_request
 from api.models.request import RequestStatusEnum, Request
 from api.models.database import db
 
+# Fixtures
+from tests.fixtures.requests import create_expired_request
+
 
 class TestCloseExpiredRequest:
     def test_closes_an_expired_request_succeeds(self, init_db,
@@ -38,3 +44,28 @@ class TestCloseExpiredRequest:
         for request in new_expired_requests:
             assert request.status == RequestStatusEnum.closed
             assert request.closed_at
+
+    def test_close_expired_request_leaves_unexpired_requests_open(
+            self, init_db, new_user, new_center, new_request_type):
+        """Should only close the requests whose closure time has passed and
+        return how many were closed
+
+        Args:
+            init_db (fixture): Fixture to initialize the test database operations.
+            new_user (User): Instance of a user
+            new_center (Center): Instance of a center
+            new_request_type (RequestType): Instance of a Request Type
+
+        """
+        expired_request = create_expired_request(new_user, new_center,
+                                                 new_request_type)
+        recent_request = create_expired_request(new_user, new_center,
+                                                new_request_type)
+        recent_request.completed_at = datetime.now()
+        db.session.add_all([expired_request, recent_request])
+        db.session.commit()
+
+        assert close_expired_request() == 1
+        assert expired_request.status == RequestStatusEnum.closed
+        assert recent_request.status == RequestStatusEnum.completed
+        assert not recent_request.closed_by_system
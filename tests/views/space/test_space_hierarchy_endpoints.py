@@ -0,0 +1,108 @@
+"""
+Module of tests for the space hierarchy endpoints
+"""
+from flask import json
+
+# Models
+from api.models import Asset
+
+# messages
+from api.utilities.messages.success_messages import SUCCESS_MESSAGES
+from api.utilities.constants import CHARSET
+
+# app config
+from config import AppConfig
+
+URL = f"{AppConfig.API_BASE_URL_V1}/spaces"
+
+
+class TestSpaceHierarchyEndpoints:
+    """
+    Tests for the descendants, ancestors and assets count of a space
+    """
+
+    def test_space_paths_follow_the_hierarchy(self, init_db, new_spaces):
+        """Should maintain the path of each space from its parent"""
+
+        epic_tower, fourth_floor, left_wing, wall_street = \
+            new_spaces['spaces'][:4]
+
+        assert epic_tower.path == f'/{epic_tower.id}/'
+        assert wall_street.path == f'/{epic_tower.id}/{fourth_floor.id}/' \
+            f'{left_wing.id}/{wall_street.id}/'
+
+    def test_get_descendants_returns_the_subtree(self, client, auth_header,
+                                                  new_spaces):
+        """Should return the spaces under a space from the top down"""
+
+        epic_tower, fourth_floor, left_wing, wall_street = \
+            new_spaces['spaces'][:4]
+
+        response = client.get(
+            f'{URL}/{epic_tower.id}/descendants', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert response_json['message'] == SUCCESS_MESSAGES['fetched'].format(
+            'Spaces')
+        assert [space['id'] for space in response_json['data']] == [
+            fourth_floor.id, left_wing.id, wall_street.id
+        ]
+        assert [space['childrenCount']
+                for space in response_json['data']] == [1, 1, 0]
+
+    def test_get_ancestors_returns_the_spaces_above(self, client, auth_header,
+                                                    new_spaces):
+        """Should return the spaces a space is under from the root down"""
+
+        epic_tower, fourth_floor, left_wing, wall_street = \
+            new_spaces['spaces'][:4]
+
+        response = client.get(
+            f'{URL}/{wall_street.id}/ancestors', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert [space['id'] for space in response_json['data']] == [
+            epic_tower.id, fourth_floor.id, left_wing.id
+        ]
+
+    def test_get_assets_count_counts_each_child_subtree(
+            self, client, auth_header, new_spaces, new_test_asset_category):
+        """Should count the assets of the subtree of a space"""
+
+        epic_tower, fourth_floor, left_wing, wall_street = \
+            new_spaces['spaces'][:4]
+        new_test_asset_category.save()
+        for index, space in enumerate(
+            [epic_tower, left_wing, wall_street, wall_street]):
+            Asset(
+                tag=f'HIERARCHY/{index}',
+                asset_category_id=new_test_asset_category.id,
+                assignee_id=space.id,
+                assignee_type='space').save()
+
+        response = client.get(
+            f'{URL}/{epic_tower.id}/assets-count', headers=auth_header)
+        response_json = json.loads(response.data.decode(CHARSET))
+
+        assert response.status_code == 200
+        assert response_json['data']['assetsCount'] == 4
+        assert response_json['data']['ownAssetsCount'] == 1
+        assert response_json['data']['children'] == [{
+            'id': fourth_floor.id,
+            'assetsCount': 3
+        }]
+
+    def test_moving_a_space_moves_its_descendants(self, new_spaces):
+        """Should rebuild the paths of a moved subtree"""
+
+        epic_tower, fourth_floor, left_wing, wall_street = \
+            new_spaces['spaces'][:4]
+
+        left_wing.parent_id = epic_tower.id
+        left_wing.save()
+
+        assert left_wing.path == f'/{epic_tower.id}/{left_wing.id}/'
+        assert wall_street.path == f'{left_wing.path}{wall_street.id}/'
+        assert fourth_floor.descendants().all() == []
@@ -1,7 +1,10 @@
 """Test module to test the due date generator class"""
+from datetime import datetime
 
 from api.models import Schedule
-from api.utilities.validators.schedule_creator import create_schedules, regenerate_schedules
+from api.models.database import db
+from api.utilities.validators.schedule_creator import create_schedules, regenerate_schedules, \
+    extend_schedules
 from tests.mocks.schedules_mock import WEEKLY_MOCKS, DAILY_MOCKS, NO_REPEAT, \
     WEEKDAY_MOCKS, CUSTOM_DAILY_MOCKS, \
     CUSTOM_WEEKLY_MOCKS, CUSTOM_MONTHLY_MOCKS, CUSTOM_YEARLY_MOCKS, CUSTOM_WEEKLY_NEVER, WEEKLY_NO_END_DATE
@@ -535,3 +538,66 @@ class TestDueDateGenerator:
             work_order_id=new_work_order_for_schedules.id)
         total_no_repeat_schedule = [date.due_date for date in schedules]
         assert total_no_repeat_schedule == NO_REPEAT
+
+    def test_generate_dates_stops_at_the_horizon_succeeds(
+            self, new_work_order_for_schedules):
+        """ Test that no schedules are created after the until date
+                Args:
+                    new_work_order_for_schedules(object) unsaved work order object
+        """
+        new_work_order_for_schedules.start_date = '2019-02-20 00:00:00'
+        new_work_order_for_schedules.end_date = None
+        new_work_order_for_schedules.frequency = 'daily'
+        create_schedules(
+            saved_work_order=new_work_order_for_schedules.save(),
+            until=datetime(2019, 2, 26))
+        schedules = Schedule.query.filter_by(
+            work_order_id=new_work_order_for_schedules.id)
+        total_daily_schedule = [date.due_date for date in schedules]
+        assert total_daily_schedule == DAILY_MOCKS[:7]
+
+    def test_regenerate_dates_keeps_unchanged_schedules_succeeds(
+            self, new_work_order_for_schedules):
+        """ Test that only the schedules of the changed due dates are
+        removed on an update
+                Args:
+                    new_work_order_for_schedules(object) unsaved work order object
+        """
+        new_work_order_for_schedules.start_date = '2019-02-20 00:00:00'
+        new_work_order_for_schedules.end_date = '2019-03-20 00:00:00'
+        new_work_order_for_schedules.frequency = 'daily'
+        create_schedules(saved_work_order=new_work_order_for_schedules.save())
+        db.session.commit()
+        schedules = Schedule.query.filter_by(
+            work_order_id=new_work_order_for_schedules.id)
+        ids = {schedule.due_date: schedule.id for schedule in schedules}
+
+        new_work_order_for_schedules.end_date = datetime(2019, 3, 10)
+        new_work_order_for_schedules.save()
+        schedules = Schedule.query.filter_by(
+            work_order_id=new_work_order_for_schedules.id).order_by(
+                Schedule.due_date)
+        assert [schedule.due_date
+                for schedule in schedules] == DAILY_MOCKS[:19]
+        assert all(ids[schedule.due_date] == schedule.id
+                   for schedule in schedules)
+
+    def test_extend_schedules_succeeds(self, new_work_order_for_schedules):
+        """ Test that the schedules are created up to the new horizon
+                Args:
+                    new_work_order_for_schedules(object) unsaved work order object
+        """
+        new_work_order_for_schedules.start_date = '2019-02-20 00:00:00'
+        new_work_order_for_schedules.end_date = None
+        new_work_order_for_schedules.frequency = 'daily'
+        create_schedules(
+            saved_work_order=new_work_order_for_schedules.save(),
+            until=datetime(2019, 2, 26))
+        db.session.commit()
+
+        assert extend_schedules(until=datetime(2019, 3, 5)) >= 7
+        schedules = Schedule.query.filter_by(
+            work_order_id=new_work_order_for_schedules.id).order_by(
+                Schedule.due_date)
+        assert [schedule.due_date
+                for schedule in schedules] == DAILY_MOCKS[:14]